@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Scaling benchmark for README generation.
+
+Renders every CSV-sourced section of templates/readme-structure.yaml for
+synthetic resource tables of growing size, using the (category,
+sub-category) index of generate_readme.py, and reports wall time and
+microseconds per row. Near-constant us/row means generation scales
+linearly. --baseline also times the old per-section filtering, which
+rescans every row for each section and subsection, and checks that both
+produce the same text.
+
+Usage:
+    python benchmarks/bench_readme.py
+    python benchmarks/bench_readme.py --sizes 1000,100000 --baseline
+    make bench
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from scripts import generate_readme  # noqa: E402
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+STRUCTURE_PATH = os.path.join(REPO_ROOT, "templates", "readme-structure.yaml")
+
+
+def synthetic_rows(count, sections):
+    """Rows spread round-robin over every category and sub-category of the structure."""
+    slots = []
+    for section in sections:
+        slots.append((section["category"], ""))
+        slots.extend((section["category"], sub["sub_category"]) for sub in section.get("subsections", []))
+    rows = []
+    for i in range(count):
+        category, sub_category = slots[i % len(slots)]
+        rows.append(
+            {
+                "ID": f"bench-{i:08x}",
+                "Display Name": f"Benchmark Resource {i}",
+                "Category": category,
+                "Sub-Category": sub_category,
+                "Primary Link": f"https://github.com/bench-owner-{i % 997}/repo-{i}",
+                "Author Name": f"author-{i % 500}",
+                "Author Link": f"https://github.com/author-{i % 500}",
+                "License": "MIT" if i % 3 else "NOT_FOUND",
+                "Description": f"Synthetic resource number {i} used for README benchmarks.",
+            }
+        )
+    return rows
+
+
+def render_indexed(sections, rows):
+    index = generate_readme.build_resource_index(rows)
+    return "\n<br>\n\n".join(generate_readme.generate_section_content(section, rows, index) for section in sections)
+
+
+def render_baseline(sections, rows):
+    """The pre-index approach: filter the whole table again for every section and subsection."""
+    rendered = []
+    for section in sections:
+        category = section["category"]
+        lines = [f"## {section['title']} {section['icon']}" if section.get("icon") else f"## {section['title']}"]
+        if section.get("description", "").strip():
+            lines += ["", section["description"].strip()]
+        main = [r for r in rows if r["Category"] == category and not r.get("Sub-Category", "").strip()]
+        if main:
+            lines.append("")
+            for row in main:
+                lines += [generate_readme.format_resource_entry(row), ""]
+        for sub in section.get("subsections", []):
+            matching = [
+                r
+                for r in rows
+                if r["Category"] == category and r.get("Sub-Category", "").strip() == sub["sub_category"]
+            ]
+            if matching:
+                lines += ["", f"### {sub['title']}", ""]
+                for row in matching:
+                    lines += [generate_readme.format_resource_entry(row), ""]
+        rendered.append("\n".join(lines).rstrip() + "\n")
+    return "\n<br>\n\n".join(rendered)
+
+
+def timed(render, sections, rows):
+    start = time.perf_counter()
+    output = render(sections, rows)
+    return time.perf_counter() - start, output
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark README generation against table size")
+    parser.add_argument(
+        "--sizes",
+        default=",".join(str(size) for size in DEFAULT_SIZES),
+        help="Comma-separated table sizes (default: 1000,10000,100000)",
+    )
+    parser.add_argument("--baseline", action="store_true", help="Also time per-section filtering")
+    parser.add_argument("--json", help="Also write the results to this JSON file")
+    args = parser.parse_args()
+
+    sections = [
+        section
+        for section in generate_readme.load_structure(STRUCTURE_PATH).get("sections", [])
+        if section.get("source") == "csv"
+    ]
+    results = []
+    print(f"{'rows':>8} {'seconds':>9} {'us/row':>8}" + (f" {'baseline s':>11} {'us/row':>8}" if args.baseline else ""))
+    for size in (int(size) for size in args.sizes.split(",") if size):
+        rows = synthetic_rows(size, sections)
+        seconds, output = timed(render_indexed, sections, rows)
+        result = {"rows": size, "seconds": round(seconds, 4), "us_per_row": round(seconds / size * 1e6, 2)}
+        line = f"{size:>8} {seconds:>9.3f} {result['us_per_row']:>8.2f}"
+        if args.baseline:
+            baseline, expected = timed(render_baseline, sections, rows)
+            if output != expected:
+                sys.exit(f"Indexed output differs from the baseline at {size} rows")
+            result["baseline_seconds"] = round(baseline, 4)
+            result["baseline_us_per_row"] = round(baseline / size * 1e6, 2)
+            line += f" {baseline:>11.3f} {result['baseline_us_per_row']:>8.2f}"
+        results.append(result)
+        print(line, flush=True)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Memory and lookup benchmark for resource_table.ResourceTable.
+
+Writes a synthetic resource table (the rows of bench_validators.py) and loads
+it as the list of csv.DictReader dicts the scripts used to build, as a bare
+ResourceTable, and as a ResourceTable with its ID, URL, repository and
+category indexes built. Reports the memory each retains and its peak while
+loading (tracemalloc), the load time (measured in a separate, untraced run)
+and the cost of an ID lookup: a linear scan of the dicts against a hash index.
+
+Usage:
+    python benchmarks/bench_resource_table.py
+    python benchmarks/bench_resource_table.py --rows 100000 --lookups 1000 --json table.json
+"""
+
+import argparse
+import csv
+import gc
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from benchmarks.bench_validators import synthetic_rows, write_table  # noqa: E402
+from scripts.resource_table import ResourceTable  # noqa: E402
+
+
+def load_dicts(path):
+    with open(path, encoding="utf-8") as f:
+        return list(csv.DictReader(f))
+
+
+def load_table(path):
+    return ResourceTable.from_csv(path)
+
+
+def load_indexed_table(path):
+    table = ResourceTable.from_csv(path)
+    table.build_indexes(("id", "url", "repo", "category"))
+    return table
+
+
+def measure(name, load, path, rows, lookup, ids):
+    """Time an untraced load, then trace a second load for memory; returns the result row."""
+    gc.collect()
+    start = time.perf_counter()
+    load(path)
+    seconds = time.perf_counter() - start
+    gc.collect()
+    tracemalloc.start()
+    loaded = load(path)
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    start = time.perf_counter()
+    for resource_id in ids:
+        lookup(loaded, resource_id)
+    lookup_seconds = time.perf_counter() - start
+    return {
+        "representation": name,
+        "rows": rows,
+        "retained_mib": round(retained / 2**20, 1),
+        "peak_mib": round(peak / 2**20, 1),
+        "load_seconds": round(seconds, 3),
+        "us_per_lookup": round(lookup_seconds / len(ids) * 1e6, 2),
+    }
+
+
+def scan(rows, resource_id):
+    return next(row for row in rows if row["ID"] == resource_id)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare ResourceTable with a list of DictReader rows")
+    parser.add_argument("--rows", type=int, default=100_000, help="Rows in the synthetic table (default: 100000)")
+    parser.add_argument("--lookups", type=int, default=1_000, help="IDs looked up in each representation")
+    parser.add_argument("--json", help="Also write the results to this JSON file")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="bench-table-") as workdir:
+        path = os.path.join(workdir, "THE_RESOURCES_TABLE.csv")
+        write_table(path, synthetic_rows(args.rows))
+
+        step = max(1, args.rows // args.lookups)
+        ids = [f"bench-{i:08x}" for i in range(0, args.rows, step)][: args.lookups]
+        results = [
+            measure("list of dicts", load_dicts, path, args.rows, scan, ids),
+            measure("ResourceTable", load_table, path, args.rows, ResourceTable.find_id, ids),
+            measure("  + indexes", load_indexed_table, path, args.rows, ResourceTable.find_id, ids),
+        ]
+
+    print(f"{'representation':<16} {'rows':>8} {'MiB':>8} {'peak MiB':>9} {'load s':>8} {'us/lookup':>10}")
+    for r in results:
+        print(
+            f"{r['representation']:<16} {r['rows']:>8} {r['retained_mib']:>8.1f} {r['peak_mib']:>9.1f} "
+            f"{r['load_seconds']:>8.3f} {r['us_per_lookup']:>10.2f}"
+        )
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Throughput benchmarks for the validation and download scripts.
+
+Each benchmark runs against a synthetic resource table through a local
+http_fixtures.ReplayServer, so no request leaves the machine. The server
+synthesizes GitHub API answers and can add latency and inject 503/429
+responses. Reported per benchmark and table size: wall time, HTTP requests
+issued and requests per second.
+
+Usage:
+    python benchmarks/bench_validators.py
+    python benchmarks/bench_validators.py --sizes 100,10000 --latency 0.01 --json bench.json
+    make bench BENCH_SIZES=100,10000
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from scripts import download_resources, parse_issue_form, validate_links  # noqa: E402
+from scripts.blob_store import BlobStore  # noqa: E402
+from scripts.http_fixtures import FixtureSession, ReplayServer  # noqa: E402
+from scripts.rate_limiter import RateLimiter  # noqa: E402
+
+DEFAULT_SIZES = (100, 10_000, 100_000)
+BENCHMARKS = ("validate_links", "download_resources", "parse_issue_form", "parse_issue_form_batch")
+FIELDNAMES = [
+    "ID",
+    "Display Name",
+    "Category",
+    "Sub-Category",
+    "Primary Link",
+    "Secondary Link",
+    "Author Name",
+    "Author Link",
+    "Active",
+    "Date Added",
+    "Last Modified",
+    "Last Checked",
+    "License",
+    "Description",
+]
+CATEGORIES = ["Workflows & Knowledge Guides", "Tooling", "Hooks", "Slash-Commands", "CLAUDE.md Files"]
+
+
+def synthetic_rows(count):
+    """Half GitHub file links spread over a few thousand repositories, half plain web pages."""
+    rows = []
+    for i in range(count):
+        if i % 2 == 0:
+            link = f"https://github.com/bench-owner-{i % 997}/repo-{i % 4999}/blob/main/docs/file-{i}.md"
+        else:
+            link = f"https://resource-{i % 101}.example.com/page-{i}"
+        rows.append(
+            {
+                "ID": f"bench-{i:08x}",
+                "Display Name": f"Benchmark Resource {i}",
+                "Category": CATEGORIES[i % len(CATEGORIES)],
+                "Primary Link": link,
+                "Author Name": f"author-{i % 500}",
+                "Author Link": f"https://github.com/author-{i % 500}",
+                "Active": "TRUE",
+                "Date Added": "2025-01-01",
+                "License": "MIT",
+                "Description": f"Synthetic resource number {i} used for throughput benchmarks.",
+            }
+        )
+    return rows
+
+
+def write_table(path, rows):
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDNAMES)
+        writer.writeheader()
+        for row in rows:
+            writer.writerow({name: row.get(name, "") for name in FIELDNAMES})
+
+
+def issue_body(number):
+    return (
+        f"### Display Name\n\nBenchmark Submission {number}\n\n"
+        "### Category\n\nTooling\n\n"
+        f"### Primary Link\n\nhttps://github.com/bench-submitter/tool-{number}/blob/main/README.md\n\n"
+        f"### Author Name\n\nsubmitter-{number}\n\n"
+        f"### Author Link\n\nhttps://github.com/submitter-{number}\n\n"
+        "### License\n\nMIT\n\n"
+        "### Description\n\nA synthetic submission used to benchmark issue form validation.\n"
+    )
+
+
+def run_validate_links(table, workdir, session, args):
+    os.chdir(workdir)
+    validate_links.validate_links(
+        os.path.basename(table), concurrency=args.concurrency, session=session, use_graphql=False
+    )
+
+
+def run_download_resources(table, workdir, session, args):
+    download_resources.CSV_FILE = table
+    download_resources.process_resources(
+        output_dir=os.path.join(workdir, "downloads"),
+        hosted_dir=os.path.join(workdir, "hosted"),
+        session=session,
+        workers=args.workers,
+        store=BlobStore(os.path.join(workdir, "blobs")),
+        manifest_path=os.path.join(workdir, "download-manifest.json"),
+    )
+
+
+def run_parse_issue_form(table, workdir, session, args):
+    for number in range(args.issues):
+        parse_issue_form.validate_issue(issue_body(number), csv_path=table, session=session)
+
+
+def run_parse_issue_form_batch(table, workdir, session, args):
+    issues = ((number, issue_body(number), None) for number in range(args.issues))
+    for _result in parse_issue_form.validate_issues(
+        issues, csv_path=table, session=session, concurrency=args.concurrency
+    ):
+        pass
+
+
+RUNNERS = {
+    "validate_links": run_validate_links,
+    "download_resources": run_download_resources,
+    "parse_issue_form": run_parse_issue_form,
+    "parse_issue_form_batch": run_parse_issue_form_batch,
+}
+
+
+def run_benchmark(name, size, server, args):
+    """Run one benchmark on a fresh table and session; returns its measurements."""
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix=f"bench-{name}-") as workdir:
+        table = os.path.join(workdir, "THE_RESOURCES_TABLE.csv")
+        write_table(table, synthetic_rows(size))
+        session = FixtureSession(
+            replay_url=server.url, pool_maxsize=max(args.concurrency, args.workers, 1), rate_limiter=RateLimiter()
+        )
+        before = dict(server.stats)
+        start = time.perf_counter()
+        try:
+            with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+                RUNNERS[name](table, workdir, session, args)
+        finally:
+            elapsed = time.perf_counter() - start
+            os.chdir(cwd)
+            session.close()
+
+    requests_issued = session.stats.requests
+    return {
+        "benchmark": name,
+        "rows": size,
+        "seconds": round(elapsed, 3),
+        "requests": requests_issued,
+        "requests_per_second": round(requests_issued / elapsed, 1) if elapsed else 0.0,
+        "injected_errors": server.stats["errors"] - before["errors"],
+        "injected_rate_limits": server.stats["rate_limited"] - before["rate_limited"],
+    }
+
+
+def format_results(results):
+    lines = [f"{'benchmark':<22} {'rows':>8} {'seconds':>9} {'requests':>9} {'req/s':>9} {'5xx':>5} {'429':>5}"]
+    for r in results:
+        lines.append(
+            f"{r['benchmark']:<22} {r['rows']:>8} {r['seconds']:>9.2f} {r['requests']:>9} "
+            f"{r['requests_per_second']:>9.1f} {r['injected_errors']:>5} {r['injected_rate_limits']:>5}"
+        )
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark validate_links, download_resources and parse_issue_form")
+    parser.add_argument(
+        "--sizes",
+        default=",".join(str(size) for size in DEFAULT_SIZES),
+        help="Comma-separated table sizes (default: 100,10000,100000)",
+    )
+    parser.add_argument("--benchmarks", default=",".join(BENCHMARKS), help="Comma-separated benchmarks to run")
+    parser.add_argument("--concurrency", type=int, default=validate_links.DEFAULT_CONCURRENCY)
+    parser.add_argument("--workers", type=int, default=download_resources.DEFAULT_WORKERS)
+    parser.add_argument(
+        "--issues", type=int, default=50, help="Issue bodies validated per parse_issue_form(_batch) run"
+    )
+    parser.add_argument("--latency", type=float, default=0.002, help="Seconds the replay server adds per response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Random extra latency per response, in seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of responses replaced by 503")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="Fraction of responses replaced by 429")
+    parser.add_argument("--retry-after", type=int, default=0, help="Retry-After seconds sent with each 429")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="Also write the results to this JSON file")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",") if size]
+    names = [name for name in args.benchmarks.split(",") if name]
+    unknown = set(names) - set(BENCHMARKS)
+    if unknown:
+        parser.error(f"Unknown benchmarks: {', '.join(sorted(unknown))}")
+
+    results = []
+    print(format_results([]), flush=True)
+    with ReplayServer(
+        synthesize=True,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        retry_after=args.retry_after,
+        seed=args.seed,
+    ) as server:
+        for name in names:
+            for size in sizes:
+                result = run_benchmark(name, size, server, args)
+                results.append(result)
+                print(format_results([result]).splitlines()[1], flush=True)
+
+    print()
+    print(format_results(results))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,6 @@
 // 资源数据结构
+// 内置数据仅作为后备：若能加载 data/site-data.json（由 scripts/generate_site_data.py 生成），
+// 则改用该数据包，按分类按需加载分片，并使用预建的三元组索引进行搜索
 const resourcesData = {
     workflow: [
         {
@@ -234,6 +236,22 @@ let currentSearchTerm = '';
 let currentCategoryFilter = 'all';
 let currentLicenseFilter = 'all';
 
+// 数据包（data/site-data.json）
+const SITE_DATA_URL = 'data/site-data.json';
+const SITE_DATA_VERSION = 1;
+// 数据包中的分类 ID 与页面现有分类键的对应关系
+const CATEGORY_ALIASES = {
+    workflows: 'workflow',
+    tooling: 'tools',
+    hooks: 'hooks',
+    'slash-commands': 'commands',
+    'claude-md-files': 'claude-md'
+};
+let siteData = null;
+let searchIndexPromise = null;
+const shardPromises = {};
+let renderGeneration = 0;
+
 // DOM 元素
 const searchInput = document.getElementById('search-input');
 const clearSearchBtn = document.getElementById('clear-search');
@@ -246,12 +264,16 @@ const backToTopBtn = document.getElementById('back-to-top');
 const languageSelector = document.getElementById('language-selector');
 
 // 初始化
-document.addEventListener('DOMContentLoaded', function() {
+document.addEventListener('DOMContentLoaded', async function() {
     initializeApp();
     setupEventListeners();
-    renderResources();
-    updateStats();
     setupScrollEffects();
+    if (await loadSiteData()) {
+        filterAndRenderResources();
+    } else {
+        renderResources();
+        updateStats();
+    }
 });
 
 // 应用初始化
@@ -284,10 +306,119 @@ function setupEventListeners() {
     document.addEventListener('keydown', handleKeyboardShortcuts);
 }
 
+// 加载数据包清单；失败时（例如直接打开本地文件）继续使用内置数据
+async function loadSiteData() {
+    let manifest;
+    try {
+        const response = await fetch(SITE_DATA_URL, { cache: 'no-cache' });
+        if (!response.ok) return false;
+        manifest = await response.json();
+    } catch (error) {
+        return false;
+    }
+    if (manifest.version !== SITE_DATA_VERSION) return false;
+
+    siteData = manifest;
+    siteData.categories.forEach(category => {
+        category.key = CATEGORY_ALIASES[category.id] || category.id;
+    });
+    Object.keys(resourcesData).forEach(key => delete resourcesData[key]);
+    totalResourcesElement.textContent = siteData.total;
+
+    // 为页面尚未列出的分类添加筛选选项
+    const knownKeys = new Set(Array.from(categoryFilter.options, option => option.value));
+    siteData.categories.forEach(category => {
+        if (!knownKeys.has(category.key)) {
+            categoryFilter.add(new Option(category.title, category.key));
+        }
+    });
+    return true;
+}
+
+// 按需加载一个分类的分片（文件名包含内容哈希，可长期缓存）
+function loadShard(category) {
+    if (!shardPromises[category.key]) {
+        shardPromises[category.key] = fetch(`data/${category.shard}`)
+            .then(response => response.json())
+            .then(shard => {
+                resourcesData[category.key] = shard.resources;
+                return shard.resources;
+            })
+            .catch(error => {
+                delete shardPromises[category.key];
+                throw error;
+            });
+    }
+    return shardPromises[category.key];
+}
+
+function loadSearchIndex() {
+    if (!searchIndexPromise) {
+        searchIndexPromise = fetch(`data/${siteData.search}`)
+            .then(response => response.json())
+            .catch(error => {
+                searchIndexPromise = null;
+                throw error;
+            });
+    }
+    return searchIndexPromise;
+}
+
+// 与 generate_site_data.trigrams() 相同：小写、合并空白后的三字符子串
+function getTrigrams(text, size) {
+    const normalized = text.toLowerCase().split(/\s+/).filter(Boolean).join(' ');
+    const grams = new Set();
+    for (let i = 0; i + size <= normalized.length; i++) {
+        grams.add(normalized.slice(i, i + size));
+    }
+    return grams;
+}
+
+// 求查询中所有三元组的倒排列表交集；查询过短时返回 null
+async function findSearchCandidates(term) {
+    const index = await loadSearchIndex();
+    const grams = getTrigrams(term, index.ngram);
+    if (grams.size === 0) return null;
+
+    let candidates = null;
+    for (const gram of grams) {
+        const documents = new Set();
+        let number = 0;
+        (index.trigrams[gram] || []).forEach(gap => {
+            number += gap;
+            if (!candidates || candidates.has(number)) documents.add(number);
+        });
+        candidates = documents;
+        if (candidates.size === 0) break;
+    }
+    return candidates;
+}
+
+// 只加载当前筛选条件可能命中的分类分片
+async function loadVisibleCategories() {
+    let categories = siteData.categories;
+    if (currentCategoryFilter !== 'all') {
+        categories = categories.filter(category => category.key === currentCategoryFilter);
+    }
+    if (currentSearchTerm) {
+        const candidates = await findSearchCandidates(currentSearchTerm);
+        if (candidates) {
+            const numbers = Array.from(candidates);
+            categories = categories.filter(category =>
+                numbers.some(number => number >= category.offset && number < category.offset + category.count)
+            );
+        }
+    }
+    await Promise.all(categories.map(loadShard));
+}
+
 // 获取所有资源
 function getAllResources() {
     const allResources = [];
-    Object.keys(resourcesData).forEach(category => {
+    const categoryKeys = siteData
+        ? siteData.categories.map(category => category.key).filter(key => resourcesData[key])
+        : Object.keys(resourcesData);
+    categoryKeys.forEach(category => {
         resourcesData[category].forEach(resource => {
             allResources.push({ ...resource, category });
         });
@@ -331,7 +462,18 @@ function handleLicenseFilter(event) {
 }
 
 // 筛选和渲染资源
-function filterAndRenderResources() {
+async function filterAndRenderResources() {
+    if (siteData) {
+        // 只渲染最近一次筛选的结果，忽略先发起却后完成的加载
+        const generation = ++renderGeneration;
+        try {
+            await loadVisibleCategories();
+        } catch (error) {
+            console.error('加载资源数据失败:', error);
+        }
+        if (generation !== renderGeneration) return;
+    }
+
     filteredResources = getAllResources().filter(resource => {
         // 分类筛选
         if (currentCategoryFilter !== 'all' && resource.category !== currentCategoryFilter) {
@@ -431,13 +573,16 @@ function createResourceSection(category, resources) {
         'claude-md': 'CLAUDE.md 文件是包含重要指导原则和上下文特定信息或说明的文件，帮助 Claude Code 更好地理解您的项目和编码标准'
     };
     
+    // 页面未定义的分类使用数据包中的标题和说明
+    const bundleCategory = siteData ? siteData.categories.find(item => item.key === category) : null;
+    
     section.innerHTML = `
         <div class="section-header">
-            <i class="${categoryIcons[category]}"></i>
-            <h2>${categoryNames[category]}</h2>
+            <i class="${categoryIcons[category] || 'fas fa-folder'}"></i>
+            <h2>${categoryNames[category] || (bundleCategory ? bundleCategory.title : category)}</h2>
         </div>
         <div class="section-description">
-            ${categoryDescriptions[category]}
+            ${categoryDescriptions[category] || (bundleCategory ? bundleCategory.description : '')}
         </div>
         <div class="resource-grid">
             ${resources.map(resource => createResourceCard(resource)).join('')}
@@ -463,13 +608,13 @@ function createResourceCard(resource) {
                 </div>
                 <div class="resource-meta">
                     <div class="resource-author">
-                        由 <a href="${resource.authorUrl}" target="_blank" rel="noopener noreferrer">${resource.author}</a> 开发
+                        由 <a href="${resource.authorUrl || resource.url}" target="_blank" rel="noopener noreferrer">${resource.author || '未知作者'}</a> 开发
                     </div>
                     <div class="resource-license ${licenseClass}">${licenseDisplay}</div>
                 </div>
             </div>
             <div class="resource-description">
-                ${highlightSearchTerm(resource.description)}
+                ${highlightSearchTerm(resource.description || '')}
             </div>
             ${resource.tags && resource.tags.length > 0 ? `
                 <div class="resource-tags">
@@ -732,6 +877,7 @@ function throttle(func, limit) {
 // 导出给其他脚本使用
 window.AwesomeClaudeCode = {
     resourcesData,
+    loadSiteData,
     filteredResources,
     renderResources,
     updateStats
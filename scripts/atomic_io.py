@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Crash-safe file writes.
+
+atomic_write() writes to a temporary file next to the target and moves it into
+place with os.replace(), so readers (and a crashed run) only ever see the old
+file or the complete new one, never a truncated table.
+"""
+
+import os
+import tempfile
+from contextlib import contextmanager
+
+# mkstemp creates 0600 files; new files get the mode a plain open() would give them. The umask can only
+# be read by setting it, which is process-wide and would race with other threads, so it is read once here.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+NEW_FILE_MODE = 0o666 & ~_UMASK
+
+
+@contextmanager
+def atomic_write(path, mode="w", encoding="utf-8", newline=None):
+    """
+    Open a temporary file for writing that replaces `path` when the block exits
+    without an exception. The temporary file is removed if the block fails.
+    """
+    path = os.path.abspath(path)
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(prefix=f".{os.path.basename(path)}.", suffix=".tmp", dir=directory)
+    if "b" in mode:
+        encoding = None
+    try:
+        with os.fdopen(fd, mode, encoding=encoding, newline=newline) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        # Keep the permissions of the file being replaced
+        if os.path.exists(path):
+            os.chmod(temp_path, os.stat(path).st_mode & 0o7777)
+        else:
+            os.chmod(temp_path, NEW_FILE_MODE)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
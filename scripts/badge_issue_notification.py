@@ -5,7 +5,6 @@ Creates friendly notification issues when NEW repositories are featured in
 Awesome Claude Code
 """
 
-import csv
 import json
 import os
 import re
@@ -14,6 +13,20 @@ from datetime import datetime
 from typing import Any
 
 from github import Github, GithubException
+from requests.structures import CaseInsensitiveDict
+
+try:
+    from rate_limiter import (  # type: ignore[import-not-found]
+        RATE_LIMITED_STATUSES,
+        SECONDARY_LIMIT_PAUSE,
+        get_shared_rate_limiter,
+    )
+    from resource_store import open_resource_store  # type: ignore[import-not-found]
+    from resource_table import ResourceTable, load_resource_table  # type: ignore[import-not-found]
+except ImportError:
+    from .rate_limiter import RATE_LIMITED_STATUSES, SECONDARY_LIMIT_PAUSE, get_shared_rate_limiter
+    from .resource_store import open_resource_store
+    from .resource_table import ResourceTable, load_resource_table
 
 # Try to load .env file if it exists
 try:
@@ -28,12 +41,17 @@ except ImportError:
 # Configuration
 ISSUE_TITLE = "🎉 Your project has been featured in Awesome Claude Code!"
 NOTIFICATION_LABEL = "awesome-claude-code"
+# Existing issues are listed page by page, each page paced by the rate limiter
+ISSUES_PER_PAGE = 100
+MAX_ISSUE_PAGES = 10
 
 
 class BadgeNotification:
     def __init__(self, github_token: str):
-        self.github = Github(github_token)
+        self.github = Github(github_token, per_page=ISSUES_PER_PAGE)
+        self.rate_limiter = get_shared_rate_limiter()
         self.processed_repos = self._load_processed_repos()
+        self._login: str | None = None
 
     def _load_processed_repos(self) -> set:
         """Load list of already processed repositories"""
@@ -52,35 +70,32 @@ class BadgeNotification:
         """Get all active GitHub repositories from the CSV"""
         github_repos = {}
 
-        with open(csv_path, encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for idx, row in enumerate(reader):
-                # Check if it's an active GitHub entry
-                if row.get("Active", "").upper() == "TRUE" and "github.com" in row.get("Primary Link", ""):
-                    # Parse repository information
-                    primary_link = row.get("Primary Link", "")
-                    owner, repo_name = self._parse_github_url(primary_link)
-                    if owner and repo_name:
-                        repo_full_name = f"{owner}/{repo_name}"
-                        github_repos[repo_full_name] = {
-                            "url": row.get("Primary Link", ""),
-                            "name": row.get("Display Name", ""),
-                            "description": row.get("Description", ""),
-                            # Store the row index for updating Date Added
-                            "row_index": idx,
-                        }
+        table = load_resource_table(csv_path)
+        for idx in range(len(table)):
+            # Check if it's an active GitHub entry
+            primary_link = table.get(idx, "Primary Link")
+            if table.get(idx, "Active").upper() == "TRUE" and "github.com" in primary_link:
+                # Parse repository information
+                owner, repo_name = self._parse_github_url(primary_link)
+                if owner and repo_name:
+                    repo_full_name = f"{owner}/{repo_name}"
+                    github_repos[repo_full_name] = {
+                        "url": primary_link,
+                        "name": table.get(idx, "Display Name"),
+                        "description": table.get(idx, "Description"),
+                        # Store the row index and ID for updating Date Added
+                        "row_index": idx,
+                        "id": table.get(idx, "ID"),
+                    }
 
         return github_repos
 
     def update_date_added_for_new_repos(self, csv_path: str, new_repos: dict):
         """Update the Date Added field for new repositories in the CSV"""
         # Read all rows from CSV
-        with open(csv_path, encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            headers = reader.fieldnames
-            rows = list(reader)
+        table = ResourceTable.from_csv(csv_path)
 
-        if headers is None:
+        if not table.fieldnames:
             raise ValueError("CSV file has no headers. Please check the file format.")
 
         # Get today's date
@@ -88,22 +103,29 @@ class BadgeNotification:
 
         # Track updates
         updates_made = 0
+        changes = {}
 
         # Update Date Added for new repos
         for repo_full_name, info in new_repos.items():
             row_idx = info.get("row_index")
-            if row_idx is not None and row_idx < len(rows) and not rows[row_idx].get("Date Added", "").strip():
-                rows[row_idx]["Date Added"] = today
+            if row_idx is not None and row_idx < len(table) and not table.get(row_idx, "Date Added").strip():
+                table.set(row_idx, "Date Added", today)
+                changes[table.get(row_idx, "ID")] = {"Date Added": today}
                 updates_made += 1
                 name = info.get("name", repo_full_name)
                 print(f"  - Added date {today} for: {name}")
 
-        # Write back to CSV if updates were made
+        # Write back to CSV if updates were made; with a resource store
+        # (AWESOME_CC_RESOURCE_DB) only the changed rows are written
         if updates_made > 0:
-            with open(csv_path, "w", newline="", encoding="utf-8") as f:
-                writer = csv.DictWriter(f, fieldnames=headers)
-                writer.writeheader()
-                writer.writerows(rows)
+            store = open_resource_store(csv_path)
+            if store is not None and "" not in changes:
+                with store:
+                    store.update_many(changes, export_path=csv_path)
+            else:
+                if store is not None:
+                    store.close()
+                table.write_csv(csv_path)
             print(f"  - Updated {updates_made} resources with Date Added = {today}")
 
         return updates_made
@@ -167,7 +189,11 @@ class BadgeNotification:
 
         try:
             # Get the repository
-            repo = self.github.get_repo(repo_full_name)
+            self._throttle()
+            try:
+                repo = self.github.get_repo(repo_full_name)
+            finally:
+                self._record_rate_limit()
 
             # Check if issue already exists
             if self._notification_exists(repo):
@@ -177,9 +203,12 @@ class BadgeNotification:
 
             # Create the issue
             issue_body = self._create_issue_body(resource_name, description)
-            issue = repo.create_issue(
-                title=ISSUE_TITLE, body=issue_body, labels=[NOTIFICATION_LABEL] if self._can_create_label(repo) else []
-            )
+            labels = [NOTIFICATION_LABEL] if self._can_create_label(repo) else []
+            self._throttle()
+            try:
+                issue = repo.create_issue(title=ISSUE_TITLE, body=issue_body, labels=labels)
+            finally:
+                self._record_rate_limit()
 
             self.processed_repos.add(repo_full_name)
             result["success"] = True
@@ -187,6 +216,7 @@ class BadgeNotification:
             result["issue_url"] = issue.html_url
 
         except GithubException as e:
+            self._record_rejection(e)
             if e.status == 410:
                 result["message"] = "Repository has issues disabled"
             elif e.status == 404:
@@ -217,23 +247,72 @@ class BadgeNotification:
 
         return None, None
 
+    def _throttle(self):
+        """Wait for the shared GitHub rate limiter before an API call"""
+        self.rate_limiter.acquire("core")
+
+    def _record_rate_limit(self):
+        """Feed the budget PyGithub saw on its last response back into the rate limiter"""
+        remaining, limit = self.github.rate_limiting
+        if limit > 0:
+            self.rate_limiter.update_budget("core", remaining, limit, self.github.rate_limiting_resettime)
+
+    def _record_rejection(self, error: GithubException):
+        """Pause later calls after a rate limit rejection until GitHub allows them again"""
+        headers = CaseInsensitiveDict(error.headers or {})
+        self.rate_limiter.update(headers, error.status)
+        if (
+            error.status in RATE_LIMITED_STATUSES
+            and "Retry-After" not in headers
+            and headers.get("X-RateLimit-Remaining") != "0"
+            and (error.status == 429 or "secondary rate limit" in str(error.data).lower())
+        ):
+            # A secondary limit without Retry-After: wait the minute GitHub asks for
+            self.rate_limiter.pause(headers.get("X-RateLimit-Resource") or "core", SECONDARY_LIMIT_PAUSE)
+
+    def _authenticated_login(self) -> str:
+        """Login of the token owner, fetched once per run"""
+        if self._login is None:
+            self._throttle()
+            try:
+                self._login = self.github.get_user().login
+            finally:
+                self._record_rate_limit()
+        return self._login
+
     def _notification_exists(self, repo) -> bool:
         """Check if notification issue already exists"""
         try:
-            issues = repo.get_issues(state="all", creator=self.github.get_user().login)
-            for issue in issues:
-                if "awesome claude code" in issue.title.lower():
+            issues = repo.get_issues(state="all", creator=self._authenticated_login())
+            # PyGithub fetches pages lazily, so each page is requested explicitly and paced on its own
+            for page in range(MAX_ISSUE_PAGES):
+                self._throttle()
+                try:
+                    batch = issues.get_page(page)
+                finally:
+                    self._record_rate_limit()
+                if any("awesome claude code" in issue.title.lower() for issue in batch):
                     return True
+                if len(batch) < ISSUES_PER_PAGE:
+                    break
         except Exception as e:
+            if isinstance(e, GithubException):
+                self._record_rejection(e)
             print(f"Warning: Could not check existing issues for {repo.full_name}: {e}")
         return False
 
     def _can_create_label(self, repo) -> bool:
         """Check if we can create labels (requires write access)"""
         try:
-            repo.create_label(NOTIFICATION_LABEL, "f39c12", "Featured in Awesome Claude Code")
+            self._throttle()
+            try:
+                repo.create_label(NOTIFICATION_LABEL, "f39c12", "Featured in Awesome Claude Code")
+            finally:
+                self._record_rate_limit()
             return True
         except Exception as _e:
+            if isinstance(_e, GithubException):
+                self._record_rejection(_e)
             print(f"Warning: Could not create label for {repo.full_name}: {_e}")
             return False
 
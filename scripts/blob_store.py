@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Content-addressed store for downloaded resource files.
+
+Every file is stored once under .myob/blobs/<sha[:2]>/<sha[2:]>, keyed by its
+git blob SHA-1 (the same id GitHub reports in tree listings). Files in the
+archive and hosted trees are hardlinks to the stored blob, so identical files
+shared by forks and templates take disk space once, re-downloading an
+unchanged file costs nothing, and hosting a resource copies no data. Where a
+hardlink is impossible (another filesystem, no link support) the file is
+copied instead.
+
+Linked files share their data with the store: they are always replaced with
+os.replace(), never edited in place. Which blobs are still needed is decided
+by the caller (the download manifest), not by link counts, since files that
+had to be copied hold no link to their blob.
+"""
+
+import hashlib
+import os
+import re
+import shutil
+import tempfile
+import threading
+
+try:
+    from atomic_io import NEW_FILE_MODE  # type: ignore[import-not-found]
+except ImportError:
+    from .atomic_io import NEW_FILE_MODE
+
+DEFAULT_BLOB_DIR = ".myob/blobs"
+CHUNK_SIZE = 64 * 1024
+BLOB_NAME = re.compile(r"[0-9a-f]{38}")
+
+
+def git_blob_sha(data):
+    """SHA-1 git assigns to a blob with this content."""
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+
+def file_blob_sha(path):
+    """Git blob SHA-1 of the file at `path`, read in chunks."""
+    with open(path, "rb") as f:
+        digest = hashlib.sha1(b"blob %d\0" % os.fstat(f.fileno()).st_size)
+        while chunk := f.read(CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class BlobStore:
+    """
+    Blob store rooted at `root`. Safe to share between download threads.
+
+    `stats` counts blobs stored, writes that found their blob already stored
+    (reused), files materialized as hardlinks (linked) and as copies (copied).
+    """
+
+    def __init__(self, root=DEFAULT_BLOB_DIR):
+        self.root = root
+        self.stats = {"stored": 0, "reused": 0, "linked": 0, "copied": 0, "pruned": 0}
+        self._lock = threading.Lock()
+
+    def path_for(self, sha):
+        return os.path.join(self.root, sha[:2], sha[2:])
+
+    def _count(self, counter):
+        with self._lock:
+            self.stats[counter] += 1
+
+    def _commit(self, temp_path, sha):
+        """Move a fully written temporary file into place as blob `sha`, unless it is already stored."""
+        path = self.path_for(sha)
+        if os.path.exists(path):
+            os.remove(temp_path)
+            self._count("reused")
+        else:
+            # mkstemp creates 0600 files; blobs get the permissions of a plain new file
+            os.chmod(temp_path, NEW_FILE_MODE)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            os.replace(temp_path, path)
+            self._count("stored")
+        return sha
+
+    def _temp_file(self):
+        os.makedirs(self.root, exist_ok=True)
+        return tempfile.mkstemp(prefix=".incoming.", dir=self.root)
+
+    def put(self, data):
+        """Store `data`; returns its blob SHA."""
+        sha = git_blob_sha(data)
+        if os.path.exists(self.path_for(sha)):
+            self._count("reused")
+            return sha
+        fd, temp_path = self._temp_file()
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+        return self._commit(temp_path, sha)
+
+    def put_stream(self, fileobj, size):
+        """Store `size` bytes read from `fileobj` without holding them in memory; returns the blob SHA."""
+        digest = hashlib.sha1(b"blob %d\0" % size)
+        fd, temp_path = self._temp_file()
+        try:
+            with os.fdopen(fd, "wb") as f:
+                while chunk := fileobj.read(CHUNK_SIZE):
+                    digest.update(chunk)
+                    f.write(chunk)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+        return self._commit(temp_path, digest.hexdigest())
+
+    def put_chunks(self, chunks):
+        """
+        Store content arriving as an iterable of byte chunks (a streamed response
+        body) while holding one chunk at a time; returns the blob SHA.
+        """
+        fd, temp_path = self._temp_file()
+        try:
+            with os.fdopen(fd, "wb") as f:
+                for chunk in chunks:
+                    f.write(chunk)
+            # The blob header carries the size, so the id is computed once the file is complete
+            sha = file_blob_sha(temp_path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+        return self._commit(temp_path, sha)
+
+    def link(self, sha, target):
+        """Make `target` the stored blob `sha`: a hardlink where possible, a copy otherwise."""
+        source = self.path_for(sha)
+        if os.path.exists(target) and os.path.samefile(source, target):
+            return
+        directory = os.path.dirname(os.path.abspath(target))
+        os.makedirs(directory, exist_ok=True)
+        temp_path = os.path.join(directory, f".{os.path.basename(target)}.{threading.get_ident()}.link")
+        try:
+            try:
+                os.link(source, temp_path)
+                counter = "linked"
+            except OSError:
+                # Cross-device (EXDEV) or a filesystem without hardlinks
+                shutil.copyfile(source, temp_path)
+                counter = "copied"
+            os.replace(temp_path, target)
+        except BaseException:
+            if os.path.lexists(temp_path):
+                os.remove(temp_path)
+            raise
+        self._count(counter)
+
+    def write(self, target, data):
+        """Store `data` and materialize it at `target`; returns the blob SHA."""
+        sha = self.put(data)
+        self.link(sha, target)
+        return sha
+
+    def write_stream(self, target, fileobj, size):
+        """Stream `size` bytes into the store and materialize them at `target`; returns the blob SHA."""
+        sha = self.put_stream(fileobj, size)
+        self.link(sha, target)
+        return sha
+
+    def write_chunks(self, target, chunks):
+        """Store streamed `chunks` and materialize them at `target`; returns the blob SHA."""
+        sha = self.put_chunks(chunks)
+        self.link(sha, target)
+        return sha
+
+    def mirror(self, source, target):
+        """
+        Reproduce the file or directory `source` at `target` by linking every file
+        to its blob. Files not yet in the store are adopted into it, as a hardlink
+        to `source` where possible, so no file data is copied.
+        """
+        if os.path.isdir(source):
+            for directory, _dirs, names in os.walk(source):
+                relative = os.path.relpath(directory, source)
+                for name in names:
+                    self.mirror(os.path.join(directory, name), os.path.normpath(os.path.join(target, relative, name)))
+            return
+        sha = file_blob_sha(source)
+        self._adopt(source, sha)
+        self.link(sha, target)
+
+    def _adopt(self, source, sha):
+        path = self.path_for(sha)
+        if os.path.exists(path):
+            return
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        try:
+            os.link(source, path)
+        except FileExistsError:
+            return
+        except OSError:
+            with open(source, "rb") as f:
+                self.put_stream(f, os.fstat(f.fileno()).st_size)
+            return
+        self._count("stored")
+
+    def prune(self, referenced):
+        """Delete the stored blobs whose SHA is not in `referenced`; returns how many were removed."""
+        removed = 0
+        if not os.path.isdir(self.root):
+            return removed
+        for prefix in os.listdir(self.root):
+            directory = os.path.join(self.root, prefix)
+            if len(prefix) != 2 or not os.path.isdir(directory):
+                continue
+            for name in os.listdir(directory):
+                if BLOB_NAME.fullmatch(name) and prefix + name not in referenced:
+                    os.remove(os.path.join(directory, name))
+                    removed += 1
+        with self._lock:
+            self.stats["pruned"] += removed
+        return removed
+
+
+_shared_store = None
+_shared_lock = threading.Lock()
+
+
+def get_blob_store():
+    """Return the process-wide store under DEFAULT_BLOB_DIR, creating it on first use."""
+    global _shared_store
+    with _shared_lock:
+        if _shared_store is None:
+            _shared_store = BlobStore()
+        return _shared_store
+
+
+def format_blob_stats(stats):
+    """One-line summary of BlobStore.stats."""
+    return (
+        f"{stats['stored']} blobs stored, {stats['reused']} deduplicated, "
+        f"{stats['linked']} files linked, {stats['copied']} copied, {stats['pruned']} pruned"
+    )
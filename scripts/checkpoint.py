@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Append-only JSONL journal of completed work items.
+
+Long runs record each item as soon as it finishes. If the run is killed, the
+next run can pass resume=True to pick up the recorded outcomes and only redo
+the rest. A run that finishes normally discards its journal.
+
+Each line is a JSON object with a "key" plus whatever fields the caller
+records. A line cut short by a crash is ignored on load and cut off before
+the resumed run appends to the journal.
+"""
+
+import json
+import os
+
+
+class CheckpointJournal:
+    """
+    Journal at `path`. Without `resume`, any existing journal is started over;
+    with it, earlier entries are loaded into `completed` ({key: entry}).
+    """
+
+    def __init__(self, path, resume=False):
+        self.path = path
+        self.completed = {}
+        if resume and os.path.exists(path):
+            self.completed = self._load(path)
+            self._drop_partial_line(path)
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        # Kept open for the whole run; closed by close() or discard()
+        self._file = open(path, "a" if resume else "w", encoding="utf-8")  # noqa: SIM115
+
+    @staticmethod
+    def _load(path):
+        completed = {}
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if isinstance(entry, dict) and "key" in entry:
+                    completed[entry["key"]] = entry
+        return completed
+
+    @staticmethod
+    def _drop_partial_line(path):
+        """Truncate the journal after its last newline so new entries start on a line of their own."""
+        with open(path, "r+b") as f:
+            end = f.seek(0, os.SEEK_END)
+            position = end
+            while position > 0:
+                start = max(0, position - 4096)
+                f.seek(start)
+                newline = f.read(position - start).rfind(b"\n")
+                if newline >= 0:
+                    position = start + newline + 1
+                    break
+                position = start
+            if position < end:
+                f.truncate(position)
+
+    def record(self, key, **fields):
+        """Append one completed item; flushed immediately so a crash keeps it."""
+        entry = {"key": key, **fields}
+        self._file.write(json.dumps(entry) + "\n")
+        self._file.flush()
+        self.completed[key] = entry
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+
+    def discard(self):
+        """Close and delete the journal once the run has finished."""
+        self.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Byte-offset index of the rows of THE_RESOURCES_TABLE.csv, for single-row edits.
+
+build_row_offsets() scans the file once and records where each row starts and
+ends, keyed by ID. The index is cached in .myob/cache/csv-row-offsets.json
+together with the file's size and mtime, so later runs against the same file
+version skip the scan. update_row() then reads just the one row, re-serializes
+it exactly as csv.DictWriter would, and builds the new file from the untouched
+bytes before and after it (copied by the kernel with os.copy_file_range where
+available) plus the new row, moved into place with an atomic rename. Nothing
+but that row is parsed or re-encoded, so a pre-push update costs the same
+whatever the size of the table.
+"""
+
+import csv
+import io
+import json
+import os
+
+try:
+    from atomic_io import atomic_write  # type: ignore[import-not-found]
+except ImportError:
+    from .atomic_io import atomic_write
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_INDEX_CACHE = os.path.join(REPO_ROOT, ".myob", "cache", "csv-row-offsets.json")
+INDEX_VERSION = 1
+ID_FIELD = "ID"
+COPY_CHUNK_SIZE = 1024 * 1024
+
+
+def iter_records(f):
+    """
+    Yield (start, end, raw bytes) for every CSV record of the binary file `f`.
+    A record ends at the first line break outside quotes, so quoted fields may
+    span lines.
+    """
+    start = 0
+    offset = 0
+    pending = []
+    quotes = 0
+    for line in f:
+        offset += len(line)
+        pending.append(line)
+        quotes += line.count(b'"')
+        # Quotes inside a quoted field are doubled, so an odd count means the record continues
+        if quotes % 2:
+            continue
+        yield start, offset, b"".join(pending)
+        start = offset
+        pending = []
+        quotes = 0
+    if pending:
+        yield start, offset, b"".join(pending)
+
+
+def parse_record(raw):
+    """The field values of one raw CSV record."""
+    return next(csv.reader(io.StringIO(raw.decode("utf-8"), newline="")), [])
+
+
+def format_record(values):
+    """One CSV record encoded as csv.DictWriter writes it."""
+    buffer = io.StringIO(newline="")
+    csv.writer(buffer).writerow(values)
+    return buffer.getvalue().encode("utf-8")
+
+
+def file_signature(csv_path):
+    stat = os.stat(csv_path)
+    return {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+
+
+def build_row_offsets(csv_path):
+    """
+    Scan `csv_path` once. Returns {"fieldnames", "mtime_ns", "size", "rows"},
+    where rows maps each ID to the [start, end) byte range of its first row.
+    """
+    index = {"version": INDEX_VERSION, **file_signature(csv_path), "fieldnames": [], "rows": {}}
+    with open(csv_path, "rb") as f:
+        records = iter_records(f)
+        header = next(records, None)
+        if header is None:
+            return index
+        index["fieldnames"] = parse_record(header[2])
+        if ID_FIELD not in index["fieldnames"]:
+            return index
+        id_column = index["fieldnames"].index(ID_FIELD)
+        for start, end, raw in records:
+            values = parse_record(raw)
+            if len(values) > id_column and values[id_column]:
+                index["rows"].setdefault(values[id_column], [start, end])
+    return index
+
+
+def read_index_cache(cache_path):
+    if not cache_path or not os.path.exists(cache_path):
+        return {}
+    try:
+        with open(cache_path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def load_row_offsets(csv_path, cache_path=DEFAULT_INDEX_CACHE):
+    """The row index of `csv_path`, from the cache when it was built for this size and mtime."""
+    index = read_index_cache(cache_path).get(os.path.abspath(csv_path))
+    signature = file_signature(csv_path)
+    if (
+        index
+        and index.get("version") == INDEX_VERSION
+        and index.get("mtime_ns") == signature["mtime_ns"]
+        and index.get("size") == signature["size"]
+    ):
+        return index
+    index = build_row_offsets(csv_path)
+    save_row_offsets(csv_path, index, cache_path)
+    return index
+
+
+def save_row_offsets(csv_path, index, cache_path=DEFAULT_INDEX_CACHE):
+    if not cache_path:
+        return
+    cache = read_index_cache(cache_path)
+    cache[os.path.abspath(csv_path)] = index
+    with atomic_write(cache_path) as f:
+        json.dump(cache, f)
+
+
+def read_row(csv_path, resource_id, cache_path=DEFAULT_INDEX_CACHE):
+    """The row with this ID as a dict, reading only its bytes; None if there is none."""
+    index = load_row_offsets(csv_path, cache_path)
+    span = index["rows"].get(resource_id)
+    if span is None:
+        return None
+    with open(csv_path, "rb") as f:
+        f.seek(span[0])
+        values = parse_record(f.read(span[1] - span[0]))
+    fieldnames = index["fieldnames"]
+    return dict(zip(fieldnames, values + [""] * (len(fieldnames) - len(values)), strict=False))
+
+
+def copy_range(source, target, start, end):
+    """Append bytes [start, end) of the binary file `source` to the binary file `target`."""
+    position = start
+    if hasattr(os, "copy_file_range"):
+        target.flush()
+        try:
+            while position < end:
+                copied = os.copy_file_range(source.fileno(), target.fileno(), end - position, offset_src=position)
+                if not copied:
+                    break
+                position += copied
+        except OSError:
+            # Filesystems without copy_file_range fall back to a user-space copy
+            pass
+        # copy_file_range advanced the target's file offset; keep the buffered writer in sync
+        target.seek(0, os.SEEK_END)
+    source.seek(position)
+    while position < end:
+        chunk = source.read(min(COPY_CHUNK_SIZE, end - position))
+        if not chunk:
+            break
+        target.write(chunk)
+        position += len(chunk)
+
+
+def update_row(csv_path, resource_id, values, cache_path=DEFAULT_INDEX_CACHE):
+    """
+    Update the row with ID `resource_id` from the dict `values` and write the file
+    back atomically, re-encoding only that row. Returns False when no row has
+    this ID; raises ValueError for fields that are not columns of the table.
+    """
+    index = load_row_offsets(csv_path, cache_path)
+    span = index["rows"].get(resource_id)
+    if span is None:
+        return False
+    fieldnames = index["fieldnames"]
+    unknown = set(values) - set(fieldnames)
+    if unknown:
+        raise ValueError(f"dict contains fields not in fieldnames: {', '.join(sorted(map(repr, unknown)))}")
+
+    start, end = span
+    with open(csv_path, "rb") as source:
+        source.seek(start)
+        old_values = parse_record(source.read(end - start))
+        if len(old_values) <= fieldnames.index(ID_FIELD) or old_values[fieldnames.index(ID_FIELD)] != resource_id:
+            # The cached offsets no longer describe the file; rebuild them and retry once
+            index = build_row_offsets(csv_path)
+            save_row_offsets(csv_path, index, cache_path)
+            span = index["rows"].get(resource_id)
+            if span is None:
+                return False
+            start, end = span
+            source.seek(start)
+            old_values = parse_record(source.read(end - start))
+        row = dict(zip(fieldnames, old_values + [""] * (len(fieldnames) - len(old_values)), strict=False))
+        row.update({field: "" if value is None else value for field, value in values.items()})
+        record = format_record([row[name] for name in fieldnames])
+
+        size = os.fstat(source.fileno()).st_size
+        with atomic_write(csv_path, mode="wb") as target:
+            copy_range(source, target, 0, start)
+            target.write(record)
+            copy_range(source, target, end, size)
+
+    # Shift the rows after the edited one instead of rescanning the file
+    delta = len(record) - (end - start)
+    rows = index["rows"]
+    if delta:
+        for span in rows.values():
+            if span[0] >= end:
+                span[0] += delta
+                span[1] += delta
+    new_id = row.get(ID_FIELD, "")
+    if new_id != resource_id:
+        del rows[resource_id]
+        if new_id:
+            rows.setdefault(new_id, [start, start + len(record)])
+    else:
+        rows[resource_id] = [start, start + len(record)]
+    index.update(file_signature(csv_path))
+    save_row_offsets(csv_path, index, cache_path)
+    return True
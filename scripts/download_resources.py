@@ -23,21 +23,57 @@ Options:
     --max-downloads N       Limit number of downloads (for testing)
     --output-dir DIR        Custom archive directory (default: .myob/downloads)
     --hosted-dir DIR        Custom hosted directory (default: resources)
+    --workers N             Concurrent downloads (default: 8)
+    --manifest FILE         Download manifest (default: .myob/download-manifest.json)
+    --full                  Ignore the manifest's ETags and fetch everything again
+    --repo-globs GLOBS      Paths archived from repository links
+                            (default: CLAUDE.md,.claude/**,hooks/**)
 """
 
 import argparse
-import csv
+import json
 import os
 import random
 import re
+import tarfile
 import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
+from urllib.parse import quote
 
-import requests
-import yaml  # type: ignore[import-untyped]
 from dotenv import load_dotenv
 
+try:
+    from atomic_io import atomic_write  # type: ignore[import-not-found]
+    from blob_store import format_blob_stats, get_blob_store  # type: ignore[import-not-found]
+    from github_cache import format_cache_stats  # type: ignore[import-not-found]
+    from http_client import (  # type: ignore[import-not-found]
+        DEFAULT_POOL_MAXSIZE,
+        configure_shared_session,
+        format_connection_stats,
+        get_shared_session,
+    )
+    from overrides import compile_overrides  # type: ignore[import-not-found]
+    from overrides import load_overrides as load_override_file  # type: ignore[import-not-found]
+    from rate_limiter import format_rate_limiter_stats, is_rate_limited, retry_delay  # type: ignore[import-not-found]
+    from resource_table import load_resource_table  # type: ignore[import-not-found]
+except ImportError:
+    from .atomic_io import atomic_write
+    from .blob_store import format_blob_stats, get_blob_store
+    from .github_cache import format_cache_stats
+    from .http_client import (
+        DEFAULT_POOL_MAXSIZE,
+        configure_shared_session,
+        format_connection_stats,
+        get_shared_session,
+    )
+    from .overrides import compile_overrides
+    from .overrides import load_overrides as load_override_file
+    from .rate_limiter import format_rate_limiter_stats, is_rate_limited, retry_delay
+    from .resource_table import load_resource_table
+
 # Load environment variables from .myob/.env
 load_dotenv()
 
@@ -46,6 +82,19 @@ USER_AGENT = "awesome-claude-code Downloader/1.0"
 CSV_FILE = "../THE_RESOURCES_TABLE.csv"
 DEFAULT_OUTPUT_DIR = ".myob/downloads"
 HOSTED_OUTPUT_DIR = "resources"
+DEFAULT_WORKERS = 8
+# Directory downloads: parallel raw file fetches, and the size above which the
+# repository tarball is cheaper than one request per file
+DIRECTORY_FETCH_WORKERS = 8
+# File bodies are streamed to disk in chunks of this size, never held in memory whole
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+ARCHIVE_THRESHOLD_FILES = 200
+SYMLINK_MODE = "120000"
+# Repository links: the only paths archived from the repository tarball
+DEFAULT_REPO_GLOBS = ("CLAUDE.md", ".claude/**", "hooks/**")
+# What the last run fetched, for incremental syncs
+DEFAULT_MANIFEST_FILE = ".myob/download-manifest.json"
+MANIFEST_VERSION = 1
 
 # Setup headers with optional GitHub token
 HEADERS = {"User-Agent": USER_AGENT, "Accept": "application/vnd.github.v3.raw", "X-GitHub-Api-Version": "2022-11-28"}
@@ -138,16 +187,88 @@ def parse_github_url(url):
     return None
 
 
-def download_github_file(url_info, output_path, retry_count=0, max_retries=3):
+def files_intact(entry, output_path):
+    """
+    True if the files recorded by the last sync of `output_path` are all still on
+    disk. A repository sync that matched no files is intact as long as it is recorded.
+    """
+    if not entry:
+        return False
+    files = entry.get("files")
+    return (
+        entry.get("path") == output_path
+        and (bool(files) or (files == {} and bool(entry.get("ref") or entry.get("etag"))))
+        and all(os.path.exists(os.path.normpath(os.path.join(output_path, relative))) for relative in files)
+    )
+
+
+def conditional_headers(headers, entry, output_path):
+    """
+    Copy of `headers` asking GitHub for a 304 when nothing changed since the last
+    sync (free against the rate limit), provided its files are still on disk.
+    """
+    headers = headers.copy()
+    if entry and entry.get("etag") and files_intact(entry, output_path):
+        headers["If-None-Match"] = entry["etag"]
+    return headers
+
+
+def record_sync(entry, output_path, files, response=None, ref=None):
+    """Describe the files now at `output_path` ({relative path: blob SHA}) in the manifest entry."""
+    if entry is None:
+        return
+    etag = response.headers.get("ETag") if response is not None else None
+    entry.update({"path": output_path, "ref": ref, "etag": etag, "files": files})
+
+
+def stream_to_store(session, store, url, target):
+    """
+    Stream the body of `url` into `store` in DOWNLOAD_CHUNK_SIZE chunks and link
+    it at `target`, so memory use does not grow with the file size.
+    Returns (blob SHA, status code); the SHA is None unless the status is 200.
+    """
+    with session.get(url, headers=HEADERS, timeout=30, stream=True) as response:
+        if response.status_code != 200:
+            return None, response.status_code
+        return store.write_chunks(target, response.iter_content(DOWNLOAD_CHUNK_SIZE)), 200
+
+
+def download_github_file(
+    url_info,
+    output_path,
+    retry_count=0,
+    max_retries=3,
+    session=None,
+    repo_globs=DEFAULT_REPO_GLOBS,
+    store=None,
+    entry=None,
+):
     """
     Download a file from GitHub using the API.
-    Returns True if successful, False otherwise.
+    All requests go through `session` (the shared pooled session by default).
+    Files are written through `store` (the shared blob store by default), so they
+    are hardlinks to deduplicated blobs.
+    Repository links archive only the files matching `repo_globs`.
+
+    `entry` is the resource's manifest entry from the previous sync, if any. It
+    makes the first request conditional, lets directory downloads skip blobs
+    that are already stored, and is updated in place to describe the files now
+    on disk.
+    Returns True if successful (or unchanged), False otherwise.
     """
+    session = session or get_shared_session()
+    store = store or get_blob_store()
     try:
         if url_info["type"] == "file":
             # Download single file
             api_url = f"https://api.github.com/repos/{url_info['owner']}/{url_info['repo']}/contents/{url_info['path']}?ref={url_info['branch']}"
-            response = requests.get(api_url, headers=HEADERS, timeout=30)
+            response = session.get(
+                api_url, headers=conditional_headers(HEADERS, entry, output_path), timeout=30, stream=True
+            )
+            if response.status_code == 304:
+                response.close()
+                print("    Unchanged since last sync")
+                return True
 
             # Log response details
             if response.status_code != 200:
@@ -156,23 +277,22 @@ def download_github_file(url_info, output_path, retry_count=0, max_retries=3):
                 print(f"    Response: {response.text[:300]}...")
 
             if response.status_code == 200:
-                # Create directory if needed
-                os.makedirs(os.path.dirname(output_path), exist_ok=True)
-
-                # Write file content
-                with open(output_path, "wb") as f:
-                    f.write(response.content)
+                with response:
+                    sha = store.write_chunks(output_path, response.iter_content(DOWNLOAD_CHUNK_SIZE))
+                record_sync(entry, output_path, {".": sha}, response)
                 return True
             else:
                 print(f"    Failed to get file content - Status: {response.status_code}")
 
         elif url_info["type"] == "dir":
-            # List directory contents
-            api_url = f"https://api.github.com/repos/{url_info['owner']}/{url_info['repo']}/contents/{url_info['path']}?ref={url_info['branch']}"
-            # Update headers to use proper Accept header for directory listing
-            dir_headers = HEADERS.copy()
-            dir_headers["Accept"] = "application/vnd.github+json"
-            response = requests.get(api_url, headers=dir_headers, timeout=30)
+            # Resolve the whole subtree, nested directories included, with one recursive Git Trees call
+            api_url = f"https://api.github.com/repos/{url_info['owner']}/{url_info['repo']}/git/trees/{url_info['branch']}?recursive=1"
+            tree_headers = HEADERS.copy()
+            tree_headers["Accept"] = "application/vnd.github+json"
+            response = session.get(api_url, headers=conditional_headers(tree_headers, entry, output_path), timeout=30)
+            if response.status_code == 304:
+                print("    Unchanged since last sync")
+                return True
 
             # Log response details
             if response.status_code != 200:
@@ -181,21 +301,46 @@ def download_github_file(url_info, output_path, retry_count=0, max_retries=3):
                 print(f"    Response: {response.text[:300]}...")
 
             if response.status_code == 200:
-                # Create directory
-                os.makedirs(output_path, exist_ok=True)
+                tree = response.json()
+                files, complete = download_directory(url_info, tree, output_path, session, store, entry)
+                if not files:
+                    return False
+                # An incomplete download must not be answered with a 304 next time
+                record_sync(entry, output_path, files, response if complete else None, tree.get("sha"))
+                return True
 
-                # Download each file in the directory
-                items = response.json()
-                for item in items:
-                    if item["type"] == "file":
-                        file_path = os.path.join(output_path, item["name"])
-                        # Download the file content
-                        file_response = requests.get(item["download_url"], headers=HEADERS, timeout=30)
-                        if file_response.status_code != 200:
-                            print(f"      File download failed: {item['name']} - Status: {file_response.status_code}")
-                        if file_response.status_code == 200:
-                            with open(file_path, "wb") as f:
-                                f.write(file_response.content)
+        elif url_info["type"] == "repo":
+            # Pin the default branch to a commit so the archive matches what was resolved
+            api_url = f"https://api.github.com/repos/{url_info['owner']}/{url_info['repo']}/commits/HEAD"
+            sha_headers = HEADERS.copy()
+            sha_headers["Accept"] = "application/vnd.github.sha"
+            # A sync with other globs says nothing about the files wanted now
+            previous = entry if entry and entry.get("globs") == list(repo_globs) else None
+            response = session.get(api_url, headers=conditional_headers(sha_headers, previous, output_path), timeout=30)
+            if response.status_code == 304:
+                print("    Unchanged since last sync")
+                return True
+
+            # Log response details
+            if response.status_code != 200:
+                print(f"    API Response: {response.status_code}")
+                print(f"    Headers: X-RateLimit-Remaining={response.headers.get('X-RateLimit-Remaining', 'N/A')}")
+                print(f"    Response: {response.text[:300]}...")
+
+            if response.status_code == 200:
+                commit_sha = response.text.strip()
+                print(f"    Pinned commit: {commit_sha}")
+                if previous and previous.get("ref") == commit_sha and files_intact(previous, output_path):
+                    print("    Unchanged since last sync")
+                    record_sync(entry, output_path, previous["files"], response, commit_sha)
+                    return True
+                files = download_repository_archive(url_info, commit_sha, output_path, session, store, repo_globs)
+                if files is None:
+                    return False
+                # No file matching the globs is a valid result; the pinned commit is still recorded
+                record_sync(entry, output_path, files, response, commit_sha)
+                if entry is not None:
+                    entry["globs"] = list(repo_globs)
                 return True
 
         elif url_info["type"] == "gist":
@@ -204,7 +349,10 @@ def download_github_file(url_info, output_path, retry_count=0, max_retries=3):
             # Update headers to use proper Accept header for gist API
             gist_headers = HEADERS.copy()
             gist_headers["Accept"] = "application/vnd.github+json"
-            response = requests.get(api_url, headers=gist_headers, timeout=30)
+            response = session.get(api_url, headers=conditional_headers(gist_headers, entry, output_path), timeout=30)
+            if response.status_code == 304:
+                print("    Unchanged since last sync")
+                return True
 
             # Log response details
             if response.status_code != 200:
@@ -218,19 +366,33 @@ def download_github_file(url_info, output_path, retry_count=0, max_retries=3):
                 os.makedirs(output_path, exist_ok=True)
 
                 # Download each file in the gist
+                files = {}
                 for filename, file_info in gist_data["files"].items():
                     file_path = os.path.join(output_path, filename)
-                    with open(file_path, "w", encoding="utf-8") as f:
-                        f.write(file_info["content"])
+                    if file_info.get("truncated"):
+                        # The API cuts file content off at 1 MB; the raw URL serves all of it
+                        sha, status_code = stream_to_store(session, store, file_info["raw_url"], file_path)
+                        if not sha:
+                            print(f"      Truncated gist file download failed: {filename} - Status: {status_code}")
+                            return False
+                        files[filename] = sha
+                    else:
+                        files[filename] = store.write(file_path, file_info["content"].encode("utf-8"))
+                version = (gist_data.get("history") or [{}])[0].get("version")
+                record_sync(entry, output_path, files, response, version)
                 return True
 
-        # Handle rate limiting
-        if response.status_code == 429:
-            reset_time = response.headers.get("X-RateLimit-Reset")
-            if reset_time:
-                reset_datetime = datetime.fromtimestamp(int(reset_time))
-                print(f"    Rate limit will reset at: {reset_datetime.strftime('%Y-%m-%d %H:%M:%S')}")
-            raise requests.exceptions.HTTPError("Rate limited")
+        # Handle rate limiting: the shared session's rate limiter already holds back
+        # further GitHub requests until the limit clears, plain sessions sleep here
+        if is_rate_limited(response):
+            delay = retry_delay(response)
+            print(f"    Rate limited, retrying in {delay:.0f}s")
+            if retry_count < max_retries:
+                if getattr(session, "rate_limiter", None) is None:
+                    time.sleep(delay)
+                return download_github_file(
+                    url_info, output_path, retry_count + 1, max_retries, session, repo_globs, store, entry
+                )
 
         return False
 
@@ -239,43 +401,380 @@ def download_github_file(url_info, output_path, retry_count=0, max_retries=3):
             wait_time = (2**retry_count) + random.uniform(1, 2)
             print(f"  Retry in {wait_time:.1f}s... (Error: {str(e)})")
             time.sleep(wait_time)
-            return download_github_file(url_info, output_path, retry_count + 1, max_retries)
+            return download_github_file(
+                url_info, output_path, retry_count + 1, max_retries, session, repo_globs, store, entry
+            )
 
         print(f"  Failed after {max_retries} retries: {str(e)}")
         return False
 
 
-def load_overrides():
-    """Load resource overrides from template directory."""
-    template_dir = os.path.join(os.path.dirname(__file__), "..", "templates")
-    override_path = os.path.join(template_dir, "resource-overrides.yaml")
-    if not os.path.exists(override_path):
+def download_directory(url_info, tree, output_path, session, store, entry=None):
+    """
+    Mirror the directory `url_info["path"]` from a recursive Git Trees listing.
+
+    Files whose blob SHA is already in `store` are linked without a request; the
+    rest come from raw.githubusercontent.com (outside the API rate limit),
+    DIRECTORY_FETCH_WORKERS at a time. Subtrees the listing cannot hold in full, or
+    with more than ARCHIVE_THRESHOLD_FILES files, are taken from the repository
+    tarball in one download instead.
+
+    Returns ({relative path: blob SHA}, complete). A file that failed to download
+    keeps its entry from the last sync in `entry`, if it is still on disk.
+    """
+    prefix = url_info["path"].strip("/") + "/"
+    blobs = [
+        item
+        for item in tree.get("tree", [])
+        if item["type"] == "blob" and item.get("mode") != SYMLINK_MODE and item["path"].startswith(prefix)
+    ]
+
+    if tree.get("truncated") or len(blobs) > ARCHIVE_THRESHOLD_FILES:
+        reason = "listing truncated" if tree.get("truncated") else f"{len(blobs)} files"
+        print(f"    Large directory ({reason}), downloading repository archive")
+        files = download_directory_archive(url_info, output_path, session, store)
+        return files, files is not None
+
+    if not blobs:
+        print(f"    No files found under {url_info['path']}")
+        return {}, False
+
+    os.makedirs(output_path, exist_ok=True)
+    raw_base = f"https://raw.githubusercontent.com/{url_info['owner']}/{url_info['repo']}/{url_info['branch']}"
+
+    def fetch(item):
+        relative = item["path"][len(prefix) :]
+        file_path = os.path.join(output_path, *relative.split("/"))
+        if os.path.exists(store.path_for(item["sha"])):
+            store.link(item["sha"], file_path)
+            return relative, item["sha"], None
+        sha, status_code = stream_to_store(session, store, f"{raw_base}/{quote(item['path'])}", file_path)
+        return relative, sha, status_code
+
+    files = {}
+    fetched = 0
+    complete = True
+    known = (entry or {}).get("files") or {}
+    with ThreadPoolExecutor(max_workers=min(DIRECTORY_FETCH_WORKERS, len(blobs))) as executor:
+        for relative, sha, status_code in executor.map(fetch, blobs):
+            if status_code == 200:
+                fetched += 1
+            elif status_code is not None:
+                print(f"      File download failed: {relative} - Status: {status_code}")
+                complete = False
+                if relative in known and os.path.exists(os.path.join(output_path, *relative.split("/"))):
+                    sha = known[relative]
+            if sha:
+                files[relative] = sha
+    print(f"    Fetched {fetched} of {len(blobs)} files ({len(blobs) - fetched} already stored or failed)")
+    return files, complete
+
+
+def download_directory_archive(url_info, output_path, session, store):
+    """
+    Stream the repository tarball and extract only the files below `url_info["path"]`.
+    Returns {relative path: blob SHA}, or None if the download failed.
+    """
+    prefix = url_info["path"].strip("/") + "/"
+
+    def select(path):
+        return path[len(prefix) :] if path.startswith(prefix) else None
+
+    files = stream_tarball(url_info, url_info["branch"], output_path, session, store, select)
+    if files is not None:
+        print(f"    Extracted {len(files)} files from archive")
+    return files
+
+
+def download_repository_archive(url_info, commit_sha, output_path, session, store, repo_globs=DEFAULT_REPO_GLOBS):
+    """
+    Stream the tarball of `commit_sha` and extract the files matching `repo_globs`.
+    Returns {relative path: blob SHA}, or None if the download failed.
+    """
+    pattern = compile_globs(repo_globs)
+
+    def select(path):
+        return path if pattern.match(path) else None
+
+    files = stream_tarball(url_info, commit_sha, output_path, session, store, select)
+    if files == {}:
+        print(f"    No files match {', '.join(repo_globs)}")
+    elif files:
+        print(f"    Extracted {len(files)} files matching {', '.join(repo_globs)}")
+    return files
+
+
+def compile_globs(globs):
+    """
+    Compile repository path globs into one regex. `**` spans directories, `*` and
+    `?` stay within one path segment, and a trailing `/**` matches everything below.
+    """
+    alternatives = []
+    for glob in globs:
+        parts = re.split(r"(\*\*/?|\*|\?)", glob.strip().strip("/"))
+        regex = ""
+        for part in parts:
+            if part in ("**", "**/"):
+                regex += ".*" if part == "**" else "(?:.*/)?"
+            elif part == "*":
+                regex += "[^/]*"
+            elif part == "?":
+                regex += "[^/]"
+            else:
+                regex += re.escape(part)
+        alternatives.append(regex)
+    return re.compile("(?:" + "|".join(alternatives) + ")\\Z")
+
+
+def stream_tarball(url_info, ref, output_path, session, store, select):
+    """
+    Stream the tarball of `ref` straight from the response into `output_path`,
+    extracting only regular files for which `select(path)` returns a relative
+    target. The archive is never held in memory or written to disk in full.
+    Returns {relative path: blob SHA} of the files written, or None if the
+    download failed.
+    """
+    api_url = f"https://api.github.com/repos/{url_info['owner']}/{url_info['repo']}/tarball/{ref}"
+    with session.get(api_url, headers=HEADERS, timeout=60, stream=True) as response:
+        if response.status_code != 200:
+            print(f"    Archive download failed - Status: {response.status_code}")
+            return None
+        response.raw.decode_content = True
+        return extract_tar_members(response.raw, output_path, store, select)
+
+
+def extract_tar_members(fileobj, output_path, store, select):
+    """Extract the selected regular files of a streamed GitHub tarball; returns {relative path: blob SHA}."""
+    files = {}
+    with tarfile.open(fileobj=fileobj, mode="r|gz") as archive:
+        for member in archive:
+            if not member.isfile():
+                continue
+            # Entries are rooted at <owner>-<repo>-<sha>/
+            _, _, path = member.name.partition("/")
+            relative = select(path)
+            if not relative:
+                continue
+            parts = relative.split("/")
+            if ".." in parts or "" in parts:
+                continue
+            with archive.extractfile(member) as source:
+                files[relative] = store.write_stream(os.path.join(output_path, *parts), source, member.size)
+    return files
+
+
+def load_manifest(path):
+    """
+    Load the download manifest: {resource ID: entry}, where an entry records the
+    link, local archive/hosted paths, the remote commit/tree SHA and ETag of the
+    last sync, and {relative path: blob SHA} for every file written.
+    A missing or unreadable manifest means a full download.
+    """
+    if not path or not os.path.exists(path):
+        return {}
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"Ignoring unreadable download manifest {path}: {e}")
+        return {}
+    if data.get("version") != MANIFEST_VERSION:
         return {}
+    return data.get("resources", {})
+
 
-    with open(override_path, encoding="utf-8") as f:
-        data = yaml.safe_load(f)
-        return data.get("overrides", {})
+def save_manifest(path, manifest):
+    """
+    Write the manifest atomically. Entries that never synced are left out; one
+    with no files is kept when it records a commit or ETag to compare against.
+    """
+    if not path:
+        return
+    resources = {
+        key: entry
+        for key, entry in sorted(manifest.items())
+        if entry.get("files") or entry.get("ref") or entry.get("etag")
+    }
+    with atomic_write(path) as f:
+        json.dump({"version": MANIFEST_VERSION, "resources": resources}, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def load_overrides():
+    """Load the compiled resource overrides from the template directory (see overrides.py)."""
+    return load_override_file(os.path.join(os.path.dirname(__file__), "..", "templates", "resource-overrides.yaml"))
 
 
 def apply_overrides(row, overrides):
     """Apply overrides to a resource row."""
-    resource_id = row.get("ID", "")
-    if not resource_id or resource_id not in overrides:
-        return row
+    return compile_overrides(overrides).apply(row)[0]
+
+
+def path_size(path):
+    """Total size in bytes of a downloaded file or directory tree."""
+    if os.path.isfile(path):
+        return os.path.getsize(path)
+    total = 0
+    for root, _dirs, files in os.walk(path):
+        for name in files:
+            total += os.path.getsize(os.path.join(root, name))
+    return total
+
+
+def format_throughput(resources, total_bytes, seconds):
+    """One-line resources/s and bytes/s summary for a download run."""
+    if seconds <= 0:
+        return f"{resources} resources, {total_bytes} bytes"
+    return (
+        f"{resources / seconds:.1f} resources/s, {total_bytes / seconds / 1024:.1f} KiB/s "
+        f"({resources} resources, {total_bytes} bytes in {seconds:.1f}s)"
+    )
+
+
+def format_utilization(busy_seconds, workers, seconds):
+    """Share of the pool's wall time spent downloading."""
+    if seconds <= 0:
+        return f"n/a ({workers} workers)"
+    return f"{min(busy_seconds / (workers * seconds), 1.0):.0%} of {workers} workers"
+
+
+def remove_empty_parents(path, stop):
+    """Remove the now-empty directories between `path` and `stop` (exclusive)."""
+    directory = os.path.dirname(path)
+    while directory != stop and directory.startswith(stop + os.sep):
+        try:
+            os.rmdir(directory)
+        except OSError:
+            break
+        directory = os.path.dirname(directory)
+
+
+def referenced_blobs(manifest):
+    """SHAs of every blob a manifest entry still lists as one of its files."""
+    return {sha for entry in manifest.values() for sha in (entry.get("files") or {}).values()}
+
 
-    override_config = overrides[resource_id]
+def prune_stale_files(previous, entry):
+    """
+    Delete the files the previous sync wrote (archive and hosted) that the current
+    one no longer has: files removed upstream, or no longer hosted. Returns the
+    number of files removed.
+    """
+    kept = set()
+    for root in (entry.get("path"), entry.get("hosted_path")):
+        if root:
+            kept.update(os.path.normpath(os.path.join(root, relative)) for relative in entry.get("files") or {})
+
+    removed = 0
+    for root in {previous.get("path"), previous.get("hosted_path")}:
+        if not root:
+            continue
+        for relative in previous.get("files") or {}:
+            path = os.path.normpath(os.path.join(root, relative))
+            if path in kept or not os.path.lexists(path):
+                continue
+            os.remove(path)
+            removed += 1
+            remove_empty_parents(path, root if relative != "." else os.path.dirname(root))
+    return removed
 
-    # Apply overrides (excluding locked flags and notes)
-    for field, value in override_config.items():
-        if not field.endswith("_locked") and field != "notes":
-            if field == "license":
-                row["License"] = value
-            elif field == "active":
-                row["Active"] = value
-            elif field == "description":
-                row["Description"] = value
 
-    return row
+def download_resource(job, session, store):
+    """
+    Download one planned resource to the archive and, if it is open source, link it
+    into the hosted directory. Runs on a worker thread, so progress lines are
+    collected in the result and printed by the caller in CSV order.
+
+    The job's manifest entry is updated in place; files the previous sync wrote
+    that are gone upstream are removed from both trees.
+    """
+    messages = []
+    started = time.perf_counter()
+    resource_path = job["resource_path"]
+    hosted_path = job["hosted_path"]
+    entry = job["entry"]
+    previous = dict(entry)
+
+    success = download_github_file(
+        job["url_info"], resource_path, session=session, repo_globs=job["repo_globs"], store=store, entry=entry
+    )
+    size = 0
+    changed = pruned = 0
+    if success:
+        changed = entry.get("files") != previous.get("files") or entry.get("path") != previous.get("path")
+        if changed:
+            messages.append("  ✅ Downloaded successfully")
+            size = path_size(resource_path)
+        else:
+            messages.append("  ✅ Up to date")
+
+        # If open-source licensed, also link into the hosted directory (no data is copied)
+        hosted_files = (
+            [os.path.normpath(os.path.join(hosted_path, rel)) for rel in entry["files"]] if hosted_path else []
+        )
+        if (
+            hosted_path
+            and not changed
+            and previous.get("hosted_path") == hosted_path
+            and all(os.path.exists(path) for path in hosted_files)
+        ):
+            messages.append("  📦 Hosted copy up to date")
+        elif hosted_path and entry["files"]:
+            messages.append(f"  📦 Linking into hosted directory: {hosted_path}")
+            try:
+                if os.path.isdir(resource_path):
+                    messages.append(f"     Source is directory with {len(os.listdir(resource_path))} items")
+                else:
+                    messages.append("     Source is file")
+                store.mirror(resource_path, hosted_path)
+                messages.append("  ✅ Linked into hosted directory")
+            except Exception as e:
+                messages.append(f"  ⚠️  Failed to link into hosted directory: {e}")
+                messages.append(f"     Error type: {type(e).__name__}")
+                messages.append(f"     Traceback: {traceback.format_exc()}")
+        entry["hosted_path"] = hosted_path
+
+        pruned = prune_stale_files(previous, entry)
+        if pruned:
+            messages.append(f"  🧹 Removed {pruned} files no longer upstream or hosted")
+    else:
+        messages.append("  ❌ Download failed")
+
+    return {
+        "success": success,
+        "changed": bool(changed),
+        "pruned": pruned,
+        "bytes": size,
+        "seconds": time.perf_counter() - started,
+        "messages": messages,
+    }
+
+
+def run_download_jobs(jobs, workers=DEFAULT_WORKERS, session=None, store=None):
+    """
+    Download planned jobs on a bounded thread pool and yield (job, result) in plan order.
+
+    Jobs that write below the same resource directory run one after another in
+    plan order on a single worker, so the files on disk are the same as a
+    sequential run no matter how the threads are scheduled. Pacing is left to the
+    session's rate limiter, which follows the live X-RateLimit headers.
+    """
+    session = session or get_shared_session()
+    store = store or get_blob_store()
+    groups = {}
+    positions = []
+    for job in jobs:
+        group_jobs = groups.setdefault(job["group"], [])
+        positions.append(len(group_jobs))
+        group_jobs.append(job)
+
+    def run_group(group_jobs):
+        return [download_resource(job, session, store) for job in group_jobs]
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        futures = {key: executor.submit(run_group, group_jobs) for key, group_jobs in groups.items()}
+        for job, position in zip(jobs, positions, strict=True):
+            yield job, futures[job["group"]].result()[position]
 
 
 def process_resources(
@@ -284,10 +783,27 @@ def process_resources(
     max_downloads=None,
     output_dir=DEFAULT_OUTPUT_DIR,
     hosted_dir=HOSTED_OUTPUT_DIR,
+    session=None,
+    workers=DEFAULT_WORKERS,
+    repo_globs=DEFAULT_REPO_GLOBS,
+    store=None,
+    manifest_path=DEFAULT_MANIFEST_FILE,
+    full=False,
 ):
     """
     Process and download resources from the CSV file.
+
+    The CSV is read once to plan every download (filters, overrides, target
+    paths); the downloads then run on `workers` threads. Repository links
+    archive only the files matching `repo_globs`. Files are hardlinks into
+    `store`; with a manifest, blobs it no longer references are pruned at the end.
+
+    The manifest at `manifest_path` remembers what the last run fetched, so an
+    unchanged resource costs one conditional request and no download. With
+    `full`, every resource is fetched again (stale files are still pruned).
     """
+    session = session or get_shared_session()
+    store = store or get_blob_store()
     start_time = datetime.now()
     print(f"Starting download at: {start_time.strftime('%Y-%m-%d %H:%M:%S')}")
     print(f"Archive directory (all resources): {output_dir}")
@@ -295,7 +811,7 @@ def process_resources(
 
     # Check rate limit status
     try:
-        rate_check = requests.get("https://api.github.com/rate_limit", headers=HEADERS, timeout=10)
+        rate_check = session.get("https://api.github.com/rate_limit", headers=HEADERS, timeout=10)
         if rate_check.status_code == 200:
             rate_data = rate_check.json()
             core_limit = rate_data.get("rate", {})
@@ -307,6 +823,10 @@ def process_resources(
     except Exception as e:
         print(f"Could not check rate limit: {e}")
 
+    manifest = load_manifest(manifest_path)
+    if manifest:
+        print(f"\nLoaded download manifest with {len(manifest)} resources")
+
     # Load overrides
     overrides = load_overrides()
     if overrides:
@@ -317,137 +837,148 @@ def process_resources(
     downloaded = 0
     skipped = 0
     failed = 0
-
-    # Read CSV
-    with open(CSV_FILE, newline="", encoding="utf-8") as file:
-        reader = csv.DictReader(file)
-
-        for row in reader:
-            # Apply overrides to the row
-            row = apply_overrides(row, overrides)
-            # Check if we've reached the download limit
-            if max_downloads and downloaded >= max_downloads:
-                print(f"\nReached download limit ({max_downloads}). Stopping.")
-                break
-
-            # Skip inactive resources
-            if row["Active"].upper() != "TRUE":
-                continue
-
-            total_resources += 1
-
-            # Apply filters
-            if category_filter and row["Category"] != category_filter:
-                continue
-
-            if license_filter and row.get("License", "") != license_filter:
-                continue
-
-            # Get the URL (prefer primary link)
-            url = row["Primary Link"].strip() or row["Secondary Link"].strip()
-            if not url:
-                continue
-
-            display_name = row["Display Name"]
-            original_category = row["Category"]
-            category = sanitize_filename(original_category.lower().replace(" & ", "-"))
-
-            # Use same sanitized category name for both directories
-            resource_license = row.get("License", "NOT_FOUND").strip()
-
-            print(f"\n[{downloaded + 1}] Processing: {display_name}")
-            print(f"  URL: {url}")
-            print(f"  Category: {original_category} -> '{category}'")
-
-            # Parse GitHub URL
-            url_info = parse_github_url(url)
-            if not url_info:
-                print("  Skipped: Not a GitHub URL")
-                skipped += 1
-                continue
-
-            # Determine output paths
-            safe_name = sanitize_filename(display_name)
-            print(f"  Sanitized name: '{display_name}' -> '{safe_name}'")
-
-            # Primary path for archive (all resources)
-            if url_info["type"] == "gist":
-                resource_path = os.path.join(output_dir, category, f"{safe_name}-gist")
-                hosted_path = (
-                    os.path.join(hosted_dir, category, safe_name) if resource_license in OPEN_SOURCE_LICENSES else None
-                )
-            elif url_info["type"] == "repo":
-                resource_path = os.path.join(output_dir, category, safe_name)
-                print("  Skipped: Full repository downloads not implemented")
-                skipped += 1
-                continue
-            elif url_info["type"] == "dir":
-                resource_path = os.path.join(output_dir, category, safe_name)
-                hosted_path = (
-                    os.path.join(hosted_dir, category, safe_name) if resource_license in OPEN_SOURCE_LICENSES else None
-                )
-            else:  # file
-                # Extract filename from path
-                filename = os.path.basename(url_info["path"])
-                resource_path = os.path.join(output_dir, category, safe_name, filename)
-                hosted_path = (
-                    os.path.join(hosted_dir, category, safe_name, filename)
-                    if resource_license in OPEN_SOURCE_LICENSES
-                    else None
-                )
-
-            # Download the resource to archive
-            print(f"  Downloading to archive: {resource_path}")
-            print(f"  License: {resource_license}")
-            if hosted_path:
-                print(f"  Will copy to hosted: {hosted_path}")
-
-            download_success = download_github_file(url_info, resource_path)
-
-            if download_success:
-                print("  ✅ Downloaded successfully")
-                downloaded += 1
-
-                # If open-source licensed, also copy to hosted directory
-                if hosted_path and resource_license in OPEN_SOURCE_LICENSES:
-                    print(f"  📦 Copying to hosted directory: {hosted_path}")
-                    try:
-                        import shutil
-
-                        os.makedirs(os.path.dirname(hosted_path), exist_ok=True)
-
-                        if os.path.isdir(resource_path):
-                            print(f"     Source is directory with {len(os.listdir(resource_path))} items")
-                            shutil.copytree(resource_path, hosted_path, dirs_exist_ok=True)
-                        else:
-                            print("     Source is file")
-                            shutil.copy2(resource_path, hosted_path)
-                        print("  ✅ Copied to hosted directory")
-                    except Exception as e:
-                        print(f"  ⚠️  Failed to copy to hosted directory: {e}")
-                        print(f"     Error type: {type(e).__name__}")
-                        import traceback
-
-                        print(f"     Traceback: {traceback.format_exc()}")
-            else:
-                print("  ❌ Download failed")
-                failed += 1
-
-            # Rate limiting delay
-            time.sleep(random.uniform(1, 2))
+    unchanged = 0
+    pruned = 0
+    jobs = []
+
+    # Read CSV and plan the downloads
+    for row in load_resource_table(CSV_FILE):
+        # Apply overrides to the row
+        row = apply_overrides(row, overrides)
+        # Check if we've reached the download limit
+        if max_downloads and len(jobs) >= max_downloads:
+            print(f"\nReached download limit ({max_downloads}). Stopping.")
+            break
+
+        # Skip inactive resources
+        if row["Active"].upper() != "TRUE":
+            continue
+
+        total_resources += 1
+
+        # Apply filters
+        if category_filter and row["Category"] != category_filter:
+            continue
+
+        if license_filter and row.get("License", "") != license_filter:
+            continue
+
+        # Get the URL (prefer primary link)
+        url = row["Primary Link"].strip() or row["Secondary Link"].strip()
+        if not url:
+            continue
+
+        display_name = row["Display Name"]
+        original_category = row["Category"]
+        category = sanitize_filename(original_category.lower().replace(" & ", "-"))
+
+        # Use same sanitized category name for both directories
+        resource_license = row.get("License", "NOT_FOUND").strip()
+
+        print(f"\n[{len(jobs) + 1}] Processing: {display_name}")
+        print(f"  URL: {url}")
+        print(f"  Category: {original_category} -> '{category}'")
+
+        # Parse GitHub URL
+        url_info = parse_github_url(url)
+        if not url_info:
+            print("  Skipped: Not a GitHub URL")
+            skipped += 1
+            continue
+
+        # Determine output paths
+        safe_name = sanitize_filename(display_name)
+        print(f"  Sanitized name: '{display_name}' -> '{safe_name}'")
+
+        # Primary path for archive (all resources)
+        if url_info["type"] == "gist":
+            resource_path = os.path.join(output_dir, category, f"{safe_name}-gist")
+            hosted_path = (
+                os.path.join(hosted_dir, category, safe_name) if resource_license in OPEN_SOURCE_LICENSES else None
+            )
+        elif url_info["type"] in ("repo", "dir"):
+            resource_path = os.path.join(output_dir, category, safe_name)
+            hosted_path = (
+                os.path.join(hosted_dir, category, safe_name) if resource_license in OPEN_SOURCE_LICENSES else None
+            )
+        else:  # file
+            # Extract filename from path
+            filename = os.path.basename(url_info["path"])
+            resource_path = os.path.join(output_dir, category, safe_name, filename)
+            hosted_path = (
+                os.path.join(hosted_dir, category, safe_name, filename)
+                if resource_license in OPEN_SOURCE_LICENSES
+                else None
+            )
+
+        print(f"  Downloading to archive: {resource_path}")
+        print(f"  License: {resource_license}")
+        if hosted_path:
+            print(f"  Will copy to hosted: {hosted_path}")
+
+        entry = manifest.setdefault(row.get("ID") or url, {})
+        if entry.get("url") != url or full:
+            # Keep the old file list only so its files can be pruned
+            entry.update({"url": url, "etag": None, "ref": None, "globs": None})
+
+        jobs.append(
+            {
+                "number": len(jobs) + 1,
+                "display_name": display_name,
+                "url_info": url_info,
+                "resource_path": resource_path,
+                "hosted_path": hosted_path,
+                "repo_globs": repo_globs,
+                # Every path of this resource lives below <root>/<category>/<safe_name>
+                "group": (category, safe_name),
+                "entry": entry,
+            }
+        )
+
+    # Download on the worker pool; results come back in CSV order
+    print(f"\nDownloading {len(jobs)} resources with {workers} workers")
+    download_start = time.perf_counter()
+    total_bytes = 0
+    busy_seconds = 0.0
+    for job, result in run_download_jobs(jobs, workers=workers, session=session, store=store):
+        print(f"\n[{job['number']}] {job['display_name']}")
+        for message in result["messages"]:
+            print(message)
+        busy_seconds += result["seconds"]
+        if result["success"]:
+            downloaded += 1
+            unchanged += not result["changed"]
+            pruned += result["pruned"]
+            total_bytes += result["bytes"]
+        else:
+            failed += 1
+    download_seconds = time.perf_counter() - download_start
+    save_manifest(manifest_path, manifest)
+    if manifest_path:
+        store.prune(referenced_blobs(manifest))
 
     # Summary
     end_time = datetime.now()
     duration = end_time - start_time
+    pool_size = max(1, min(workers, len({job["group"] for job in jobs})))
 
     print(f"\n{'=' * 60}")
     print(f"Download completed at: {end_time.strftime('%Y-%m-%d %H:%M:%S')}")
     print(f"Total execution time: {duration}")
     print("\nSummary:")
     print(f"  Total resources found: {total_resources}")
-    print(f"  Downloaded: {downloaded}")
+    print(f"  Downloaded: {downloaded} ({unchanged} unchanged since the last sync)")
     print(f"  Skipped: {skipped}")
     print(f"  Failed: {failed}")
+    print(f"  Stale files removed: {pruned}")
+    print(f"  Throughput: {format_throughput(len(jobs), total_bytes, download_seconds)}")
+    print(f"  Worker utilization: {format_utilization(busy_seconds, pool_size, download_seconds)}")
+    print(f"  Blob store: {format_blob_stats(store.stats)}")
+    print(f"  HTTP connections: {format_connection_stats(session.stats)}")
+    if getattr(session, "cache", None) is not None:
+        print(f"  GitHub API cache: {format_cache_stats(session.cache_stats())}")
+    if getattr(session, "rate_limiter", None) is not None:
+        print(f"  GitHub rate limit pacing: {format_rate_limiter_stats(session.rate_limiter.stats)}")
     print(f"{'=' * 60}")
 
 
@@ -461,6 +992,20 @@ def main():
     parser.add_argument(
         "--hosted-dir", default=HOSTED_OUTPUT_DIR, help="Hosted output directory for open-source resources"
     )
+    parser.add_argument(
+        "--repo-globs",
+        default=",".join(DEFAULT_REPO_GLOBS),
+        help=f"Comma-separated path globs archived from repository links (default: {','.join(DEFAULT_REPO_GLOBS)})",
+    )
+    parser.add_argument(
+        "--manifest",
+        default=DEFAULT_MANIFEST_FILE,
+        help=f"Download manifest for incremental syncs (default: {DEFAULT_MANIFEST_FILE})",
+    )
+    parser.add_argument("--full", action="store_true", help="Ignore the manifest and download everything again")
+    parser.add_argument(
+        "--workers", type=int, default=DEFAULT_WORKERS, help=f"Concurrent downloads (default: {DEFAULT_WORKERS})"
+    )
 
     args = parser.parse_args()
 
@@ -468,6 +1013,9 @@ def main():
     Path(args.output_dir).mkdir(parents=True, exist_ok=True)
     Path(args.hosted_dir).mkdir(parents=True, exist_ok=True)
 
+    # Every worker gets its own keep-alive connection to api.github.com
+    session = configure_shared_session(pool_maxsize=max(DEFAULT_POOL_MAXSIZE, args.workers))
+
     # Process resources
     process_resources(
         category_filter=args.category,
@@ -475,7 +1023,13 @@ def main():
         max_downloads=args.max_downloads,
         output_dir=args.output_dir,
         hosted_dir=args.hosted_dir,
+        session=session,
+        workers=args.workers,
+        repo_globs=tuple(glob for glob in args.repo_globs.split(",") if glob.strip()),
+        manifest_path=args.manifest,
+        full=args.full,
     )
+    session.close()
 
 
 if __name__ == "__main__":
@@ -2,16 +2,64 @@
 """
 Template-based README generator for the Awesome Claude Code repository.
 Reads resource metadata from CSV and generates README using templates.
+
+Generation is incremental: a render cache in .myob/cache records a hash of
+every input (CSV, template, structure, overrides, this generator and the
+modules it renders through) and the rendered fragment of each section. When
+no input changed and README.md is still the file last written, nothing is
+rendered, written or backed up; when inputs changed, only sections whose
+configuration or rows changed are rendered again. A change to the code or the
+target's template invalidates every fragment of that target. Pass --force to
+ignore the cache.
+
+Several READMEs can be rendered in one run: templates/readme-locales.yaml
+lists one target per locale (template, structure and output file). The CSV
+and overrides are parsed once and shared by every target, targets render in
+parallel, and an output file is only rewritten when its content changes.
+Without that file the single default target (README.template.md,
+readme-structure.yaml -> README.md) is rendered.
 """
 
-import csv
+import argparse
+import hashlib
+import json
 import os
 import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 import yaml  # type: ignore[import-untyped]
 
+try:
+    from atomic_io import atomic_write  # type: ignore[import-not-found]
+    from overrides import compile_overrides  # type: ignore[import-not-found]
+    from overrides import load_overrides as load_override_file  # type: ignore[import-not-found]
+    from resource_table import load_resource_table  # type: ignore[import-not-found]
+except ImportError:
+    from .atomic_io import atomic_write
+    from .overrides import compile_overrides
+    from .overrides import load_overrides as load_override_file
+    from .resource_table import load_resource_table
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(SCRIPT_DIR)
+DEFAULT_RENDER_CACHE = os.path.join(REPO_ROOT, ".myob", "cache", "readme-render.json")
+RENDER_CACHE_VERSION = 3
+# Source files whose code shapes the rendered README: this generator and the helpers rows pass through
+RENDER_CODE_FILES = [
+    os.path.join(SCRIPT_DIR, name)
+    for name in ("generate_readme.py", "overrides.py", "resource_table.py", "url_utils.py")
+]
+LOCALES_FILE = "readme-locales.yaml"
+DEFAULT_TARGET = {
+    "locale": "default",
+    "template": "README.template.md",
+    "structure": "readme-structure.yaml",
+    "output": "README.md",
+}
+DEFAULT_RENDER_WORKERS = 4
+
 
 def load_template(template_path):
     """Load a template file."""
@@ -80,15 +128,50 @@ def format_resource_entry(row):
         entry_parts.append(f"&nbsp;&nbsp;⚖️&nbsp;&nbsp;{license_info}")
 
     # Add description on new line if present
-    result = "".join(entry_parts)
     if description:
-        result += f"  \n{description}"
+        entry_parts.append(f"  \n{description}")
+
+    return "".join(entry_parts)
+
 
-    return result
+def group_resources(csv_data):
+    """
+    Group resource rows by (category, sub-category) in one pass. Rows without a
+    sub-category are keyed by (category, ""); rows keep their CSV order.
+    """
+    groups = {}
+    for row in csv_data:
+        groups.setdefault((row["Category"], row.get("Sub-Category", "").strip()), []).append(row)
+    return groups
 
 
-def generate_section_content(section, csv_data):
-    """Generate content for a section based on CSV data."""
+def build_resource_index(csv_data, groups=None, keys=None):
+    """
+    Map (category, sub-category) to the rendered entries of its resources,
+    rendering each entry once. Pass `groups` from group_resources() to reuse a
+    grouping, and `keys` to render only those groups.
+    """
+    if groups is None:
+        groups = group_resources(csv_data)
+    if keys is None:
+        keys = groups.keys()
+    return {key: [format_resource_entry(row) for row in groups.get(key, [])] for key in keys}
+
+
+def section_keys(section):
+    """The (category, sub-category) groups a section renders, in order."""
+    category = section.get("category", "")
+    return [(category, "")] + [(category, sub["sub_category"]) for sub in section.get("subsections", [])]
+
+
+def generate_section_content(section, csv_data, index=None):
+    """
+    Generate content for a section based on CSV data.
+    Pass the `build_resource_index()` of `csv_data` as `index` when rendering
+    several sections, so the rows are grouped only once.
+    """
+    if index is None:
+        index = build_resource_index(csv_data)
     lines = []
 
     # Add section title
@@ -105,78 +188,37 @@ def generate_section_content(section, csv_data):
         lines.append("")
         lines.append(description)
 
-    # Get resources for this section
+    # Resources of the category without a sub-category come first
     category = section.get("category", "")
-    subsections = section.get("subsections", [])
+    entries = index.get((category, ""))
+    if entries:
+        lines.append("")
+        for entry in entries:
+            lines.append(entry)
+            lines.append("")
 
-    if not subsections:
-        # No subsections - render all resources for this category
-        resources = [r for r in csv_data if r["Category"] == category and not r.get("Sub-Category", "").strip()]
-        if resources:
+    # Then render each subsection
+    for subsection in section.get("subsections", []):
+        entries = index.get((category, subsection["sub_category"]))
+        if entries:
             lines.append("")
-            for resource in resources:
-                lines.append(format_resource_entry(resource))
-                lines.append("")
-    else:
-        # Has subsections - first render main category resources without subcategory
-        main_resources = [r for r in csv_data if r["Category"] == category and not r.get("Sub-Category", "").strip()]
-        if main_resources:
+            lines.append(f"### {subsection['title']}")
             lines.append("")
-            for resource in main_resources:
-                lines.append(format_resource_entry(resource))
+            for entry in entries:
+                lines.append(entry)
                 lines.append("")
 
-        # Then render each subsection
-        for subsection in subsections:
-            sub_title = subsection["title"]
-            sub_category = subsection["sub_category"]
-
-            resources = [
-                r for r in csv_data if r["Category"] == category and r.get("Sub-Category", "").strip() == sub_category
-            ]
-
-            if resources:
-                lines.append("")
-                lines.append(f"### {sub_title}")
-                lines.append("")
-
-                for resource in resources:
-                    lines.append(format_resource_entry(resource))
-                    lines.append("")
-
     return "\n".join(lines).rstrip() + "\n"
 
 
 def load_overrides(template_dir):
-    """Load resource overrides."""
-    override_path = os.path.join(template_dir, "resource-overrides.yaml")
-    if not os.path.exists(override_path):
-        return {}
-
-    with open(override_path, encoding="utf-8") as f:
-        data = yaml.safe_load(f)
-        return data.get("overrides", {})
+    """Load the compiled resource overrides (see overrides.py)."""
+    return load_override_file(os.path.join(template_dir, "resource-overrides.yaml"))
 
 
 def apply_overrides(row, overrides):
     """Apply overrides to a resource row."""
-    resource_id = row.get("ID", "")
-    if not resource_id or resource_id not in overrides:
-        return row
-
-    override_config = overrides[resource_id]
-
-    # Apply overrides (excluding locked flags and notes)
-    for field, value in override_config.items():
-        if not field.endswith("_locked") and field != "notes":
-            if field == "license":
-                row["License"] = value
-            elif field == "active":
-                row["Active"] = value
-            elif field == "description":
-                row["Description"] = value
-
-    return row
+    return compile_overrides(overrides).apply(row)[0]
 
 
 def create_backup(file_path):
@@ -198,73 +240,292 @@ def create_backup(file_path):
     return backup_path
 
 
-def generate_readme_from_templates(csv_path, template_dir, output_path):
-    """Generate README using template system."""
-    # Create backup of existing README
-    backup_path = create_backup(output_path)
+def file_sha256(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def hash_files(paths):
+    digest = hashlib.sha256(f"v{RENDER_CACHE_VERSION}".encode())
+    for path in paths:
+        digest.update(b"\0" + os.path.basename(path).encode() + b"\0")
+        digest.update(file_sha256(path).encode() if os.path.exists(path) else b"missing")
+    return digest.hexdigest()
+
+
+def hash_inputs(csv_path, template_dir, template_name="README.template.md", structure_name="readme-structure.yaml"):
+    """
+    Hash everything a README is rendered from: the CSV, template, structure and
+    overrides files, and the source in RENDER_CODE_FILES.
+    """
+    paths = [
+        csv_path,
+        os.path.join(template_dir, template_name),
+        os.path.join(template_dir, structure_name),
+        os.path.join(template_dir, "resource-overrides.yaml"),
+        *RENDER_CODE_FILES,
+    ]
+    return hash_files(paths)
+
+
+def hash_section(section, groups, salt=""):
+    """
+    Hash of a section's configuration and the rows it renders. `salt` is the
+    hash of the code and template the fragment was rendered with.
+    """
+    payload = {"salt": salt, "section": section, "rows": [groups.get(key, []) for key in section_keys(section)]}
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+def load_render_cache(cache_path):
+    """Load the render cache; a missing, unreadable or outdated cache is empty."""
+    if not cache_path or not os.path.exists(cache_path):
+        return {}
+    try:
+        with open(cache_path, encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if cache.get("version") == RENDER_CACHE_VERSION else {}
 
-    # Load template and structure
-    template_path = os.path.join(template_dir, "README.template.md")
-    structure_path = os.path.join(template_dir, "readme-structure.yaml")
 
-    template = load_template(template_path)
-    structure = load_structure(structure_path)
-    overrides = load_overrides(template_dir)
+def save_render_cache(cache_path, cache):
+    if not cache_path:
+        return
+    cache["version"] = RENDER_CACHE_VERSION
+    with atomic_write(cache_path) as f:
+        json.dump(cache, f, ensure_ascii=False, indent=1, sort_keys=True)
+        f.write("\n")
 
-    # Load CSV data
+
+def load_locales(template_dir):
+    """
+    Load the render targets listed in `readme-locales.yaml`. Each entry names a
+    locale and may override the template, structure and output file of
+    DEFAULT_TARGET; output paths are relative to the parent of `template_dir`.
+    Without the file, only DEFAULT_TARGET is rendered.
+    """
+    locales_path = os.path.join(template_dir, LOCALES_FILE)
+    if not os.path.exists(locales_path):
+        return [dict(DEFAULT_TARGET)]
+    with open(locales_path, encoding="utf-8") as f:
+        data = yaml.safe_load(f) or {}
+    return [{**DEFAULT_TARGET, **entry} for entry in data.get("locales", [])] or [dict(DEFAULT_TARGET)]
+
+
+def target_output_path(template_dir, target):
+    return os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(template_dir)), target["output"]))
+
+
+def load_resources(csv_path, overrides):
+    """Load the active resource rows of the CSV with overrides applied."""
     csv_data = []
-    with open(csv_path, newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            # Apply overrides
-            row = apply_overrides(row, overrides)
-            if row["Active"].upper() == "TRUE":
-                csv_data.append(row)
+    for row in load_resource_table(csv_path):
+        # Apply overrides
+        row = apply_overrides(row, overrides)
+        if row["Active"].upper() == "TRUE":
+            csv_data.append(row)
+    return csv_data
+
+
+def render_target(target, template_dir, csv_data, groups, cached_sections):
+    """
+    Render one target's README from the shared rows and their grouping, reusing
+    the cached fragment of every section whose inputs are unchanged.
+    Returns (content, section cache, sections rendered, sections total).
+    """
+    template = load_template(os.path.join(template_dir, target["template"]))
+    structure = load_structure(os.path.join(template_dir, target["structure"]))
 
     # Generate table of contents
     toc_content = generate_toc_from_structure(structure)
 
-    # Generate body sections
+    # Fragments rendered by other code or for another template are never reused
+    salt = hash_files([os.path.join(template_dir, target["template"]), *RENDER_CODE_FILES])
+    sections_cache = {}
     body_sections = []
-    for section in structure.get("sections", []):
+    rendered = 0
+    for position, section in enumerate(structure.get("sections", [])):
         if section.get("source") == "csv":
-            section_content = generate_section_content(section, csv_data)
+            key = section.get("id") or f"{position}:{section.get('title', '')}"
+            section_hash = hash_section(section, groups, salt)
+            fragment = cached_sections.get(key, {})
+            if fragment.get("hash") == section_hash:
+                section_content = fragment["content"]
+            else:
+                index = build_resource_index(csv_data, groups, section_keys(section))
+                section_content = generate_section_content(section, csv_data, index)
+                rendered += 1
+            sections_cache[key] = {"hash": section_hash, "content": section_content}
             body_sections.append(section_content)
 
     # Replace placeholders in template
     readme_content = template
     readme_content = readme_content.replace("{{TABLE_OF_CONTENTS}}", toc_content)
     readme_content = readme_content.replace("{{BODY_SECTIONS}}", "\n<br>\n\n".join(body_sections))
+    return readme_content, sections_cache, rendered, len(body_sections)
+
+
+def write_if_changed(output_path, content):
+    """
+    Write `content` to `output_path` unless the file already holds exactly that
+    content. Returns (written, backup path or None); the backup is only taken
+    when the file is rewritten.
+    """
+    if os.path.exists(output_path):
+        with open(output_path, "rb") as f:
+            if f.read() == content.encode("utf-8"):
+                return False, None
 
-    # Write output
+    # Create backup of existing README
+    backup_path = create_backup(output_path)
     try:
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(readme_content)
+        with open(output_path, "w", encoding="utf-8", newline="") as f:
+            f.write(content)
     except Exception as e:
         if backup_path:
             print(f"❌ Error writing README: {e}")
             print(f"   Backup preserved at: {backup_path}")
         raise
-
-    return len(csv_data), backup_path
+    return True, backup_path
+
+
+def generate_readmes(
+    csv_path, template_dir, targets=None, cache_path=DEFAULT_RENDER_CACHE, force=False, workers=DEFAULT_RENDER_WORKERS
+):
+    """
+    Render every target (default: `load_locales(template_dir)`) in one pass.
+
+    Targets whose inputs and output are unchanged since the last run are
+    skipped. The CSV and overrides are loaded and grouped once for all other
+    targets, which render on up to `workers` threads; each output is only
+    rewritten (and backed up) when its content differs. Returns one result
+    dict per target, in order, with keys locale, output, status ("unchanged",
+    "identical" or "written"), resource_count, backup, rendered and sections.
+    """
+    if targets is None:
+        targets = load_locales(template_dir)
+    cache = {} if force else load_render_cache(cache_path)
+    outputs_cache = cache.get("outputs", {})
+
+    results = []
+    stale = []
+    for target in targets:
+        output_path = target_output_path(template_dir, target)
+        inputs_hash = hash_inputs(csv_path, template_dir, target["template"], target["structure"])
+        entry = outputs_cache.get(output_path, {})
+        result = {
+            "locale": target["locale"],
+            "output": output_path,
+            "status": "unchanged",
+            "resource_count": entry.get("resource_count", 0),
+            "backup": None,
+            "rendered": 0,
+            "sections": len(entry.get("sections", {})),
+        }
+        results.append(result)
+        if not (
+            entry.get("inputs") == inputs_hash
+            and os.path.exists(output_path)
+            and file_sha256(output_path) == entry.get("output_sha256")
+        ):
+            stale.append((target, result, inputs_hash, entry.get("sections", {})))
+
+    if stale:
+        # Shared inputs are parsed once, however many targets are rendered
+        csv_data = load_resources(csv_path, load_overrides(template_dir))
+        groups = group_resources(csv_data)
+
+        def render(job):
+            target, result, inputs_hash, cached_sections = job
+            content, sections_cache, rendered, total = render_target(
+                target, template_dir, csv_data, groups, cached_sections
+            )
+            written, backup_path = write_if_changed(result["output"], content)
+            result.update(
+                status="written" if written else "identical",
+                resource_count=len(csv_data),
+                backup=backup_path,
+                rendered=rendered,
+                sections=total,
+            )
+            return result["output"], {
+                "inputs": inputs_hash,
+                "output_sha256": hashlib.sha256(content.encode("utf-8")).hexdigest(),
+                "resource_count": len(csv_data),
+                "sections": sections_cache,
+            }
+
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(stale)))) as pool:
+            outputs_cache.update(pool.map(render, stale))
+        save_render_cache(cache_path, {"outputs": outputs_cache})
+
+    for result in results:
+        name = os.path.basename(result["output"])
+        if result["status"] == "unchanged":
+            print(f"{name}: README inputs unchanged since the last generation; nothing to do")
+            continue
+        cached = result["sections"] - result["rendered"]
+        line = f"{name}: Rendered {result['rendered']} of {result['sections']} sections ({cached} from cache)"
+        if result["status"] == "identical":
+            line += "; content unchanged, file not rewritten"
+        print(line)
+    return results
+
+
+def generate_readme_from_templates(csv_path, template_dir, output_path, cache_path=DEFAULT_RENDER_CACHE, force=False):
+    """
+    Generate one README from the default template and structure.
+
+    See generate_readmes(): unchanged inputs skip rendering, unchanged output
+    skips the write and the backup. `force` ignores the cache, and
+    `cache_path=None` disables it.
+    Returns (active resource count, backup path or None).
+    """
+    target = {**DEFAULT_TARGET, "output": os.path.abspath(output_path)}
+    (result,) = generate_readmes(csv_path, template_dir, [target], cache_path=cache_path, force=force)
+    return result["resource_count"], result["backup"]
 
 
 def main():
     """Main entry point."""
+    parser = argparse.ArgumentParser(description="Generate the READMEs from the resource CSV and templates")
+    parser.add_argument("--force", action="store_true", help="Render everything even if no input changed")
+    parser.add_argument(
+        "--locale",
+        action="append",
+        help=f"Only render this locale of templates/{LOCALES_FILE} (repeatable; default: all)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_RENDER_WORKERS,
+        help=f"Locales rendered in parallel (default: {DEFAULT_RENDER_WORKERS})",
+    )
+    args = parser.parse_args()
+
     script_dir = os.path.dirname(os.path.abspath(__file__))
     csv_path = os.path.join(script_dir, "..", "THE_RESOURCES_TABLE.csv")
     template_dir = os.path.join(script_dir, "..", "templates")
-    output_path = os.path.join(script_dir, "..", "README.md")
+
+    targets = load_locales(template_dir)
+    if args.locale:
+        unknown = set(args.locale) - {target["locale"] for target in targets}
+        if unknown:
+            parser.error(f"Unknown locales: {', '.join(sorted(unknown))}")
+        targets = [target for target in targets if target["locale"] in args.locale]
 
     print("=== Template-based README Generation ===")
     print("Generating README from templates and CSV...")
 
     try:
-        resource_count, backup_path = generate_readme_from_templates(csv_path, template_dir, output_path)
-        print(f"✅ README.md generated successfully at {os.path.abspath(output_path)}")
-        print(f"📊 Generated README with {resource_count} active resources")
-        if backup_path:
-            print(f"📁 Backup saved at: {backup_path}")
+        results = generate_readmes(csv_path, template_dir, targets, force=args.force, workers=args.workers)
+        for result in results:
+            print(f"✅ {result['locale']}: {result['output']} is up to date")
+            if result["backup"]:
+                print(f"📁 Backup saved at: {result['backup']}")
+        if results:
+            print(f"📊 Generated README with {results[0]['resource_count']} active resources")
     except Exception as e:
         print(f"❌ Error generating README: {e}")
         sys.exit(1)
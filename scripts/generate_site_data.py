@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Generate the JSON data bundle read by the static site (index.html/script.js).
+
+The bundle is built from the same inputs as README.md (THE_RESOURCES_TABLE.csv,
+resource overrides and templates/readme-structure.yaml) and written to data/:
+
+    data/site-data.json                 manifest: format version, content hash,
+                                        totals, license counts and one entry per
+                                        category (title, icon, description, count,
+                                        first document number, shard file)
+    data/categories/<id>.<hash>.json    the resources of one category
+    data/search/index.<hash>.json       trigram index over name, author and
+                                        description
+
+Resources are numbered in manifest order, so document n lives in the category
+whose [offset, offset + count) range contains it, at position n - offset. The
+search index maps every trigram of the normalized (lower-cased, whitespace
+collapsed) text to the delta-encoded, ascending list of documents containing
+it: a query is answered by intersecting the postings of its trigrams and then
+loading only the shards of the candidates. Shard and index file names carry a
+content hash, so browsers can cache them forever and a regeneration only
+rewrites files whose content changed.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+
+try:
+    from atomic_io import atomic_write  # type: ignore[import-not-found]
+    from generate_readme import load_overrides, load_resources, load_structure  # type: ignore[import-not-found]
+except ImportError:
+    from .atomic_io import atomic_write
+    from .generate_readme import load_overrides, load_resources, load_structure
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_OUTPUT_DIR = os.path.join(REPO_ROOT, "data")
+MANIFEST_NAME = "site-data.json"
+SITE_DATA_VERSION = 1
+NGRAM_SIZE = 3
+SEARCH_FIELDS = ("name", "author", "description")
+
+
+def normalize_text(text):
+    """Lower-case `text` and collapse whitespace, as the site does with queries."""
+    return " ".join(text.lower().split())
+
+
+def trigrams(text):
+    """The distinct NGRAM_SIZE-character substrings of the normalized text."""
+    text = normalize_text(text)
+    return {text[i : i + NGRAM_SIZE] for i in range(len(text) - NGRAM_SIZE + 1)}
+
+
+def slugify(text):
+    return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-") or "other"
+
+
+def resource_document(row):
+    """The fields of a resource row the site displays, with empty fields dropped."""
+    document = {
+        "id": row.get("ID", ""),
+        "name": row["Display Name"],
+        "url": row["Primary Link"],
+        "subcategory": row.get("Sub-Category", "").strip(),
+        "author": row.get("Author Name", "").strip(),
+        "authorUrl": row.get("Author Link", "").strip(),
+        "license": row.get("License", "").strip().replace("NOT_FOUND", ""),
+        "description": row.get("Description", "").strip(),
+    }
+    return {key: value for key, value in document.items() if value}
+
+
+def group_categories(csv_data, structure):
+    """
+    Group resource documents by category, in the order of the README structure;
+    categories missing from the structure follow in CSV order.
+    """
+    categories = {}
+    for section in structure.get("sections", []):
+        if section.get("source") == "csv":
+            categories[section["category"]] = {
+                "id": section.get("id") or slugify(section["category"]),
+                "title": section.get("title", section["category"]),
+                "icon": section.get("icon", ""),
+                "description": section.get("description", "").strip(),
+                "resources": [],
+            }
+    for row in csv_data:
+        category = row["Category"]
+        if category not in categories:
+            categories[category] = {
+                "id": slugify(category),
+                "title": category,
+                "icon": "",
+                "description": "",
+                "resources": [],
+            }
+        categories[category]["resources"].append(resource_document(row))
+    return [category for category in categories.values() if category["resources"]]
+
+
+def delta_encode(numbers):
+    """Ascending numbers as the first number followed by the gaps between neighbours."""
+    previous = 0
+    encoded = []
+    for number in numbers:
+        encoded.append(number - previous)
+        previous = number
+    return encoded
+
+
+def build_search_index(documents):
+    """Trigram -> delta-encoded ascending document numbers, over SEARCH_FIELDS of `documents`."""
+    postings = {}
+    for number, document in enumerate(documents):
+        text = " ".join(document.get(field, "") for field in SEARCH_FIELDS)
+        for gram in trigrams(text):
+            postings.setdefault(gram, []).append(number)
+    return {
+        "version": SITE_DATA_VERSION,
+        "ngram": NGRAM_SIZE,
+        "fields": list(SEARCH_FIELDS),
+        "documents": len(documents),
+        "trigrams": {gram: delta_encode(numbers) for gram, numbers in sorted(postings.items())},
+    }
+
+
+def search_candidates(index, query):
+    """
+    Document numbers whose indexed text contains every trigram of `query`, the
+    same lookup script.js performs. Returns None for queries shorter than a
+    trigram, which the index cannot answer.
+    """
+    grams = trigrams(query)
+    if not grams:
+        return None
+    result = None
+    for gram in grams:
+        numbers = set()
+        number = 0
+        for gap in index["trigrams"].get(gram, []):
+            number += gap
+            numbers.add(number)
+        result = numbers if result is None else result & numbers
+        if not result:
+            break
+    return sorted(result)
+
+
+def dump_compact(data):
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"), sort_keys=True) + "\n"
+
+
+def hashed_name(prefix, content):
+    return f"{prefix}.{hashlib.sha256(content.encode('utf-8')).hexdigest()[:12]}.json"
+
+
+def build_bundle(csv_data, structure):
+    """
+    Build the bundle in memory. Returns {relative path: file content}; the
+    manifest is under MANIFEST_NAME.
+    """
+    files = {}
+    manifest_categories = []
+    documents = []
+    licenses = {}
+    for category in group_categories(csv_data, structure):
+        resources = category["resources"]
+        shard = dump_compact({"version": SITE_DATA_VERSION, "category": category["id"], "resources": resources})
+        shard_path = f"categories/{hashed_name(category['id'], shard)}"
+        files[shard_path] = shard
+        manifest_categories.append(
+            {
+                "id": category["id"],
+                "title": category["title"],
+                "icon": category["icon"],
+                "description": category["description"],
+                "count": len(resources),
+                "offset": len(documents),
+                "shard": shard_path,
+            }
+        )
+        documents.extend(resources)
+        for resource in resources:
+            license_name = resource.get("license", "")
+            licenses[license_name] = licenses.get(license_name, 0) + 1
+
+    index = dump_compact(build_search_index(documents))
+    index_path = f"search/{hashed_name('index', index)}"
+    files[index_path] = index
+
+    content_hash = hashlib.sha256("".join(files[path] for path in sorted(files)).encode("utf-8")).hexdigest()
+    files[MANIFEST_NAME] = (
+        json.dumps(
+            {
+                "version": SITE_DATA_VERSION,
+                "hash": content_hash,
+                "total": len(documents),
+                "licenses": licenses,
+                "categories": manifest_categories,
+                "search": index_path,
+            },
+            ensure_ascii=False,
+            indent=1,
+            sort_keys=True,
+        )
+        + "\n"
+    )
+    return files
+
+
+def write_bundle(files, output_dir):
+    """
+    Write the bundle to `output_dir`, rewriting only files whose content changed
+    and removing shards and indexes no longer referenced. Returns (written, removed).
+    """
+    written = 0
+    for relative, content in files.items():
+        path = os.path.join(output_dir, relative)
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                if f.read() == content:
+                    continue
+        with atomic_write(path, newline="") as f:
+            f.write(content)
+        written += 1
+
+    removed = 0
+    for subdir in ("categories", "search"):
+        directory = os.path.join(output_dir, subdir)
+        if not os.path.isdir(directory):
+            continue
+        for name in os.listdir(directory):
+            if f"{subdir}/{name}" not in files and name.endswith(".json"):
+                os.remove(os.path.join(directory, name))
+                removed += 1
+    return written, removed
+
+
+def generate_site_data(csv_path, template_dir, output_dir=DEFAULT_OUTPUT_DIR):
+    """Build the bundle from the CSV and templates and write it. Returns (resources, written, removed)."""
+    csv_data = load_resources(csv_path, load_overrides(template_dir))
+    structure = load_structure(os.path.join(template_dir, "readme-structure.yaml"))
+    files = build_bundle(csv_data, structure)
+    written, removed = write_bundle(files, output_dir)
+    return len(csv_data), written, removed
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Generate the static site's JSON data bundle and search index")
+    parser.add_argument("--output-dir", default=DEFAULT_OUTPUT_DIR, help="Bundle directory (default: data/)")
+    args = parser.parse_args()
+
+    csv_path = os.path.join(REPO_ROOT, "THE_RESOURCES_TABLE.csv")
+    template_dir = os.path.join(REPO_ROOT, "templates")
+
+    print("=== Site Data Generation ===")
+    try:
+        resource_count, written, removed = generate_site_data(csv_path, template_dir, args.output_dir)
+    except Exception as e:
+        print(f"❌ Error generating site data: {e}")
+        sys.exit(1)
+    print(f"✅ Site data for {resource_count} active resources in {os.path.abspath(args.output_dir)}")
+    print(f"   {written} files written, {removed} stale files removed")
+
+
+if __name__ == "__main__":
+    main()
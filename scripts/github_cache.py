@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Persistent on-disk cache for GitHub API responses.
+
+Responses to GET requests against api.github.com are stored in SQLite under
+.myob/cache/, keyed by request URL, Accept header and auth scope (a hash of the
+Authorization header, so different tokens never share entries).
+
+- Fresh entries (younger than `fresh_seconds`) are served without a request
+- Stale entries are revalidated with If-None-Match / If-Modified-Since; a 304
+  answer costs nothing against GitHub's rate limit and reuses the stored body
+- Entries older than `max_age_seconds` are evicted, and the least recently used
+  entries are evicted once the cache grows past `max_bytes`
+
+The cache plugs into http_client.PooledSession, so every script using the
+shared session benefits without code changes.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_CACHE_PATH = os.path.join(REPO_ROOT, ".myob", "cache", "github-api.sqlite")
+DEFAULT_FRESH_SECONDS = 60 * 60  # serve without revalidation for an hour
+DEFAULT_MAX_AGE_SECONDS = 7 * 24 * 60 * 60  # evict after a week
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+CACHEABLE_HOSTS = {"api.github.com"}
+# Endpoints whose answer must always be live
+UNCACHEABLE_PATHS = {"/rate_limit"}
+
+# Response headers worth replaying; rate limit headers would be stale
+STORED_HEADERS = ("Content-Type", "ETag", "Last-Modified", "Link", "X-GitHub-Media-Type")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    auth_scope TEXT NOT NULL,
+    status INTEGER NOT NULL,
+    headers TEXT NOT NULL,
+    body BLOB NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    fetched_at REAL NOT NULL,
+    last_used REAL NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used);
+CREATE INDEX IF NOT EXISTS responses_fetched_at ON responses (fetched_at);
+"""
+
+
+def auth_scope(headers):
+    """Short, non-reversible identifier for the credentials a request was made with."""
+    authorization = headers.get("Authorization")
+    if not authorization:
+        return "anonymous"
+    return hashlib.sha256(authorization.encode("utf-8")).hexdigest()[:16]
+
+
+class ResponseCache:
+    """SQLite-backed HTTP response cache with conditional revalidation."""
+
+    def __init__(
+        self,
+        path=DEFAULT_CACHE_PATH,
+        fresh_seconds=DEFAULT_FRESH_SECONDS,
+        max_age_seconds=DEFAULT_MAX_AGE_SECONDS,
+        max_bytes=DEFAULT_MAX_BYTES,
+        hosts=CACHEABLE_HOSTS,
+    ):
+        self.path = path
+        self.fresh_seconds = fresh_seconds
+        self.max_age_seconds = max_age_seconds
+        self.max_bytes = max_bytes
+        self.hosts = set(hosts)
+        self.stats = {"hits": 0, "misses": 0, "revalidated": 0, "stored": 0, "evicted": 0}
+        self._lock = threading.Lock()
+        self._conn = None
+
+    def _connection(self):
+        # Opened lazily so that creating a session never touches the disk
+        if self._conn is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.executescript(SCHEMA)
+        return self._conn
+
+    def is_cacheable(self, request):
+        """Only unconditional GET requests to the configured hosts are cached."""
+        if request.method != "GET":
+            return False
+        if "If-None-Match" in request.headers or "If-Modified-Since" in request.headers:
+            return False
+        parsed = requests.utils.urlparse(request.url)
+        return parsed.hostname in self.hosts and parsed.path not in UNCACHEABLE_PATHS
+
+    def make_key(self, request):
+        accept = request.headers.get("Accept", "")
+        raw_key = f"{request.method} {request.url}\nAccept: {accept}\nScope: {auth_scope(request.headers)}"
+        return hashlib.sha256(raw_key.encode("utf-8")).hexdigest()
+
+    def send(self, request, send_network):
+        """
+        Answer `request` from the cache where possible.
+        `send_network(request)` performs the real request when needed.
+        """
+        key = self.make_key(request)
+        now = time.time()
+        with self._lock:
+            entry = (
+                self._connection()
+                .execute(
+                    "SELECT status, headers, body, etag, last_modified, fetched_at FROM responses WHERE key = ?",
+                    (key,),
+                )
+                .fetchone()
+            )
+
+        if entry is not None:
+            status, headers, body, etag, last_modified, fetched_at = entry
+            if now - fetched_at < self.fresh_seconds:
+                self._touch(key, now, refetched=False)
+                self._count("hits")
+                return self._build_response(request, status, json.loads(headers), body)
+
+            # Stale: ask GitHub whether it changed
+            if etag:
+                request.headers["If-None-Match"] = etag
+            if last_modified:
+                request.headers["If-Modified-Since"] = last_modified
+
+        response = send_network(request)
+        request.headers.pop("If-None-Match", None)
+        request.headers.pop("If-Modified-Since", None)
+
+        if entry is not None and response.status_code == 304:
+            # Release the pooled connection; the 304 itself is replaced by the cached response
+            response.close()
+            self._touch(key, now, refetched=True)
+            self._count("revalidated")
+            status, headers, body = entry[0], entry[1], entry[2]
+            return self._build_response(request, status, json.loads(headers), body)
+
+        self._count("misses")
+        if response.status_code == 200:
+            self._store(key, request, response, now)
+        return response
+
+    def _build_response(self, request, status, headers, body):
+        response = requests.Response()
+        response.status_code = status
+        response.reason = "OK"
+        response.headers = CaseInsensitiveDict(headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = request.url
+        response.request = request
+        response._content = body
+        response._content_consumed = True
+        return response
+
+    def _store(self, key, request, response, now):
+        headers = {name: response.headers[name] for name in STORED_HEADERS if name in response.headers}
+        body = response.content
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, url, auth_scope, status, headers, body, etag, last_modified, fetched_at, last_used, size) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    request.url,
+                    auth_scope(request.headers),
+                    response.status_code,
+                    json.dumps(headers),
+                    body,
+                    response.headers.get("ETag"),
+                    response.headers.get("Last-Modified"),
+                    now,
+                    now,
+                    len(body),
+                ),
+            )
+            conn.commit()
+            self.stats["stored"] += 1
+
+    def _touch(self, key, now, refetched):
+        with self._lock:
+            conn = self._connection()
+            if refetched:
+                conn.execute("UPDATE responses SET fetched_at = ?, last_used = ? WHERE key = ?", (now, now, key))
+            else:
+                conn.execute("UPDATE responses SET last_used = ? WHERE key = ?", (now, key))
+            conn.commit()
+
+    def _count(self, counter):
+        with self._lock:
+            self.stats[counter] += 1
+
+    def prune(self):
+        """Evict expired entries, then least recently used ones until under max_bytes."""
+        if self._conn is None and not os.path.exists(self.path):
+            return 0
+        with self._lock:
+            conn = self._connection()
+            cutoff = time.time() - self.max_age_seconds
+            evicted = conn.execute("DELETE FROM responses WHERE fetched_at < ?", (cutoff,)).rowcount
+
+            total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+            if total > self.max_bytes:
+                for key, size in conn.execute("SELECT key, size FROM responses ORDER BY last_used").fetchall():
+                    if total <= self.max_bytes:
+                        break
+                    conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    total -= size
+                    evicted += 1
+            conn.commit()
+            self.stats["evicted"] += evicted
+            return evicted
+
+    def close(self):
+        """Prune and close the underlying database."""
+        self.prune()
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+def default_cache(fresh_seconds=DEFAULT_FRESH_SECONDS):
+    """
+    Cache used by the shared session. AWESOME_CC_HTTP_CACHE can point it at another
+    file, or disable it with "off".
+    """
+    location = os.environ.get("AWESOME_CC_HTTP_CACHE", DEFAULT_CACHE_PATH)
+    if location.lower() in ("off", "0", "false", ""):
+        return None
+    return ResponseCache(location, fresh_seconds=fresh_seconds)
+
+
+def format_cache_stats(stats):
+    """One-line summary of cache effectiveness for script output."""
+    return (
+        f"{stats['hits']} hits, {stats['revalidated']} revalidated (304), "
+        f"{stats['misses']} misses, {stats['evicted']} evicted"
+    )
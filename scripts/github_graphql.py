@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Batched GitHub metadata lookups through the GraphQL API.
+
+The REST validator needs three calls per GitHub row (repo endpoint, license,
+latest commit). This module resolves the same facts - whether the repository
+(and file) exists, its SPDX license and the date of the latest commit touching
+the given path - for dozens of repositories in a single GraphQL query.
+
+The GraphQL API requires authentication; without a token callers should fall
+back to the per-row REST calls.
+"""
+
+import json
+import re
+from datetime import datetime
+
+GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
+DEFAULT_BATCH_SIZE = 50
+
+# Same URL shapes validate_links.parse_github_url() turns into API calls
+FILE_URL_PATTERN = re.compile(r"https://github\.com/([^/]+)/([^/]+)/blob/([^/]+)/(.+)")
+REPO_URL_PATTERN = re.compile(r"https://github\.com/([^/]+)/([^/]+)/?$")
+
+
+def parse_github_ref(url):
+    """
+    Parse a GitHub file or repository URL into an (owner, repo, ref, path) key.
+    ref and path are None for repository root URLs. Returns None for other URLs.
+    """
+    match = FILE_URL_PATTERN.match(url)
+    if match:
+        owner, repo, ref, path = match.groups()
+        return owner, repo, ref, path
+
+    match = REPO_URL_PATTERN.match(url)
+    if match:
+        owner, repo = match.groups()
+        return owner, repo, None, None
+
+    return None
+
+
+def format_commit_date(commit_date):
+    """Format an ISO commit date as YYYY-MM-DD:HH-MM-SS (the CSV's Last Modified format)."""
+    dt = datetime.fromisoformat(commit_date.replace("Z", "+00:00"))
+    return dt.strftime("%Y-%m-%d:%H-%M-%S")
+
+
+def build_query(keys):
+    """Build one GraphQL query with an aliased repository() selection per key."""
+    selections = []
+    for index, (owner, repo, ref, path) in enumerate(keys):
+        if ref is None:
+            history = "defaultBranchRef { target { ... on Commit { history(first: 1) { nodes { committedDate } } } } }"
+            file_check = ""
+        else:
+            history = (
+                f"commit: object(expression: {json.dumps(ref)}) {{ ... on Commit {{ "
+                f"history(first: 1, path: {json.dumps(path)}) {{ nodes {{ committedDate }} }} }} }}"
+            )
+            file_check = f"file: object(expression: {json.dumps(f'{ref}:{path}')}) {{ __typename }}"
+        selections.append(
+            f"r{index}: repository(owner: {json.dumps(owner)}, name: {json.dumps(repo)}) "
+            f"{{ licenseInfo {{ spdxId }} {history} {file_check} }}"
+        )
+    return "query {\n  " + "\n  ".join(selections) + "\n}"
+
+
+def parse_repository_node(node, key):
+    """Turn one aliased repository() result into a metadata dict."""
+    if node is None:
+        return {"exists": False, "license": "NOT_FOUND", "last_modified": None}
+
+    _, _, ref, _ = key
+    license_info = node.get("licenseInfo") or {}
+    if ref is None:
+        target = (node.get("defaultBranchRef") or {}).get("target") or {}
+        exists = True
+    else:
+        target = node.get("commit") or {}
+        exists = node.get("file") is not None
+
+    commits = (target.get("history") or {}).get("nodes") or []
+    committed_date = commits[0].get("committedDate") if commits else None
+
+    return {
+        "exists": exists,
+        "license": license_info.get("spdxId") or "NOT_FOUND",
+        "last_modified": format_commit_date(committed_date) if committed_date else None,
+    }
+
+
+def fetch_metadata_batch(keys, session, headers, endpoint=GITHUB_GRAPHQL_URL, timeout=30):
+    """
+    Resolve metadata for one batch of keys with a single GraphQL request.
+    Returns {key: metadata}; keys are missing from the result if the request failed.
+    """
+    response = session.post(endpoint, headers=headers, json={"query": build_query(keys)}, timeout=timeout)
+    if response.status_code != 200:
+        print(f"GraphQL metadata request failed: {response.status_code}")
+        return {}
+
+    payload = response.json()
+    data = payload.get("data")
+    if not data:
+        print(f"GraphQL metadata request returned no data: {payload.get('errors')}")
+        return {}
+
+    failed_aliases = set()
+    for error in payload.get("errors") or []:
+        # NOT_FOUND just means the repository is gone; anything else makes the alias unreliable
+        if error.get("type") != "NOT_FOUND":
+            failed_aliases.update(str(part) for part in error.get("path") or [])
+
+    results = {}
+    for index, key in enumerate(keys):
+        alias = f"r{index}"
+        if alias in data and alias not in failed_aliases:
+            results[key] = parse_repository_node(data[alias], key)
+    return results
+
+
+def prefetch_github_metadata(urls, session, headers, batch_size=DEFAULT_BATCH_SIZE, endpoint=GITHUB_GRAPHQL_URL):
+    """
+    Resolve existence, license and last-modified date for every GitHub URL in `urls`.
+
+    Duplicate repositories/paths are queried once. Returns ({url: metadata}, stats)
+    where stats counts the GraphQL queries issued and the URLs resolved.
+    """
+    keys_by_url = {}
+    for url in urls:
+        key = parse_github_ref(url) if url else None
+        if key:
+            keys_by_url[url] = key
+
+    unique_keys = list(dict.fromkeys(keys_by_url.values()))
+    metadata_by_key = {}
+    queries = 0
+    for start in range(0, len(unique_keys), batch_size):
+        batch = unique_keys[start : start + batch_size]
+        queries += 1
+        try:
+            metadata_by_key.update(fetch_metadata_batch(batch, session, headers, endpoint))
+        except Exception as e:
+            print(f"GraphQL metadata request failed: {e}")
+
+    metadata = {url: metadata_by_key[key] for url, key in keys_by_url.items() if key in metadata_by_key}
+    stats = {"queries": queries, "repositories": len(unique_keys), "resolved": len(metadata)}
+    return metadata, stats
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Pooled HTTP session shared by the validation and download scripts.
+
+A single requests.Session keeps connections alive between requests, so a
+GitHub row that needs the repo endpoint, the license and the latest commit
+reuses one TLS connection to api.github.com instead of opening three.
+
+The session counts how many connections were opened and how many requests
+reused an existing connection, so scripts can report it in their summary.
+The shared session also answers GitHub API requests from the persistent
+response cache in github_cache.py, and paces the requests that do reach
+api.github.com through the shared rate_limiter.RateLimiter.
+"""
+
+import os
+import threading
+from functools import partial
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+try:
+    from github_cache import DEFAULT_FRESH_SECONDS, default_cache  # type: ignore[import-not-found]
+    from rate_limiter import (  # type: ignore[import-not-found]
+        RATE_LIMITED_HOSTS,
+        get_shared_rate_limiter,
+        resource_for_url,
+    )
+except ImportError:
+    from .github_cache import DEFAULT_FRESH_SECONDS, default_cache
+    from .rate_limiter import RATE_LIMITED_HOSTS, get_shared_rate_limiter, resource_for_url
+
+# Number of per-host connection pools kept alive
+DEFAULT_POOL_CONNECTIONS = 10
+# Maximum number of connections kept (and used concurrently) per host
+DEFAULT_POOL_MAXSIZE = 16
+
+
+class ConnectionStats:
+    """Thread-safe counters for requests sent and connections opened."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.connections_opened = 0
+
+    def record_request(self):
+        with self._lock:
+            self.requests += 1
+
+    def record_connection(self):
+        with self._lock:
+            self.connections_opened += 1
+
+    @property
+    def connections_reused(self) -> int:
+        """Requests that were sent over an already open connection."""
+        return max(self.requests - self.connections_opened, 0)
+
+    def as_dict(self) -> dict[str, int]:
+        return {
+            "requests": self.requests,
+            "connections_opened": self.connections_opened,
+            "connections_reused": self.connections_reused,
+        }
+
+
+class CountingHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter that records every request and every new connection in a ConnectionStats,
+    routes cacheable requests through an optional github_cache.ResponseCache and paces
+    GitHub API requests with an optional rate_limiter.RateLimiter.
+    """
+
+    def __init__(self, stats: ConnectionStats, cache=None, rate_limiter=None, **kwargs):
+        # init_poolmanager() runs inside HTTPAdapter.__init__, so stats must exist first
+        self.stats = stats
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        stats = self.stats
+
+        class CountingHTTPConnectionPool(HTTPConnectionPool):
+            def _new_conn(self):
+                stats.record_connection()
+                return super()._new_conn()
+
+        class CountingHTTPSConnectionPool(HTTPSConnectionPool):
+            def _new_conn(self):
+                stats.record_connection()
+                return super()._new_conn()
+
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": CountingHTTPConnectionPool,
+            "https": CountingHTTPSConnectionPool,
+        }
+
+    def send(self, request, **kwargs):
+        # Streamed bodies are never buffered into the cache
+        if self.cache is not None and not kwargs.get("stream") and self.cache.is_cacheable(request):
+            return self.cache.send(request, partial(self._send_network, **kwargs))
+        return self._send_network(request, **kwargs)
+
+    def _send_network(self, request, **kwargs):
+        limiter = self.rate_limiter
+        if limiter is None or requests.utils.urlparse(request.url).hostname not in RATE_LIMITED_HOSTS:
+            self.stats.record_request()
+            return super().send(request, **kwargs)
+
+        # Cache hits never get here, so they cost no tokens
+        resource = resource_for_url(request.url)
+        limiter.acquire(resource)
+        self.stats.record_request()
+        response = super().send(request, **kwargs)
+        limiter.update_from_response(response, resource)
+        return response
+
+
+class PooledSession(requests.Session):
+    """
+    requests.Session with keep-alive connection pooling and connection statistics.
+
+    Args:
+        pool_connections: Number of per-host pools to keep alive
+        pool_maxsize: Maximum connections per host; further requests to the
+            same host wait for a free connection
+        cache: Optional github_cache.ResponseCache for GitHub API responses
+        rate_limiter: Optional rate_limiter.RateLimiter pacing GitHub API requests
+        **adapter_kwargs: Extra arguments for `adapter_class` (see http_fixtures.py)
+    """
+
+    adapter_class: type[CountingHTTPAdapter] = CountingHTTPAdapter
+
+    def __init__(
+        self,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        cache=None,
+        rate_limiter=None,
+        **adapter_kwargs,
+    ):
+        super().__init__()
+        self.stats = ConnectionStats()
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        adapter = self.adapter_class(
+            self.stats,
+            cache=cache,
+            rate_limiter=rate_limiter,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=True,
+            **adapter_kwargs,
+        )
+        self.mount("https://", adapter)
+        self.mount("http://", adapter)
+
+    def cache_stats(self) -> dict[str, int]:
+        """Cache counters, or an empty dict when caching is disabled."""
+        return dict(self.cache.stats) if self.cache is not None else {}
+
+    def close(self):
+        super().close()
+        if self.cache is not None:
+            self.cache.close()
+
+
+_shared_session: PooledSession | None = None
+_shared_lock = threading.Lock()
+
+
+def _new_session(pool_connections, pool_maxsize, cache) -> PooledSession:
+    """
+    Build a shared session. AWESOME_CC_HTTP_REPLAY (a replay server URL) and
+    AWESOME_CC_HTTP_RECORD (a fixture file) switch to http_fixtures.FixtureSession.
+    """
+    replay_url = os.environ.get("AWESOME_CC_HTTP_REPLAY")
+    record_path = os.environ.get("AWESOME_CC_HTTP_RECORD")
+    if replay_url or record_path:
+        try:
+            from http_fixtures import FixtureSession  # type: ignore[import-not-found]
+        except ImportError:
+            from .http_fixtures import FixtureSession
+
+        return FixtureSession(
+            replay_url=replay_url,
+            record_path=record_path,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            cache=cache,
+            rate_limiter=get_shared_rate_limiter(),
+        )
+    return PooledSession(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        cache=cache,
+        rate_limiter=get_shared_rate_limiter(),
+    )
+
+
+def configure_shared_session(
+    pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+    use_cache: bool = True,
+    cache_fresh_seconds: int = DEFAULT_FRESH_SECONDS,
+) -> PooledSession:
+    """Replace the shared session with one using the given pool sizes and cache settings."""
+    global _shared_session
+    with _shared_lock:
+        if _shared_session is not None:
+            _shared_session.close()
+        cache = default_cache(cache_fresh_seconds) if use_cache else None
+        _shared_session = _new_session(pool_connections, pool_maxsize, cache)
+        return _shared_session
+
+
+def get_shared_session() -> PooledSession:
+    """Return the process-wide pooled session, creating it on first use."""
+    global _shared_session
+    with _shared_lock:
+        if _shared_session is None:
+            _shared_session = _new_session(DEFAULT_POOL_CONNECTIONS, DEFAULT_POOL_MAXSIZE, default_cache())
+        return _shared_session
+
+
+def format_connection_stats(stats: ConnectionStats) -> str:
+    """One-line summary of connection reuse for script output."""
+    opened, reused = stats.connections_opened, stats.connections_reused
+    return f"{stats.requests} requests, {opened} connections opened, {reused} reused"
@@ -0,0 +1,386 @@
+#!/usr/bin/env python3
+"""
+Record/replay layer for the scripts' HTTP traffic.
+
+- Recording: a FixtureSession with `record_path` stores every exchange it makes
+  (GitHub API calls, HEAD checks, raw downloads) in a JSON fixture file.
+- Replaying: ReplayServer is a local stand-in that answers from a fixture file,
+  optionally synthesizes plausible GitHub answers for unknown URLs, and can add
+  latency and inject 5xx / 429 responses. A FixtureSession with `replay_url`
+  sends every request to it while the scripts keep using the real URLs.
+
+The shared session of http_client.py switches to a FixtureSession when
+AWESOME_CC_HTTP_RECORD or AWESOME_CC_HTTP_REPLAY is set, so whole script runs
+can be recorded and replayed:
+
+    AWESOME_CC_HTTP_RECORD=fixtures.json python scripts/validate_links.py --max-links 20
+    python scripts/http_fixtures.py serve fixtures.json --port 8765 --latency 0.05
+    AWESOME_CC_HTTP_REPLAY=http://127.0.0.1:8765 python scripts/validate_links.py --max-links 20
+"""
+
+import argparse
+import atexit
+import base64
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+from requests.adapters import HTTPAdapter
+
+try:
+    from atomic_io import atomic_write  # type: ignore[import-not-found]
+    from http_client import CountingHTTPAdapter, PooledSession  # type: ignore[import-not-found]
+except ImportError:
+    from .atomic_io import atomic_write
+    from .http_client import CountingHTTPAdapter, PooledSession
+
+FIXTURE_VERSION = 1
+# Headers that describe the original transfer rather than the response
+SKIPPED_HEADERS = {
+    "connection",
+    "content-encoding",
+    "content-length",
+    "date",
+    "keep-alive",
+    "set-cookie",
+    "transfer-encoding",
+}
+SYNTHETIC_COMMIT_DATE = "2025-01-01T00:00:00Z"
+
+
+def fixture_key(method, url, body=None):
+    """Lookup key of an exchange; request bodies (GraphQL queries) are part of it."""
+    key = f"{method.upper()} {url}"
+    if body:
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        key += " " + hashlib.sha256(body).hexdigest()[:16]
+    return key
+
+
+def encode_body(content):
+    try:
+        return {"body": content.decode("utf-8")}
+    except UnicodeDecodeError:
+        return {"body_base64": base64.b64encode(content).decode("ascii")}
+
+
+def decode_body(exchange):
+    if "body_base64" in exchange:
+        return base64.b64decode(exchange["body_base64"])
+    return exchange.get("body", "").encode("utf-8")
+
+
+class FixtureStore:
+    """Thread-safe collection of recorded exchanges, keyed by fixture_key()."""
+
+    def __init__(self, exchanges=None):
+        self.exchanges = dict(exchanges or {})
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path):
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != FIXTURE_VERSION:
+            raise ValueError(f"Unsupported fixture version in {path}: {data.get('version')}")
+        return cls({exchange["key"]: exchange for exchange in data["exchanges"]})
+
+    def save(self, path):
+        with self._lock:
+            exchanges = [self.exchanges[key] for key in sorted(self.exchanges)]
+        with atomic_write(path) as f:
+            json.dump({"version": FIXTURE_VERSION, "exchanges": exchanges}, f, indent=1)
+
+    def record(self, request, response):
+        exchange = {
+            "key": fixture_key(request.method, request.url, request.body),
+            "status": response.status_code,
+            "headers": {name: value for name, value in response.headers.items() if name.lower() not in SKIPPED_HEADERS},
+            **encode_body(response.content),
+        }
+        with self._lock:
+            self.exchanges[exchange["key"]] = exchange
+
+    def lookup(self, method, url, body=None):
+        with self._lock:
+            return self.exchanges.get(fixture_key(method, url, body))
+
+
+class _FixtureTransport(HTTPAdapter):
+    """
+    Innermost layer of FixtureHTTPAdapter: records exchanges and/or routes them to a
+    replay server. Sits below CountingHTTPAdapter, so the cache, rate limiter and
+    connection statistics behave exactly as with the real network.
+    """
+
+    def __init__(self, replay_url=None, recorder=None, **kwargs):
+        self.replay_url = replay_url.rstrip("/") if replay_url else None
+        self.recorder = recorder
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        routed = request
+        if self.replay_url:
+            parts = urlsplit(request.url)
+            routed = request.copy()
+            routed.url = f"{self.replay_url}/{parts.scheme}/{parts.netloc}{parts.path or '/'}"
+            if parts.query:
+                routed.url += f"?{parts.query}"
+
+        response = super().send(routed, **kwargs)
+        if routed is not request:
+            response.url = request.url
+            response.request = request
+        if self.recorder is not None:
+            self.recorder.record(request, response)
+        return response
+
+
+class FixtureHTTPAdapter(CountingHTTPAdapter, _FixtureTransport):
+    """CountingHTTPAdapter whose network layer records and/or replays fixtures."""
+
+
+class FixtureSession(PooledSession):
+    """
+    PooledSession that records exchanges to `record_path` and/or sends every request
+    to the replay server at `replay_url`. Recordings are saved on close() and at exit.
+    """
+
+    adapter_class = FixtureHTTPAdapter
+
+    def __init__(self, replay_url=None, record_path=None, **kwargs):
+        recorder = FixtureStore() if record_path else None
+        super().__init__(replay_url=replay_url, recorder=recorder, **kwargs)
+        self.recorder = recorder
+        self.record_path = record_path
+        if recorder is not None:
+            atexit.register(self.save_fixtures)
+
+    def save_fixtures(self):
+        if self.recorder is not None and self.recorder.exchanges:
+            self.recorder.save(self.record_path)
+
+    def close(self):
+        self.save_fixtures()
+        super().close()
+
+
+def synthetic_response(method, url, body=None):
+    """
+    Plausible answer for a URL without a fixture: GitHub repository, license and
+    commit endpoints return the JSON the scripts read, everything else a small body.
+    Returns (status, headers, body_bytes).
+    """
+    parts = urlsplit(url)
+    headers = {"Content-Type": "application/json; charset=utf-8"}
+    if parts.hostname == "api.github.com":
+        headers.update(
+            {
+                "X-RateLimit-Limit": "5000",
+                "X-RateLimit-Remaining": "4999",
+                "X-RateLimit-Reset": str(int(time.time()) + 3600),
+                "X-RateLimit-Resource": "graphql" if parts.path == "/graphql" else "core",
+            }
+        )
+        path = parts.path
+        if path == "/rate_limit":
+            payload = {"rate": {"limit": 5000, "remaining": 4999, "reset": int(time.time()) + 3600}}
+        elif path == "/graphql":
+            payload = {"data": {}}
+        elif re.fullmatch(r"/repos/[^/]+/[^/]+", path):
+            payload = {"name": path.rsplit("/", 1)[1], "default_branch": "main", "license": {"spdx_id": "MIT"}}
+        elif re.fullmatch(r"/repos/[^/]+/[^/]+/commits", path):
+            payload = [{"sha": "0" * 40, "committer": {"date": SYNTHETIC_COMMIT_DATE}}]
+        elif "/contents/" in path:
+            headers["Content-Type"] = "text/plain; charset=utf-8"
+            return 200, headers, f"# Synthetic content of {path}\n".encode()
+        else:
+            payload = {"synthetic": True}
+        return 200, headers, json.dumps(payload).encode("utf-8")
+
+    headers["Content-Type"] = "text/plain; charset=utf-8"
+    return 200, headers, f"Synthetic content of {url}\n".encode()
+
+
+class _ReplayHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; without TCP_NODELAY each response
+    # waits on the client's delayed ACK and the server measures ~40ms per request
+    disable_nagle_algorithm = True
+
+    def _original_url(self):
+        # Paths look like /<scheme>/<host>/<path>?<query>
+        scheme, _, rest = self.path.lstrip("/").partition("/")
+        return f"{scheme}://{rest}"
+
+    def _respond(self, send_body):
+        length = int(self.headers.get("Content-Length") or 0)
+        request_body = self.rfile.read(length) if length else None
+        status, headers, body = self.server.replay.answer(self.command, self._original_url(), request_body)
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+
+    def do_GET(self):  # noqa: N802
+        self._respond(send_body=True)
+
+    def do_POST(self):  # noqa: N802
+        self._respond(send_body=True)
+
+    def do_HEAD(self):  # noqa: N802
+        self._respond(send_body=False)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class ReplayServer:
+    """
+    Local stand-in server answering from a FixtureStore.
+
+    Args:
+        fixtures: FixtureStore to replay (empty by default)
+        synthesize: Answer URLs without a fixture with synthetic_response() instead of 404
+        latency: Seconds added to every response; `jitter` adds up to that much more at random
+        error_rate: Fraction of requests answered with 503
+        rate_limit_rate: Fraction of requests answered with 429 and `Retry-After: retry_after`
+        seed: Seed for latency jitter and fault injection, so runs are repeatable
+    """
+
+    def __init__(
+        self,
+        fixtures=None,
+        synthesize=False,
+        latency=0.0,
+        jitter=0.0,
+        error_rate=0.0,
+        rate_limit_rate=0.0,
+        retry_after=0,
+        seed=0,
+        host="127.0.0.1",
+        port=0,
+    ):
+        self.fixtures = fixtures or FixtureStore()
+        self.synthesize = synthesize
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+        self.stats = {"requests": 0, "replayed": 0, "synthesized": 0, "misses": 0, "errors": 0, "rate_limited": 0}
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), _ReplayHandler)
+        self._server.daemon_threads = True
+        self._server.replay = self  # type: ignore[attr-defined]
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _count(self, counter):
+        with self._lock:
+            self.stats[counter] += 1
+
+    def answer(self, method, url, body=None):
+        """Pick the response for one request: injected fault, fixture, synthetic answer or 404."""
+        with self._lock:
+            self.stats["requests"] += 1
+            delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+            roll = self._random.random()
+        if delay:
+            time.sleep(delay)
+
+        if roll < self.error_rate:
+            self._count("errors")
+            return 503, {"Content-Type": "text/plain"}, b"Injected server error\n"
+        if roll < self.error_rate + self.rate_limit_rate:
+            self._count("rate_limited")
+            headers = {"Content-Type": "text/plain", "Retry-After": str(self.retry_after)}
+            return 429, headers, b"Injected rate limit\n"
+
+        # HEAD checks replay the matching GET recording when there is no HEAD one
+        exchange = self.fixtures.lookup(method, url, body) or (
+            self.fixtures.lookup("GET", url) if method == "HEAD" else None
+        )
+        if exchange is not None:
+            self._count("replayed")
+            return exchange["status"], exchange["headers"], decode_body(exchange)
+        if self.synthesize:
+            self._count("synthesized")
+            return synthetic_response(method, url, body)
+        self._count("misses")
+        return 404, {"Content-Type": "text/plain", "X-Fixture-Miss": "1"}, b"No fixture recorded\n"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        self._server.serve_forever()
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve recorded HTTP fixtures for replay")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    serve = subparsers.add_parser("serve", help="Run a replay server until interrupted")
+    serve.add_argument("fixtures", nargs="?", help="Fixture file written with AWESOME_CC_HTTP_RECORD")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8765)
+    serve.add_argument("--synthesize", action="store_true", help="Answer unknown URLs with synthetic responses")
+    serve.add_argument("--latency", type=float, default=0.0, help="Seconds added to every response")
+    serve.add_argument("--jitter", type=float, default=0.0, help="Random extra latency, up to this many seconds")
+    serve.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with 503")
+    serve.add_argument("--rate-limit-rate", type=float, default=0.0, help="Fraction of requests answered with 429")
+    serve.add_argument("--retry-after", type=int, default=0, help="Retry-After seconds sent with each 429")
+    serve.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    fixtures = FixtureStore.load(args.fixtures) if args.fixtures else None
+    server = ReplayServer(
+        fixtures,
+        synthesize=args.synthesize or fixtures is None,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        retry_after=args.retry_after,
+        seed=args.seed,
+        host=args.host,
+        port=args.port,
+    )
+    print(f"Replaying on {server.url} (set AWESOME_CC_HTTP_REPLAY={server.url})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._server.server_close()
+        print(json.dumps(server.stats))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Resource overrides from templates/resource-overrides.yaml, compiled once.
+
+The file maps resource IDs to field overrides, `<field>_locked` flags, notes and
+skip_validation. load_overrides() parses it with libyaml's CSafeLoader when
+PyYAML was built with it (the pure-Python SafeLoader otherwise) and compiles
+every entry into
+
+- the (CSV column, value) pairs to assign
+- the frozenset of locked fields, by override name ("license", "active", ...)
+- the skip_validation flag
+
+so applying the overrides to a row is one dict lookup by ID plus an assignment
+per overridden field. Compiled overrides are cached per process by file path
+and SHA-256 of its content; an edited file is parsed again.
+"""
+
+import hashlib
+import os
+import threading
+
+import yaml
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+OVERRIDE_FILE = os.path.join(REPO_ROOT, "templates", "resource-overrides.yaml")
+# Override name -> CSV column it sets
+FIELD_COLUMNS = {
+    "license": "License",
+    "active": "Active",
+    "description": "Description",
+    "last_checked": "Last Checked",
+    "last_modified": "Last Modified",
+}
+LOCKED_SUFFIX = "_locked"
+NO_LOCKS = frozenset()
+
+YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+class ResourceOverrides:
+    """Compiled overrides: resource ID -> (setters, locked fields, skip_validation)."""
+
+    __slots__ = ("data", "_entries")
+
+    def __init__(self, overrides=None):
+        self.data = overrides or {}
+        self._entries = {}
+        for resource_id, config in self.data.items():
+            config = config or {}
+            setters = tuple((FIELD_COLUMNS[field], value) for field, value in config.items() if field in FIELD_COLUMNS)
+            locked = frozenset(
+                field[: -len(LOCKED_SUFFIX)]
+                for field, value in config.items()
+                if field.endswith(LOCKED_SUFFIX) and value
+            )
+            self._entries[str(resource_id)] = (setters, locked, bool(config.get("skip_validation", False)))
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, resource_id):
+        return resource_id in self._entries
+
+    def apply(self, row, id_field="ID"):
+        """
+        Apply the overrides for the row's ID in place. Returns (row, locked
+        fields, skip_validation); rows without overrides come back unchanged.
+        """
+        entry = self._entries.get(row.get(id_field, ""))
+        if entry is None:
+            return row, NO_LOCKS, False
+        setters, locked, skip_validation = entry
+        for column, value in setters:
+            row[column] = value
+        return row, locked, skip_validation
+
+
+def compile_overrides(overrides):
+    """`overrides` as ResourceOverrides; a plain {ID: config} dict is compiled."""
+    if isinstance(overrides, ResourceOverrides):
+        return overrides
+    return ResourceOverrides(overrides)
+
+
+def parse_overrides(content):
+    """Compile the text of an overrides file."""
+    data = yaml.load(content, Loader=YamlLoader)
+    return ResourceOverrides((data or {}).get("overrides"))
+
+
+_cache = {}
+_cache_lock = threading.Lock()
+
+
+def load_overrides(path=OVERRIDE_FILE):
+    """
+    The compiled overrides in `path` (empty when the file does not exist),
+    parsed once per distinct file content.
+    """
+    if not os.path.exists(path):
+        return ResourceOverrides()
+    with open(path, "rb") as f:
+        content = f.read()
+    digest = hashlib.sha256(content).hexdigest()
+    key = os.path.abspath(path)
+    with _cache_lock:
+        cached = _cache.get(key)
+        if cached and cached[0] == digest:
+            return cached[1]
+    overrides = parse_overrides(content)
+    with _cache_lock:
+        _cache[key] = (digest, overrides)
+    return overrides
+
+
+def apply_overrides(row, overrides):
+    """Apply `overrides` (compiled or a plain dict) to `row`; returns (row, locked fields, skip_validation)."""
+    return compile_overrides(overrides).apply(row)
@@ -2,18 +2,41 @@
 """
 Parse GitHub Issue form data from resource submissions.
 Validates the data and returns structured JSON.
+
+Usage:
+    ISSUE_BODY="..." python scripts/parse_issue_form.py [--validate]
+
+Batch mode handles many submissions in one process and prints one JSON line
+per issue, in input order. The resource table and its indexes are loaded once
+and URLs of different issues are validated concurrently:
+
+    gh issue list --label resource-submission --json number,body --jq '.[]' |
+        python scripts/parse_issue_form.py --validate --batch
+    python scripts/parse_issue_form.py --validate --batch-dir issues/
+
+--batch reads NDJSON from stdin: objects with a "body" (and optionally a
+"number" or "id" identifying the issue) or bare JSON strings. --batch-dir reads
+one issue body per file.
 """
 
+import argparse
 import json
 import os
 import re
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
 
 try:
+    from resource_table import CSV_FILE, load_resource_table  # type: ignore[import-not-found]
     from validate_single_resource import validate_single_resource  # type: ignore[import-not-found]
 except ImportError:
+    from .resource_table import CSV_FILE, load_resource_table
     from .validate_single_resource import validate_single_resource
 
+DEFAULT_CONCURRENCY = 16
+
 
 def parse_issue_body(issue_body: str) -> dict[str, str]:
     """
@@ -183,86 +206,197 @@ def validate_parsed_data(data: dict[str, str]) -> tuple[bool, list[str], list[st
     return len(errors) == 0, errors, warnings
 
 
-def check_for_duplicates(data: dict[str, str]) -> list[str]:
+def check_for_duplicates(data: dict[str, str], csv_path: str | None = None) -> list[str]:
     """Check if resource already exists in the CSV."""
     warnings = []
 
-    csv_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "THE_RESOURCES_TABLE.csv")
+    csv_path = csv_path or CSV_FILE
     if not os.path.exists(csv_path):
         return warnings
 
-    import csv
-
-    primary_link = data.get("primary_link", "").lower()
-    display_name = data.get("display_name", "").lower()
+    table = load_resource_table(csv_path)
+    primary_link = data.get("primary_link", "")
+    display_name = data.get("display_name", "")
 
-    with open(csv_path, encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            # Check for duplicate URL
-            if row.get("Primary Link", "").lower() == primary_link:
-                warnings.append("A resource with this primary link " f"already exists: {row.get('Display Name')}")
-            # Check for similar names
-            elif row.get("Display Name", "").lower() == display_name:
-                warnings.append("A resource with the same name " f"already exists: {row.get('Display Name')}")
+    # Check for duplicate URL (same canonical form, see url_utils.canonicalize_url, ignoring case)
+    same_link = table.find_url(primary_link, ignore_case=True) if primary_link.strip() else []
+    for position in same_link:
+        warnings.append(f"A resource with this primary link already exists: {table.get(position, 'Display Name')}")
+    # Check for similar names
+    if display_name.strip():
+        for position in table.find_name(display_name):
+            if position not in same_link:
+                warnings.append(f"A resource with the same name already exists: {table.get(position, 'Display Name')}")
 
     return warnings
 
 
+def validate_issue(issue_body: str, csv_path: str | None = None, session=None) -> dict:
+    """
+    Parse and fully validate one issue body: form fields, duplicates against the
+    resource table and URL checks. Returns the --validate JSON result.
+    """
+    parsed_data = parse_issue_body(issue_body)
+    is_valid, errors, warnings = validate_parsed_data(parsed_data)
+
+    # Check for duplicates
+    duplicate_warnings = check_for_duplicates(parsed_data, csv_path)
+    warnings.extend(duplicate_warnings)
+
+    # If basic validation passed, do URL validation
+    if is_valid and parsed_data.get("primary_link"):
+        url_valid, enriched_data, url_errors = validate_single_resource(
+            primary_link=parsed_data.get("primary_link", ""),
+            secondary_link=parsed_data.get("secondary_link", ""),
+            display_name=parsed_data.get("display_name", ""),
+            category=parsed_data.get("category", ""),
+            license=parsed_data.get("license", "NOT_FOUND"),
+            subcategory=parsed_data.get("subcategory", ""),
+            author_name=parsed_data.get("author_name", ""),
+            author_link=parsed_data.get("author_link", ""),
+            description=parsed_data.get("description", ""),
+            session=session,
+        )
+
+        if not url_valid:
+            is_valid = False
+            errors.extend(url_errors)
+        else:
+            # Update with enriched data (license from GitHub, etc.)
+            parsed_data.update(enriched_data)
+
+    # Remove temporary tracking field
+    if "_original_display_name" in parsed_data:
+        del parsed_data["_original_display_name"]
+
+    return {"valid": is_valid, "errors": errors, "warnings": warnings, "data": parsed_data}
+
+
+def parse_only(issue_body: str) -> dict[str, str]:
+    """Parse an issue body without validating it (the default, non --validate output)."""
+    parsed_data = parse_issue_body(issue_body)
+    # Remove temporary tracking field
+    if "_original_display_name" in parsed_data:
+        del parsed_data["_original_display_name"]
+    return parsed_data
+
+
+def read_ndjson_issues(lines):
+    """
+    Yield (issue, body, error) for every non-blank NDJSON line. The issue is the
+    object's "number" or "id", else the line number; lines that hold no issue
+    come with a None body and an error message.
+    """
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            item = json.loads(line)
+        except ValueError as e:
+            yield line_number, None, f"Invalid JSON on line {line_number}: {e}"
+            continue
+        if isinstance(item, str):
+            yield line_number, item, None
+        elif isinstance(item, dict):
+            yield item.get("number", item.get("id", line_number)), item.get("body") or "", None
+        else:
+            yield line_number, None, f"Line {line_number} is neither an issue object nor a string"
+
+
+def read_issue_dir(directory):
+    """Yield (file name, body, None) for every file in `directory`, in name order."""
+    for name in sorted(os.listdir(directory)):
+        path = os.path.join(directory, name)
+        if os.path.isfile(path) and not name.startswith("."):
+            with open(path, encoding="utf-8") as f:
+                yield name, f.read(), None
+
+
+def failed_issue(issue, error):
+    return {"issue": issue, "valid": False, "errors": [error], "warnings": [], "data": {}}
+
+
+def process_issue(issue, issue_body, error, validate, csv_path, session):
+    """The batch result line for one issue."""
+    if error or not issue_body:
+        return failed_issue(issue, error or "No issue body provided")
+    if not validate:
+        return {"issue": issue, "data": parse_only(issue_body)}
+    try:
+        return {"issue": issue, **validate_issue(issue_body, csv_path, session)}
+    except Exception as e:
+        return failed_issue(issue, f"Validation failed: {e}")
+
+
+def validate_issues(issues, validate=True, csv_path=None, session=None, concurrency=DEFAULT_CONCURRENCY):
+    """
+    Process (issue, body, error) triples, at most `concurrency` at a time, and
+    yield their result dicts in input order. The resource table and the indexes
+    check_for_duplicates() uses are built once, before the workers start.
+    """
+    csv_path = csv_path or CSV_FILE
+    if validate and os.path.exists(csv_path):
+        load_resource_table(csv_path).build_indexes(("url_nocase", "name"))
+    with ThreadPoolExecutor(max_workers=max(1, concurrency), thread_name_prefix="issue") as executor:
+        futures = [
+            executor.submit(process_issue, issue, issue_body, error, validate, csv_path, session)
+            for issue, issue_body, error in issues
+        ]
+        for future in futures:
+            yield future.result()
+
+
+def run_batch(args) -> int:
+    """Batch mode: print one JSON result line per issue on stdout, progress and a summary on stderr."""
+    if args.batch_dir:
+        if not os.path.isdir(args.batch_dir):
+            print(f"Error: {args.batch_dir} is not a directory", file=sys.stderr)
+            return 1
+        issues = read_issue_dir(args.batch_dir)
+    else:
+        issues = read_ndjson_issues(sys.stdin)
+
+    output = sys.stdout
+    start = time.perf_counter()
+    total = valid = 0
+    # validate_single_resource reports progress with print(); keep stdout for the result lines
+    with redirect_stdout(sys.stderr):
+        for result in validate_issues(issues, args.validate, args.csv, concurrency=args.concurrency):
+            print(json.dumps(result), file=output, flush=True)
+            total += 1
+            valid += bool(result.get("valid", True))
+    label = "valid" if args.validate else "parsed"
+    print(f"Processed {total} issues ({valid} {label}) in {time.perf_counter() - start:.1f}s", file=sys.stderr)
+    return 0
+
+
 def main():
     """Main entry point for the script."""
+    parser = argparse.ArgumentParser(description="Parse and validate resource submission issue forms")
+    parser.add_argument("--validate", action="store_true", help="Validate the fields, duplicates and URLs")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--batch", action="store_true", help="Read issues as NDJSON from stdin")
+    source.add_argument("--batch-dir", help="Read one issue body per file in this directory")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Issues validated at once in batch mode (default: {DEFAULT_CONCURRENCY})",
+    )
+    parser.add_argument("--csv", help="Resource CSV checked for duplicates (default: THE_RESOURCES_TABLE.csv)")
+    args = parser.parse_args()
+
+    if args.batch or args.batch_dir:
+        return run_batch(args)
+
     # Get issue body from environment variable
     issue_body = os.environ.get("ISSUE_BODY", "")
     if not issue_body:
         print(json.dumps({"valid": False, "errors": ["No issue body provided"], "data": {}}))
         return 1
 
-    # Parse the issue body
-    parsed_data = parse_issue_body(issue_body)
-
-    # Check if --validate flag is passed
-    validate_mode = "--validate" in sys.argv
-
-    if validate_mode:
-        # Full validation mode
-        is_valid, errors, warnings = validate_parsed_data(parsed_data)
-
-        # Check for duplicates
-        duplicate_warnings = check_for_duplicates(parsed_data)
-        warnings.extend(duplicate_warnings)
-
-        # If basic validation passed, do URL validation
-        if is_valid and parsed_data.get("primary_link"):
-            url_valid, enriched_data, url_errors = validate_single_resource(
-                primary_link=parsed_data.get("primary_link", ""),
-                secondary_link=parsed_data.get("secondary_link", ""),
-                display_name=parsed_data.get("display_name", ""),
-                category=parsed_data.get("category", ""),
-                license=parsed_data.get("license", "NOT_FOUND"),
-                subcategory=parsed_data.get("subcategory", ""),
-                author_name=parsed_data.get("author_name", ""),
-                author_link=parsed_data.get("author_link", ""),
-                description=parsed_data.get("description", ""),
-            )
-
-            if not url_valid:
-                is_valid = False
-                errors.extend(url_errors)
-            else:
-                # Update with enriched data (license from GitHub, etc.)
-                parsed_data.update(enriched_data)
-
-        # Remove temporary tracking field
-        if "_original_display_name" in parsed_data:
-            del parsed_data["_original_display_name"]
-
-        result = {"valid": is_valid, "errors": errors, "warnings": warnings, "data": parsed_data}
-    else:
-        # Simple parse mode - just return the parsed data
-        # Remove temporary tracking field
-        if "_original_display_name" in parsed_data:
-            del parsed_data["_original_display_name"]
-        result = parsed_data
+    # Full validation mode, or simple parse mode that just returns the parsed data
+    result = validate_issue(issue_body, args.csv) if args.validate else parse_only(issue_body)
 
     # Print compact JSON (no newlines) to make it easier to extract
     print(json.dumps(result))
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+GitHub-aware token-bucket rate limiter shared by the validation, download and
+badge notification scripts.
+
+Every response from api.github.com reports the remaining budget
+(X-RateLimit-Remaining), the limit and when it resets (X-RateLimit-Reset).
+The limiter keeps one token bucket per rate limit resource (core, graphql,
+search, ...):
+
+- While the remaining budget is above a reserve (10% of the limit by default)
+  requests run at full speed
+- Below the reserve, requests are spaced so the remaining budget lasts until
+  the reset instead of running dry and stalling in one long sleep
+- At zero remaining every caller waits for the reset; after it, requests are
+  spaced at limit/window until a response reports the new budget, so the
+  waiting callers do not all fire at once
+- Retry-After and secondary (abuse) rate limit responses pause every caller
+  of that resource for the indicated time
+
+Usage:
+    limiter = get_shared_rate_limiter()
+    limiter.acquire("core")               # before a request
+    limiter.update_from_response(resp)    # after it
+"""
+
+import math
+import threading
+import time
+
+from requests.structures import CaseInsensitiveDict
+
+DEFAULT_RESERVE_FRACTION = 0.1
+# GitHub asks clients to wait at least a minute after a secondary rate limit without Retry-After
+SECONDARY_LIMIT_PAUSE = 60
+# Long waits are taken in slices so header updates from other threads are noticed
+MAX_SLEEP_SLICE = 5.0
+RATE_LIMITED_STATUSES = {403, 429}
+# Hosts whose responses carry X-RateLimit-* headers
+RATE_LIMITED_HOSTS = {"api.github.com"}
+
+
+def resource_for_url(url):
+    """Best guess of the GitHub rate limit resource a request URL counts against."""
+    if "/graphql" in url:
+        return "graphql"
+    if "/search/" in url:
+        return "search"
+    return "core"
+
+
+def is_rate_limited(response):
+    """True if `response` is a primary or secondary GitHub rate limit rejection."""
+    if response.status_code not in RATE_LIMITED_STATUSES:
+        return False
+    if response.status_code == 429 or "Retry-After" in response.headers:
+        return True
+    if response.headers.get("X-RateLimit-Remaining") == "0":
+        return True
+    return _mentions_secondary_limit(response)
+
+
+def retry_delay(response):
+    """Seconds to wait before retrying a rate limited response."""
+    retry_after = response.headers.get("Retry-After")
+    if retry_after and retry_after.isdigit():
+        return int(retry_after)
+    reset = response.headers.get("X-RateLimit-Reset")
+    if response.headers.get("X-RateLimit-Remaining") == "0" and reset and reset.isdigit():
+        return max(int(reset) - time.time(), 0) + 1
+    return SECONDARY_LIMIT_PAUSE
+
+
+def _mentions_secondary_limit(response):
+    # Error bodies are small; reading one also keeps it available to iter_content()
+    try:
+        return "secondary rate limit" in response.text.lower()
+    except Exception:
+        return False
+
+
+class TokenBucket:
+    """State of one rate limit resource."""
+
+    def __init__(self):
+        self.rate = None  # tokens per second; None until GitHub reports a budget
+        self.tokens = 1.0
+        self.capacity = 1.0
+        self.updated = 0.0
+        self.paused_until = 0.0
+
+
+class RateLimiter:
+    """
+    Thread-safe token-bucket limiter driven by GitHub rate limit headers.
+
+    Args:
+        reserve_fraction: Fraction of the limit below which requests are paced
+        clock, wall_clock, sleep: Injectable time sources (for tests)
+    """
+
+    def __init__(
+        self,
+        reserve_fraction=DEFAULT_RESERVE_FRACTION,
+        clock=time.monotonic,
+        wall_clock=time.time,
+        sleep=time.sleep,
+    ):
+        self.reserve_fraction = reserve_fraction
+        self.clock = clock
+        self.wall_clock = wall_clock
+        self.sleep = sleep
+        self.stats = {"acquired": 0, "waits": 0, "waited_seconds": 0.0, "pauses": 0}
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, resource):
+        if resource not in self._buckets:
+            self._buckets[resource] = TokenBucket()
+        return self._buckets[resource]
+
+    def acquire(self, resource="core"):
+        """Block until a request against `resource` may be sent."""
+        while True:
+            with self._lock:
+                now = self.clock()
+                bucket = self._bucket(resource)
+                if bucket.paused_until > now:
+                    wait = bucket.paused_until - now
+                elif bucket.rate is None:
+                    self.stats["acquired"] += 1
+                    return
+                else:
+                    elapsed = max(now - bucket.updated, 0.0)
+                    bucket.tokens = min(bucket.capacity, bucket.tokens + elapsed * bucket.rate)
+                    bucket.updated = now
+                    if bucket.tokens >= 1:
+                        bucket.tokens -= 1
+                        self.stats["acquired"] += 1
+                        return
+                    wait = (1 - bucket.tokens) / bucket.rate if bucket.rate > 0 else MAX_SLEEP_SLICE
+                wait = min(wait, MAX_SLEEP_SLICE)
+                self.stats["waits"] += 1
+                self.stats["waited_seconds"] += wait
+            self.sleep(wait)
+
+    def pause(self, resource, seconds):
+        """Stop handing out tokens for `resource` for `seconds`."""
+        with self._lock:
+            bucket = self._bucket(resource)
+            bucket.paused_until = max(bucket.paused_until, self.clock() + seconds)
+            self.stats["pauses"] += 1
+
+    def update(self, headers, status_code=None, resource=None):
+        """Refresh the bucket from GitHub's rate limit headers."""
+        # PyGithub hands over lowercased header names
+        headers = CaseInsensitiveDict(headers)
+        resource = headers.get("X-RateLimit-Resource") or resource or "core"
+        remaining = headers.get("X-RateLimit-Remaining")
+        limit = headers.get("X-RateLimit-Limit")
+        reset = headers.get("X-RateLimit-Reset")
+
+        if remaining is not None and reset is not None:
+            self.update_budget(resource, int(remaining), int(limit or remaining), int(reset))
+
+        if status_code in RATE_LIMITED_STATUSES:
+            retry_after = headers.get("Retry-After")
+            if retry_after and str(retry_after).isdigit():
+                self.pause(resource, int(retry_after))
+
+    def update_budget(self, resource, remaining, limit, reset):
+        """Set the budget of `resource`: `remaining` of `limit` requests until epoch time `reset`."""
+        with self._lock:
+            bucket = self._bucket(resource)
+            now = self.clock()
+            window = max(reset - self.wall_clock(), 1.0)
+            reserve = math.ceil(limit * self.reserve_fraction)
+
+            if remaining <= 0:
+                # Nothing left until the reset. After it, `limit` requests are due over a window of about the
+                # same length: hand them out one at a time until the first response reports the new budget.
+                bucket.paused_until = max(bucket.paused_until, now + window + 1)
+                bucket.rate = max(limit, 1) / window
+                bucket.capacity = 1.0
+                bucket.tokens = 1.0
+                bucket.updated = bucket.paused_until
+                self.stats["pauses"] += 1
+                return
+
+            # Above the reserve: spend freely. Below it: refill at remaining/window.
+            bucket.rate = remaining / window
+            bucket.capacity = max(remaining - reserve, 1)
+            bucket.tokens = max(remaining - reserve, min(bucket.tokens, 1.0))
+            bucket.updated = now
+
+    def update_from_response(self, response, resource=None):
+        """Refresh from a requests.Response, pausing on secondary rate limits."""
+        resource = resource or resource_for_url(response.url or "")
+        self.update(response.headers, response.status_code, resource)
+        if (
+            response.status_code in RATE_LIMITED_STATUSES
+            and "Retry-After" not in response.headers
+            and response.headers.get("X-RateLimit-Remaining") != "0"
+            and is_rate_limited(response)
+        ):
+            self.pause(response.headers.get("X-RateLimit-Resource") or resource, SECONDARY_LIMIT_PAUSE)
+
+
+_shared_limiter = None
+_shared_lock = threading.Lock()
+
+
+def get_shared_rate_limiter():
+    """Return the process-wide rate limiter, creating it on first use."""
+    global _shared_limiter
+    with _shared_lock:
+        if _shared_limiter is None:
+            _shared_limiter = RateLimiter()
+        return _shared_limiter
+
+
+def format_rate_limiter_stats(stats):
+    """One-line summary of pacing for script output."""
+    return f"{stats['waits']} waits ({stats['waited_seconds']:.1f}s total), {stats['pauses']} pauses"
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Optional SQLite mirror of THE_RESOURCES_TABLE.csv for safe concurrent edits.
+
+Scripts that change a few rows normally load and rewrite the whole CSV, so two
+jobs editing the table at once overwrite each other's changes. When
+AWESOME_CC_RESOURCE_DB names a database file, those scripts instead send only
+their changed rows to ResourceStore:
+
+- One table column per CSV column plus the row's CSV position; indexes on ID,
+  (Category, Sub-Category) and Primary Link
+- WAL journal, so readers never block the writer
+- Every edit runs in a BEGIN IMMEDIATE transaction: writers queue up instead of
+  clobbering each other, and an UPDATE touches only its own rows
+- export_csv() writes the rows back in CSV position order through
+  ResourceTable.write_csv(), byte-identical to the csv.DictWriter output the
+  scripts produce; an edit followed by an export holds the write lock
+  throughout, so the last export always contains every committed edit
+
+The CSV stays the canonical, committed file. sync() re-imports it whenever it
+no longer matches the last import or export (someone edited it by hand).
+Without AWESOME_CC_RESOURCE_DB, open_resource_store() returns None and the
+scripts rewrite the CSV as before.
+
+Usage:
+    python scripts/resource_store.py import [--db PATH] [--csv PATH]
+    python scripts/resource_store.py export [--db PATH] [--csv PATH]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+from contextlib import contextmanager
+
+try:
+    from resource_table import CSV_FILE, ResourceTable  # type: ignore[import-not-found]
+except ImportError:
+    from .resource_table import CSV_FILE, ResourceTable
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_DB_PATH = os.path.join(REPO_ROOT, ".myob", "resources.sqlite")
+STORE_VERSION = 1
+INDEXED_COLUMNS = {
+    "resources_id": ("ID",),
+    "resources_category": ("Category", "Sub-Category"),
+    "resources_primary_link": ("Primary Link",),
+}
+
+
+def quote_identifier(name):
+    """Quote a CSV column name for use as an SQLite identifier."""
+    return '"' + name.replace('"', '""') + '"'
+
+
+def file_sha256(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+class ResourceStore:
+    """The resource table in SQLite. Use one instance per thread or process."""
+
+    def __init__(self, path=DEFAULT_DB_PATH, timeout=60.0):
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        # Autocommit mode: transactions are opened explicitly by write_transaction()
+        self._conn = sqlite3.connect(path, timeout=timeout, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+
+    def close(self):
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @contextmanager
+    def write_transaction(self):
+        """Hold the database write lock for the block; commit on success, roll back on error."""
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield self._conn
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+
+    def _meta(self, key, default=None):
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row else default
+
+    def _set_meta(self, key, value):
+        self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, json.dumps(value)))
+
+    @property
+    def fieldnames(self):
+        return self._meta("fieldnames", [])
+
+    def __len__(self):
+        if not self.fieldnames:
+            return 0
+        return self._conn.execute("SELECT COUNT(*) FROM resources").fetchone()[0]
+
+    def _import(self, table, csv_sha256):
+        """Replace the stored rows with `table`; runs inside a write transaction."""
+        self._conn.execute("DROP TABLE IF EXISTS resources")
+        columns = ", ".join(f"{quote_identifier(name)} TEXT NOT NULL DEFAULT ''" for name in table.fieldnames)
+        self._conn.execute(f"CREATE TABLE resources (position INTEGER PRIMARY KEY, {columns})")
+        for index, index_columns in INDEXED_COLUMNS.items():
+            if all(name in table.fieldnames for name in index_columns):
+                self._conn.execute(
+                    f"CREATE INDEX {index} ON resources ({', '.join(map(quote_identifier, index_columns))})"
+                )
+        placeholders = ", ".join("?" * (len(table.fieldnames) + 1))
+        self._conn.executemany(
+            f"INSERT INTO resources VALUES ({placeholders})",
+            ((position, *(table.get(position, name) for name in table.fieldnames)) for position in range(len(table))),
+        )
+        self._set_meta("version", STORE_VERSION)
+        self._set_meta("fieldnames", table.fieldnames)
+        self._set_meta("csv_sha256", csv_sha256)
+
+    def import_csv(self, csv_path=CSV_FILE):
+        """Replace the stored rows with the contents of `csv_path`."""
+        with self.write_transaction():
+            self._import(ResourceTable.from_csv(csv_path), file_sha256(csv_path))
+
+    def sync(self, csv_path=CSV_FILE):
+        """
+        Re-import `csv_path` if it differs from the CSV last imported or exported.
+        Returns True when it was re-imported.
+        """
+        with self.write_transaction():
+            csv_sha256 = file_sha256(csv_path)
+            if self._meta("version") == STORE_VERSION and self._meta("csv_sha256") == csv_sha256:
+                return False
+            self._import(ResourceTable.from_csv(csv_path), csv_sha256)
+            return True
+
+    def table(self):
+        """All stored rows as a ResourceTable, in CSV order."""
+        fieldnames = self.fieldnames
+        table = ResourceTable(fieldnames)
+        if fieldnames:
+            select = ", ".join(map(quote_identifier, fieldnames))
+            for values in self._conn.execute(f"SELECT {select} FROM resources ORDER BY position"):
+                table.append(dict(zip(fieldnames, values, strict=True)))
+        return table
+
+    def get(self, resource_id):
+        """The row with this ID as a dict, or None."""
+        fieldnames = self.fieldnames
+        if "ID" not in fieldnames:
+            return None
+        select = ", ".join(map(quote_identifier, fieldnames))
+        values = self._conn.execute(
+            f"SELECT {select} FROM resources WHERE {quote_identifier('ID')} = ? ORDER BY position LIMIT 1",
+            (resource_id,),
+        ).fetchone()
+        return dict(zip(fieldnames, values, strict=True)) if values else None
+
+    def _update(self, resource_id, values):
+        unknown = set(values) - set(self.fieldnames)
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
+        if not values:
+            return self.get(resource_id) is not None
+        assignments = ", ".join(f"{quote_identifier(name)} = ?" for name in values)
+        cursor = self._conn.execute(
+            f"UPDATE resources SET {assignments} WHERE {quote_identifier('ID')} = ?",
+            (*("" if value is None else value for value in values.values()), resource_id),
+        )
+        return cursor.rowcount > 0
+
+    def update_many(self, changes, export_path=None):
+        """
+        Apply {resource ID: {field: value}} in one transaction. With `export_path`
+        the CSV is exported before the write lock is released. Returns the IDs
+        that matched no row.
+        """
+        with self.write_transaction():
+            missing = [resource_id for resource_id, values in changes.items() if not self._update(resource_id, values)]
+            if export_path:
+                self._export(export_path)
+        return missing
+
+    def update(self, resource_id, values, export_path=None):
+        """Update one row in its own transaction; returns False if no row has this ID."""
+        return not self.update_many({resource_id: values}, export_path)
+
+    def _export(self, csv_path):
+        self.table().write_csv(csv_path)
+        self._set_meta("csv_sha256", file_sha256(csv_path))
+
+    def export_csv(self, csv_path=CSV_FILE):
+        """Write the stored rows to `csv_path` in CSV order, as csv.DictWriter would."""
+        with self.write_transaction():
+            self._export(csv_path)
+
+
+def resource_store_path():
+    """The database named by AWESOME_CC_RESOURCE_DB, or None when the store is disabled."""
+    location = os.environ.get("AWESOME_CC_RESOURCE_DB", "")
+    if location.lower() in ("", "off", "0", "false"):
+        return None
+    return location
+
+
+def open_resource_store(csv_path=CSV_FILE):
+    """
+    Open the store named by AWESOME_CC_RESOURCE_DB, synced with `csv_path`, or
+    return None when no store is configured.
+    """
+    path = resource_store_path()
+    if path is None:
+        return None
+    store = ResourceStore(path)
+    store.sync(csv_path)
+    return store
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import or export the SQLite copy of the resource table")
+    parser.add_argument("command", choices=("import", "export"))
+    parser.add_argument("--db", default=resource_store_path() or DEFAULT_DB_PATH, help="Database file")
+    parser.add_argument("--csv", default=CSV_FILE, help="Resource CSV (default: THE_RESOURCES_TABLE.csv)")
+    args = parser.parse_args()
+
+    try:
+        with ResourceStore(args.db) as store:
+            if args.command == "import":
+                store.import_csv(args.csv)
+                print(f"✓ Imported {len(store)} resources from {args.csv} into {args.db}")
+            else:
+                store.export_csv(args.csv)
+                print(f"✓ Exported {len(store)} resources from {args.db} to {args.csv}")
+    except (OSError, sqlite3.Error) as e:
+        print(f"❌ {args.command.capitalize()} failed: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
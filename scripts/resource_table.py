@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+Column-oriented, indexed view of THE_RESOURCES_TABLE.csv.
+
+ResourceTable loads the CSV once into one list per column instead of one dict
+per row, sharing repeated cell values (categories, licenses, dates, flags,
+author names) between rows, and builds hash indexes on first use:
+
+- by ID                         find_id()
+- by canonical Primary Link     find_url()        (url_utils.canonicalize_url;
+                                                   ignore_case=True also folds the path)
+- by GitHub (owner, repo)       find_repo()       (url_utils.github_repo_key)
+- by (category, sub-category)   find_category()
+- by lower-cased Display Name   find_name()
+
+Rows are addressed by their position. row() returns a fresh dict for callers
+that need one; set(), append() and sort() keep the indexes consistent, and
+write_csv() writes the same bytes csv.DictWriter would. build_indexes() builds
+indexes up front, for tables about to be read from several threads.
+"""
+
+import csv
+import io
+import os
+import threading
+
+try:
+    from atomic_io import atomic_write  # type: ignore[import-not-found]
+    from url_utils import canonicalize_url, github_repo_key  # type: ignore[import-not-found]
+except ImportError:
+    from .atomic_io import atomic_write
+    from .url_utils import canonicalize_url, github_repo_key
+
+CSV_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "THE_RESOURCES_TABLE.csv")
+# The columns each index is built from; writing one of them drops the index
+INDEX_FIELDS = {
+    "id": ("ID",),
+    "url": ("Primary Link",),
+    "url_nocase": ("Primary Link",),
+    "repo": ("Primary Link",),
+    "category": ("Category", "Sub-Category"),
+    "name": ("Display Name",),
+}
+# The key each index maps a row to, from the values of its INDEX_FIELDS; None leaves the row out
+INDEX_KEYS = {
+    "id": lambda value: value or None,
+    "url": lambda link: canonicalize_url(link) or None,
+    "url_nocase": lambda link: canonicalize_url(link).lower() or None,
+    "repo": github_repo_key,
+    "category": lambda cat, sub: (cat, sub.strip()),
+    "name": lambda name: name.strip().lower() or None,
+}
+
+
+class ResourceTable:
+    """The resource table as column arrays plus lazily built lookup indexes."""
+
+    __slots__ = ("fieldnames", "_columns", "_length", "_indexes")
+
+    def __init__(self, fieldnames, rows=()):
+        self.fieldnames = list(fieldnames)
+        self._columns = {name: [] for name in self.fieldnames}
+        self._length = 0
+        self._indexes = {}
+        for row in rows:
+            self.append(row)
+
+    @classmethod
+    def from_reader(cls, reader):
+        """Build a table from a csv.reader whose first row is the header."""
+        header = next(reader, None)
+        if header is None:
+            return cls([])
+        table = cls(header)
+        columns = [table._columns[name] for name in table.fieldnames]
+        width = len(columns)
+        shared = {}
+        for values in reader:
+            if not values:
+                continue
+            # Short rows are padded like csv.DictReader does; surplus cells are dropped
+            if len(values) < width:
+                values = values + [""] * (width - len(values))
+            for column, value in zip(columns, values, strict=False):
+                column.append(shared.setdefault(value, value))
+            table._length += 1
+        return table
+
+    @classmethod
+    def from_csv(cls, csv_path=CSV_FILE):
+        with open(csv_path, newline="", encoding="utf-8") as f:
+            return cls.from_reader(csv.reader(f))
+
+    @classmethod
+    def from_text(cls, text):
+        """Build a table from CSV text, e.g. the output of `git show HEAD:THE_RESOURCES_TABLE.csv`."""
+        return cls.from_reader(csv.reader(io.StringIO(text)))
+
+    def __len__(self):
+        return self._length
+
+    def __iter__(self):
+        for position in range(self._length):
+            yield self.row(position)
+
+    def get(self, position, field, default=""):
+        column = self._columns.get(field)
+        return default if column is None else column[position]
+
+    def column(self, field):
+        """The values of `field` in row order (a read-only view; do not modify)."""
+        return self._columns[field]
+
+    def row(self, position):
+        """Row `position` as a new dict keyed by fieldnames."""
+        return {name: column[position] for name, column in self._columns.items()}
+
+    def rows(self):
+        """All rows as new dicts, in order."""
+        return list(self)
+
+    def set(self, position, field, value):
+        """Set one cell, keeping the indexes consistent."""
+        if field not in self._columns:
+            raise KeyError(f"Unknown field {field!r}")
+        self._columns[field][position] = value
+        for name in [name for name in self._indexes if field in INDEX_FIELDS[name]]:
+            del self._indexes[name]
+
+    def update(self, position, values):
+        """Set several cells of one row from a dict."""
+        for field, value in values.items():
+            self.set(position, field, value)
+
+    def append(self, row):
+        """Append a row given as a dict; missing fields are empty. Returns its position."""
+        unknown = set(row) - set(self._columns)
+        if unknown:
+            raise ValueError(f"dict contains fields not in fieldnames: {', '.join(sorted(map(repr, unknown)))}")
+        for name, column in self._columns.items():
+            value = row.get(name)
+            column.append("" if value is None else value)
+        self._length += 1
+        self._indexes.clear()
+        return self._length - 1
+
+    def sort(self, key):
+        """Reorder the rows by `key`, called with each row as a dict (a stable sort)."""
+        order = sorted(range(self._length), key=lambda position: key(self.row(position)))
+        for name, column in self._columns.items():
+            self._columns[name] = [column[position] for position in order]
+        self._indexes.clear()
+
+    def write(self, f):
+        writer = csv.writer(f)
+        writer.writerow(self.fieldnames)
+        writer.writerows(zip(*self._columns.values(), strict=True))
+
+    def write_csv(self, csv_path=CSV_FILE):
+        """Atomically replace `csv_path` with the table, byte-for-byte as csv.DictWriter writes it."""
+        with atomic_write(csv_path, newline="") as f:
+            self.write(f)
+
+    def build_indexes(self, names=None):
+        """
+        Build the indexes in `names` (all of them by default) now instead of on
+        first lookup, e.g. before the table is shared between threads.
+        """
+        for name in names or INDEX_FIELDS:
+            self._index(name)
+
+    def _index(self, name):
+        """
+        Build (once) and return the index `name`, mapping each key of INDEX_KEYS[name]
+        to a row position, or to a list of ascending positions when several rows
+        share it. Most keys are unique, so a bare int saves a list per row.
+        """
+        index = self._indexes.get(name)
+        if index is None:
+            index = {}
+            columns = [self._columns.get(field, [""] * self._length) for field in INDEX_FIELDS[name]]
+            for position, key in enumerate(map(INDEX_KEYS[name], *columns)):
+                if key is None:
+                    continue
+                found = index.get(key)
+                if found is None:
+                    index[key] = position
+                elif isinstance(found, int):
+                    index[key] = [found, position]
+                else:
+                    found.append(position)
+            self._indexes[name] = index
+        return index
+
+    def _lookup(self, name, key):
+        found = self._index(name).get(key)
+        if found is None:
+            return []
+        return [found] if isinstance(found, int) else list(found)
+
+    def find_id(self, resource_id):
+        """Position of the row with this ID, or None."""
+        positions = self._lookup("id", resource_id)
+        return positions[0] if positions else None
+
+    def find_url(self, url, ignore_case=False):
+        """
+        Positions of the rows whose Primary Link has the same canonical form as
+        `url`; with `ignore_case`, compared case-insensitively throughout.
+        """
+        if ignore_case:
+            return self._lookup("url_nocase", canonicalize_url(url).lower())
+        return self._lookup("url", canonicalize_url(url))
+
+    def find_repo(self, owner, repo):
+        """Positions of the rows whose Primary Link points into github.com/owner/repo."""
+        return self._lookup("repo", (owner.lower(), repo.lower()))
+
+    def find_category(self, category, sub_category=""):
+        """Positions of the rows in (category, sub-category); "" selects rows without a sub-category."""
+        return self._lookup("category", (category, sub_category.strip()))
+
+    def find_name(self, display_name):
+        """Positions of the rows whose Display Name matches, ignoring case."""
+        return self._lookup("name", display_name.strip().lower())
+
+
+_cache = {}
+_cache_lock = threading.Lock()
+
+
+def load_resource_table(csv_path=CSV_FILE):
+    """
+    Return a shared, read-only ResourceTable for `csv_path`, loaded once per
+    process and reloaded only when the file's size or mtime changes. Callers
+    that modify the table must use ResourceTable.from_csv() instead.
+    """
+    path = os.path.abspath(csv_path)
+    stat = os.stat(path)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    with _cache_lock:
+        cached = _cache.get(path)
+        if cached and cached[0] == signature:
+            return cached[1]
+    table = ResourceTable.from_csv(path)
+    with _cache_lock:
+        _cache[path] = (signature, table)
+    return table
@@ -6,12 +6,16 @@ This utility ensures resources are properly ordered for consistent presentation
 in the generated README and other outputs.
 """
 
-import csv
 import sys
 from pathlib import Path
 
 import yaml  # type: ignore[import-untyped]
 
+try:
+    from resource_table import ResourceTable  # type: ignore[import-not-found]
+except ImportError:
+    from .resource_table import ResourceTable
+
 
 def sort_resources(csv_path: Path) -> None:
     """Sort resources in the CSV file by category, sub-category, and display name."""
@@ -34,15 +38,11 @@ def sort_resources(csv_path: Path) -> None:
     category_sort_map = {cat: idx for idx, cat in enumerate(category_order)}
 
     # Read the CSV data
-    with open(csv_path, encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        headers = reader.fieldnames
-        rows = list(reader)
+    table = ResourceTable.from_csv(csv_path)
 
     # Sort the rows
     # First by Category (using custom order), then by Sub-Category (empty values last), then by Display Name
-    sorted_rows = sorted(
-        rows,
+    table.sort(
         key=lambda row: (
             category_sort_map.get(row.get("Category", ""), 999),  # Unknown categories sort last
             row.get("Sub-Category", "") or "zzz",  # Empty sub-categories sort last
@@ -51,17 +51,14 @@ def sort_resources(csv_path: Path) -> None:
     )
 
     # Write the sorted data back
-    with open(csv_path, "w", encoding="utf-8", newline="") as f:
-        if headers:
-            writer = csv.DictWriter(f, fieldnames=headers)
-            writer.writeheader()
-            writer.writerows(sorted_rows)
+    if table.fieldnames:
+        table.write_csv(csv_path)
 
-    print(f"✓ Sorted {len(sorted_rows)} resources in {csv_path}")
+    print(f"✓ Sorted {len(table)} resources in {csv_path}")
 
     # Print summary of categories
     categories: dict[str, dict[str, int]] = {}
-    for row in sorted_rows:
+    for row in table:
         cat = row.get("Category", "Unknown")
         subcat = row.get("Sub-Category", "") or "None"
         if cat not in categories:
@@ -7,7 +7,6 @@ from entry to pull request creation.
 """
 
 import argparse
-import csv
 import logging
 import os
 import re
@@ -17,6 +16,7 @@ from enum import Enum
 from pathlib import Path
 
 from scripts.git_utils import GitUtils
+from scripts.resource_table import ResourceTable
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
@@ -110,36 +110,29 @@ class ResourceSubmitter:
             if head_csv_result.returncode != 0:
                 # File might be new or not in HEAD
                 self.logger.debug("CSV file not found in HEAD, treating all rows as new")
-                head_rows = []
+                head_table = ResourceTable([])
             else:
                 # Parse HEAD version
-                import io
-
-                head_reader = csv.DictReader(io.StringIO(head_csv_result.stdout))
-                head_rows = list(head_reader)
+                head_table = ResourceTable.from_text(head_csv_result.stdout)
 
             # Get current version
-            with open(csv_path, encoding="utf-8") as f:
-                current_reader = csv.DictReader(f)
-                current_rows = list(current_reader)
+            current_table = ResourceTable.from_csv(csv_path)
 
-            if not current_rows:
+            if not len(current_table):
                 return None
 
             # Find rows that are in current but not in HEAD
             # Use ID field for comparison as it should be unique
-            head_ids = {row.get("ID") for row in head_rows if row.get("ID")}
-            new_rows = [row for row in current_rows if row.get("ID") not in head_ids]
-
-            if new_rows:
-                # Return the Display Name of the first new row
-                # (typically there should only be one new row)
-                return new_rows[0].get("Display Name")
-            else:
-                # No new rows found, fall back to last row
-                # This handles edge cases where git history might be different
-                self.logger.debug("No new rows found via diff, using last row")
-                return current_rows[-1].get("Display Name")
+            for position, resource_id in enumerate(current_table.column("ID")):
+                if head_table.find_id(resource_id) is None:
+                    # Return the Display Name of the first new row
+                    # (typically there should only be one new row)
+                    return current_table.get(position, "Display Name")
+
+            # No new rows found, fall back to last row
+            # This handles edge cases where git history might be different
+            self.logger.debug("No new rows found via diff, using last row")
+            return current_table.get(len(current_table) - 1, "Display Name")
 
         except Exception as e:
             self.logger.error(f"Error getting last resource name: {e}")
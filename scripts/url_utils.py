@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+URL canonicalization helpers shared by the validation scripts.
+
+Many resources point at different files or trees inside the same GitHub
+repository, or at the same URL written slightly differently. Canonical forms
+let callers fetch each network fact once and fan the result out to every row.
+"""
+
+from urllib.parse import urlsplit, urlunsplit
+
+GITHUB_HOSTS = {"github.com", "www.github.com"}
+
+
+def canonicalize_url(url, keep_git_suffix=False):
+    """
+    Return a canonical form of `url` for grouping identical resources.
+
+    - Surrounding whitespace, fragments and trailing slashes are removed
+    - Scheme and host are lowercased
+    - For github.com: owner and repository are lowercased and a ".git" suffix
+      is dropped unless `keep_git_suffix`; "tree" and "blob" URLs stay distinct,
+      since validate_links checks them differently
+    """
+    url = (url or "").strip()
+    if not url:
+        return ""
+
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    host = parts.netloc.lower()
+    path = parts.path.rstrip("/")
+
+    if host in GITHUB_HOSTS:
+        host = "github.com"
+        segments = path.split("/")
+        # segments[0] is empty because the path starts with "/"
+        if len(segments) > 1:
+            segments[1] = segments[1].lower()
+        if len(segments) > 2:
+            repo = segments[2].lower()
+            segments[2] = repo[: -len(".git")] if repo.endswith(".git") and not keep_git_suffix else repo
+        path = "/".join(segments)
+
+    return urlunsplit((scheme, host, path, parts.query, ""))
+
+
+def github_repo_key(url):
+    """Return the lowercased (owner, repo) of a github.com URL, or None for other URLs."""
+    canonical = canonicalize_url(url)
+    parts = urlsplit(canonical)
+    if parts.netloc != "github.com":
+        return None
+    segments = [segment for segment in parts.path.split("/") if segment]
+    if len(segments) < 2:
+        return None
+    return segments[0], segments[1]
@@ -12,23 +12,71 @@ Features:
 - Updates CSV with Active status, Last Checked timestamp, and Last Modified date
 - Provides detailed logging and broken link summary
 - GitHub Action mode for CI/CD integration
+- Concurrent validation engine (asyncio) with a configurable concurrency limit
+- Pooled keep-alive HTTP session shared by all requests
+- Batched GraphQL pre-pass for GitHub existence, license and last-modified metadata
+- Persistent GitHub API response cache with ETag revalidation
+- Incremental mode: only re-check stale or inactive rows, oldest first, under a time/request budget
+- URL canonicalization pre-pass: each unique URL and repository is fetched once and fanned out to all rows
 """
 
 import argparse
+import asyncio
 import csv
+import glob
+import hashlib
 import json
 import logging
 import os
 import random
 import re
 import sys
+import threading
 import time
-from datetime import datetime
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta
+from functools import partial
 
 import requests
-import yaml  # type: ignore[import-untyped]
 from dotenv import load_dotenv
 
+try:
+    from atomic_io import atomic_write  # type: ignore[import-not-found]
+    from checkpoint import CheckpointJournal  # type: ignore[import-not-found]
+    from github_cache import DEFAULT_FRESH_SECONDS, format_cache_stats  # type: ignore[import-not-found]
+    from github_graphql import format_commit_date, prefetch_github_metadata  # type: ignore[import-not-found]
+    from http_client import (  # type: ignore[import-not-found]
+        DEFAULT_POOL_CONNECTIONS,
+        DEFAULT_POOL_MAXSIZE,
+        configure_shared_session,
+        format_connection_stats,
+        get_shared_session,
+    )
+    from overrides import ResourceOverrides, compile_overrides  # type: ignore[import-not-found]
+    from overrides import load_overrides as load_override_file  # type: ignore[import-not-found]
+    from rate_limiter import format_rate_limiter_stats, is_rate_limited, retry_delay  # type: ignore[import-not-found]
+    from resource_store import open_resource_store  # type: ignore[import-not-found]
+    from resource_table import ResourceTable  # type: ignore[import-not-found]
+    from url_utils import canonicalize_url, github_repo_key  # type: ignore[import-not-found]
+except ImportError:
+    from .atomic_io import atomic_write
+    from .checkpoint import CheckpointJournal
+    from .github_cache import DEFAULT_FRESH_SECONDS, format_cache_stats
+    from .github_graphql import format_commit_date, prefetch_github_metadata
+    from .http_client import (
+        DEFAULT_POOL_CONNECTIONS,
+        DEFAULT_POOL_MAXSIZE,
+        configure_shared_session,
+        format_connection_stats,
+        get_shared_session,
+    )
+    from .overrides import ResourceOverrides, compile_overrides
+    from .overrides import load_overrides as load_override_file
+    from .rate_limiter import format_rate_limiter_stats, is_rate_limited, retry_delay
+    from .resource_store import open_resource_store
+    from .resource_table import ResourceTable
+    from .url_utils import canonicalize_url, github_repo_key
+
 logger = logging.getLogger(__name__)
 
 load_dotenv()
@@ -46,6 +94,12 @@ LAST_CHECKED_HEADER_NAME = "Last Checked"
 LAST_MODIFIED_HEADER_NAME = "Last Modified"
 LICENSE_HEADER_NAME = "License"
 ID_HEADER_NAME = "ID"
+DEFAULT_CONCURRENCY = 16
+DEFAULT_MAX_AGE_HOURS = 7 * 24
+DEFAULT_CHECKPOINT_FILE = ".myob/validation_checkpoint.jsonl"
+DEFAULT_SHARD_DIR = ".myob/shards"
+SHARD_FILE_VERSION = 1
+LAST_CHECKED_FORMAT = "%Y-%m-%d:%H-%M-%S"
 HEADERS = {"User-Agent": USER_AGENT, "Accept": "application/vnd.github+json"}
 if GITHUB_TOKEN:
     HEADERS["Authorization"] = f"Bearer {GITHUB_TOKEN}"
@@ -54,49 +108,19 @@ PRINT_FILE = None
 
 
 def load_overrides():
-    """Load override configuration from YAML file."""
-    if not os.path.exists(OVERRIDE_FILE):
-        return {}
-
-    with open(OVERRIDE_FILE, encoding="utf-8") as f:
-        data = yaml.safe_load(f)
-        if data is None:
-            return {}
-        logger.info(f"Loaded overrides from {OVERRIDE_FILE} - overrides: {data}")
-        return data.get("overrides", {})
+    """Load the compiled override configuration (see overrides.py)."""
+    overrides = load_override_file(OVERRIDE_FILE)
+    if overrides:
+        logger.info(f"Loaded overrides from {OVERRIDE_FILE} - overrides: {overrides.data}")
+    return overrides
 
 
 def apply_overrides(row, overrides):
-    """Apply overrides to a row if the resource ID has overrides configured."""
-    resource_id = row.get(ID_HEADER_NAME, "")
-    if not resource_id or resource_id not in overrides:
-        return row, set(), False
-
-    override_config = overrides[resource_id]
-    locked_fields = set()
-    skip_validation = override_config.get("skip_validation", False)
-
-    # Apply each override
-    for field, value in override_config.items():
-        if field.endswith("_locked"):
-            # Track locked fields
-            base_field = field.replace("_locked", "")
-            if override_config.get(field, False):
-                locked_fields.add(base_field)
-        elif field not in ["notes", "skip_validation"]:  # Skip notes and skip_validation fields
-            # Apply override value
-            if field == "license":
-                row[LICENSE_HEADER_NAME] = value
-            elif field == "active":
-                row[ACTIVE_HEADER_NAME] = value
-            elif field == "last_checked":
-                row[LAST_CHECKED_HEADER_NAME] = value
-            elif field == "last_modified":
-                row[LAST_MODIFIED_HEADER_NAME] = value
-            elif field == "description":
-                row["Description"] = value
-
-    return row, locked_fields, skip_validation
+    """
+    Apply overrides to a row if the resource ID has overrides configured.
+    Returns (row, locked fields, skip_validation).
+    """
+    return compile_overrides(overrides).apply(row, ID_HEADER_NAME)
 
 
 def parse_github_url(url):
@@ -123,11 +147,12 @@ def parse_github_url(url):
     return url, False
 
 
-def get_github_license(owner, repo):
+def get_github_license(owner, repo, session=None):
     """Fetch license information from GitHub API."""
+    session = session or get_shared_session()
     api_url = f"https://api.github.com/repos/{owner}/{repo}"
     try:
-        response = requests.get(api_url, headers=HEADERS, timeout=10)
+        response = session.get(api_url, headers=HEADERS, timeout=10)
         if response.status_code == 200:
             data = response.json()
             license_info = data.get("license")
@@ -138,6 +163,36 @@ def get_github_license(owner, repo):
     return "NOT_FOUND"
 
 
+class RepoFacts:
+    """
+    Per-run memo of repository-level facts, so rows that point into the same
+    repository share one license lookup. The first caller for a repository
+    fetches its license; concurrent callers wait for that fetch's Future.
+    """
+
+    def __init__(self, session=None):
+        self.session = session
+        self.hits = 0
+        self._licenses = {}
+        self._lock = threading.Lock()
+
+    def license(self, owner, repo):
+        key = (owner.lower(), repo.lower())
+        with self._lock:
+            future = self._licenses.get(key)
+            fetch = future is None
+            if fetch:
+                future = self._licenses[key] = Future()
+            else:
+                self.hits += 1
+        if fetch:
+            try:
+                future.set_result(get_github_license(owner, repo, self.session))
+            except BaseException as e:
+                future.set_exception(e)
+        return future.result()
+
+
 def get_committer_date_from_response(
     response: requests.Response,
 ) -> str | None:
@@ -151,20 +206,13 @@ def get_committer_date_from_response(
     return None
 
 
-def format_commit_date(commit_date: str) -> str:
-    """Format commit date from ISO format to YYYY-MM-DD:HH-MM-SS."""
-    from datetime import datetime
-
-    dt = datetime.fromisoformat(commit_date.replace("Z", "+00:00"))
-    return dt.strftime("%Y-%m-%d:%H-%M-%S")
-
-
-def get_github_last_modified(owner, repo, path=None):
+def get_github_last_modified(owner, repo, path=None, session=None):
     """Fetch last modified date for a GitHub file or repository."""
+    session = session or get_shared_session()
     try:
         api_url = f"https://api.github.com/repos/{owner}/{repo}/commits"
         params = {"per_page": 1, "path": path} if path else {"per_page": 1}
-        response = requests.get(api_url, headers=HEADERS, params=params, timeout=10)
+        response = session.get(api_url, headers=HEADERS, params=params, timeout=10)
         if response.status_code == 200:
             commit_date = get_committer_date_from_response(response)
             if commit_date:
@@ -174,33 +222,43 @@ def get_github_last_modified(owner, repo, path=None):
     return None
 
 
-def validate_url(url, max_retries=5):
+def validate_url(url, max_retries=5, session=None, metadata=None, repo_facts=None):
     """
     Validate a URL with exponential backoff retry logic.
+    All requests go through `session` (the shared pooled session by default).
+    `metadata` is this URL's entry from the GraphQL pre-pass, if any; when it shows
+    the GitHub resource exists, no further requests are made.
+    `repo_facts` (a RepoFacts) shares license lookups between URLs of one repository.
     Returns (is_valid, status_code, license_info, last_modified).
     """
     if not url or url.strip() == "":
         return True, None, None, None  # Empty URLs are considered valid
 
+    session = session or get_shared_session()
+
     # Convert GitHub URLs to API endpoints
     api_url, is_github = parse_github_url(url)
 
+    # Resources the GraphQL pre-pass found need no REST calls; missing ones are
+    # re-checked over REST below to get an accurate status code
+    if is_github and metadata and metadata["exists"]:
+        return True, 200, metadata["license"], metadata["last_modified"]
+
     for attempt in range(max_retries):
         try:
             if is_github:
-                response = requests.get(api_url, headers=HEADERS, timeout=10)
+                response = session.get(api_url, headers=HEADERS, timeout=10)
             else:
-                response = requests.head(url, headers=HEADERS, timeout=10, allow_redirects=True)
-
-            # Check if we hit GitHub rate limit
-            if response.status_code == 403 and "X-RateLimit-Remaining" in response.headers:
-                remaining = int(response.headers.get("X-RateLimit-Remaining", 0))
-                if remaining == 0:
-                    reset_time = int(response.headers.get("X-RateLimit-Reset", 0))
-                    sleep_time = max(reset_time - int(time.time()), 0) + 1
-                    print(f"GitHub rate limit hit. Sleeping for {sleep_time} seconds...")
-                    time.sleep(sleep_time)
-                    continue
+                response = session.head(url, headers=HEADERS, timeout=10, allow_redirects=True)
+
+            # Primary or secondary GitHub rate limit: a session with a rate limiter has
+            # already paused further GitHub requests, so only plain sessions sleep here
+            if is_github and is_rate_limited(response):
+                delay = retry_delay(response)
+                print(f"GitHub rate limit hit. Retrying in {delay:.0f} seconds...")
+                if getattr(session, "rate_limiter", None) is None:
+                    time.sleep(delay)
+                continue
 
             # Success cases
             if response.status_code < 400:
@@ -212,15 +270,21 @@ def validate_url(url, max_retries=5):
                     file_match = re.match(r"https://github\.com/([^/]+)/([^/]+)/blob/[^/]+/(.+)", url)
                     if file_match:
                         owner, repo, path = file_match.groups()
-                        license_info = get_github_license(owner, repo)
-                        last_modified = get_github_last_modified(owner, repo, path)
+                        license_info = (
+                            repo_facts.license(owner, repo) if repo_facts else get_github_license(owner, repo, session)
+                        )
+                        last_modified = get_github_last_modified(owner, repo, path, session)
                     else:
                         # Try repository URL
                         repo_match = re.match(r"https://github\.com/([^/]+)/([^/]+)", url)
                         if repo_match:
                             owner, repo = repo_match.groups()
-                            license_info = get_github_license(owner, repo)
-                            last_modified = get_github_last_modified(owner, repo)
+                            license_info = (
+                                repo_facts.license(owner, repo)
+                                if repo_facts
+                                else get_github_license(owner, repo, session)
+                            )
+                            last_modified = get_github_last_modified(owner, repo, session=session)
                 return True, response.status_code, license_info, last_modified
 
             # Client errors (except rate limit) don't need retry
@@ -246,18 +310,240 @@ def validate_url(url, max_retries=5):
     return False, "Max retries exceeded", None, None
 
 
-def validate_links(csv_file, max_links=None, ignore_overrides=False):
+def parse_last_checked(value):
+    """Parse a Last Checked timestamp (YYYY-MM-DD:HH-MM-SS); returns None if missing or malformed."""
+    try:
+        return datetime.strptime(value.strip(), LAST_CHECKED_FORMAT)
+    except (AttributeError, ValueError):
+        return None
+
+
+def select_stale_rows(pending, max_age_hours=DEFAULT_MAX_AGE_HOURS, now=None):
+    """
+    Pick the rows an incremental run should re-check: rows last checked more than
+    `max_age_hours` ago (or never), plus rows currently marked inactive.
+    Returns the selected entries ordered oldest-first.
+    """
+    cutoff = (now or datetime.now()) - timedelta(hours=max_age_hours)
+    selected = []
+    for entry in pending:
+        row = entry[1]
+        last_checked = parse_last_checked(row.get(LAST_CHECKED_HEADER_NAME, ""))
+        inactive = row.get(ACTIVE_HEADER_NAME, "TRUE").upper() != "TRUE"
+        if last_checked is None or last_checked < cutoff or inactive:
+            selected.append((last_checked or datetime.min, entry))
+    selected.sort(key=lambda item: item[0])
+    return [entry for _, entry in selected]
+
+
+class ValidationBudget:
+    """
+    Per-run time and request budget. Once spent, no new validations are started;
+    rows that were not reached keep their previous values until the next run.
+    """
+
+    def __init__(self, seconds=None, max_requests=None, session=None):
+        self.deadline = time.monotonic() + seconds if seconds else None
+        self.max_requests = max_requests
+        self.stats = getattr(session, "stats", None)
+        self.start_requests = self.stats.requests if self.stats else 0
+
+    def exhausted(self):
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            return True
+        if self.max_requests and self.stats is not None:
+            return self.stats.requests - self.start_requests >= self.max_requests
+        return False
+
+
+async def _validate_urls_async(urls, concurrency, session, metadata, budget, repo_facts, on_result):
+    """Run validate_url for every URL, keeping at most `concurrency` requests in flight."""
+    semaphore = asyncio.Semaphore(concurrency)
+    loop = asyncio.get_running_loop()
+
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="validate") as executor:
+
+        async def validate_one(url):
+            async with semaphore:
+                if budget is not None and budget.exhausted():
+                    return None
+                result = await loop.run_in_executor(
+                    executor,
+                    partial(validate_url, url, session=session, metadata=metadata.get(url), repo_facts=repo_facts),
+                )
+                if on_result is not None:
+                    on_result(url, result)
+                return result
+
+        return await asyncio.gather(*(validate_one(url) for url in urls))
+
+
+def validate_urls_concurrently(
+    urls, concurrency=DEFAULT_CONCURRENCY, session=None, metadata=None, budget=None, repo_facts=None, on_result=None
+):
+    """
+    Validate many URLs concurrently over one pooled session.
+    `metadata` maps URLs to GraphQL pre-pass results (see github_graphql.py).
+    URLs are started in order; once `budget` is exhausted the remaining ones are not validated.
+    `on_result(url, result)` is called on the event loop thread as each URL completes.
+    Returns a list of validate_url() results (None for URLs skipped by the budget)
+    in the same order as `urls`.
+    """
+    if not urls:
+        return []
+    session = session or get_shared_session()
+    concurrency = max(1, min(concurrency, len(urls)))
+    return asyncio.run(_validate_urls_async(urls, concurrency, session, metadata or {}, budget, repo_facts, on_result))
+
+
+def validation_key(url):
+    """
+    The key under which URLs share one validation: the canonical form (see
+    url_utils.canonicalize_url), marked when validate_url checks the URL through
+    the GitHub API, since spellings of one canonical URL may not all parse as
+    GitHub URLs (see parse_github_url). A ".git" suffix is kept: the URL (or API
+    path) requested with it is not the one requested without it.
+    """
+    canonical = canonicalize_url(url, keep_git_suffix=True)
+    return f"github-api:{canonical}" if parse_github_url(url)[1] else canonical
+
+
+def group_urls(urls):
+    """
+    Group URLs that are validated the same way (see validation_key).
+    Returns (unique_urls, group_index, dedup_stats): `unique_urls` holds the first
+    URL seen for each key and `group_index[i]` is the position of
+    `urls[i]` in `unique_urls`.
+    """
+    positions = {}
+    unique_urls = []
+    group_index = []
+    requests_saved = 0
+    for url in urls:
+        key = validation_key(url)
+        if key in positions:
+            # A GitHub API URL costs repo + license + commits requests over REST
+            requests_saved += 3 if parse_github_url(url)[1] else 1
+        else:
+            positions[key] = len(unique_urls)
+            unique_urls.append(url)
+        group_index.append(positions[key])
+
+    repositories = {github_repo_key(url) for url in unique_urls} - {None}
+    dedup_stats = {
+        "rows": len(urls),
+        "unique_urls": len(unique_urls),
+        "unique_repos": len(repositories),
+        "ratio": round(len(urls) / len(unique_urls), 2) if unique_urls else 1.0,
+        "requests_saved": requests_saved,
+    }
+    return unique_urls, group_index, dedup_stats
+
+
+def parse_shard(value):
+    """Parse a "--shard i/N" value (1 <= i <= N) into (i, N)."""
+    match = re.fullmatch(r"(\d+)/(\d+)", value.strip())
+    if not match:
+        raise argparse.ArgumentTypeError(f"shard must look like i/N, got {value!r}")
+    index, count = int(match.group(1)), int(match.group(2))
+    if not 1 <= index <= count:
+        raise argparse.ArgumentTypeError(f"shard index must be between 1 and {count}, got {index}")
+    return index, count
+
+
+def shard_of(resource_id, shard_count):
+    """Stable 1-based shard number for a resource ID (same on every machine and Python run)."""
+    digest = hashlib.sha256(resource_id.encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") % shard_count + 1
+
+
+def shard_file_path(shard_dir, shard):
+    index, count = shard
+    return os.path.join(shard_dir, f"validation-shard-{index}-of-{count}.json")
+
+
+def file_sha256(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def write_validated_rows(table, rows):
+    """
+    Write `rows`, the validated copy of `table`, to OUTPUT_FILE; a crash mid-write
+    leaves the previous table in place. With a resource store configured
+    (AWESOME_CC_RESOURCE_DB) only the changed cells are committed, so concurrent
+    jobs editing other rows or columns keep their changes.
+    """
+    store = open_resource_store(OUTPUT_FILE)
+    changes = {}
+    for position, row in enumerate(rows):
+        changed = {field: value for field, value in row.items() if table.get(position, field) != value}
+        if changed:
+            changes.setdefault(row.get(ID_HEADER_NAME, ""), {}).update(changed)
+
+    if store is None or "" in changes:
+        # Rows without an ID cannot be addressed in the store
+        if store is not None:
+            store.close()
+        with atomic_write(OUTPUT_FILE, newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=table.fieldnames)
+            writer.writeheader()
+            writer.writerows(rows)
+        return
+
+    with store:
+        missing = store.update_many(changes, export_path=OUTPUT_FILE)
+    for resource_id in missing:
+        print(f"Warning: resource {resource_id} is no longer in the resource store; its changes were dropped")
+
+
+def validate_links(
+    csv_file,
+    max_links=None,
+    ignore_overrides=False,
+    concurrency=DEFAULT_CONCURRENCY,
+    session=None,
+    use_graphql=True,
+    incremental=False,
+    max_age_hours=DEFAULT_MAX_AGE_HOURS,
+    time_budget=None,
+    request_budget=None,
+    checkpoint_path=None,
+    resume=False,
+    shard=None,
+    shard_dir=DEFAULT_SHARD_DIR,
+):
     """
     Validate links in the CSV file and update the Active status and timestamp.
+
+    URLs are validated concurrently (at most `concurrency` at a time); results are
+    applied to the rows in CSV order, so output matches a sequential run.
+    With a GitHub token, GitHub metadata is first fetched in bulk over GraphQL.
+
+    In incremental mode only rows last checked more than `max_age_hours` ago and
+    inactive rows are validated, oldest first. `time_budget` (seconds) and
+    `request_budget` (HTTP requests) stop the run early; unvalidated rows are left as-is.
+
+    With `checkpoint_path`, each URL's outcome is journaled as soon as it is known.
+    `resume` reuses the outcomes journaled by an interrupted run instead of re-checking
+    them. The CSV is replaced atomically and the journal removed once the run completes.
+
+    With `shard=(i, N)` only rows whose ID hashes to shard i are handled, and instead of
+    rewriting the CSV the changed rows and outcomes are written to a shard file in
+    `shard_dir`; merge_shards() folds all N shard files back into the CSV.
     """
+    session = session or get_shared_session()
+
     # Load overrides
-    overrides = {} if ignore_overrides else load_overrides()
+    overrides = ResourceOverrides() if ignore_overrides else load_overrides()
 
     # Read the CSV file
-    with open(csv_file, encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        rows = list(reader)
-        fieldnames = reader.fieldnames
+    table = ResourceTable.from_csv(csv_file)
+    rows = table.rows()
+
+    input_sha256 = file_sha256(csv_file) if shard else None
+    original_rows = [dict(row) for row in rows] if shard else None
+    owned_indices = []
 
     total_resources = len(rows)
     processed = 0
@@ -269,15 +555,22 @@ def validate_links(csv_file, max_links=None, ignore_overrides=False):
     locked_field_count = 0
     last_modified_updates = 0
 
-    print(f"Starting validation of {total_resources} resources...")
+    shard_label = f" [shard {shard[0]}/{shard[1]}]" if shard else ""
+    print(f"Starting validation of {total_resources} resources (concurrency: {concurrency}){shard_label}...")
     if overrides and not ignore_overrides:
         print(f"Loaded {len(overrides)} resource overrides")
 
-    for _, row in enumerate(rows):
-        if max_links and processed >= max_links:
+    # First pass: apply overrides and collect the rows that need a network check
+    pending = []  # (index, row, locked_fields) in CSV order
+    for index, row in enumerate(rows):
+        if max_links and len(pending) >= max_links and not incremental:
             print(f"\nReached maximum link limit ({max_links}). Stopping validation.")
             break
 
+        if shard and shard_of(row.get(ID_HEADER_NAME, ""), shard[1]) != shard[0]:
+            continue
+        owned_indices.append(index)
+
         # Apply overrides
         row, locked_fields, skip_validation = apply_overrides(row, overrides)
         if locked_fields:
@@ -294,15 +587,93 @@ def validate_links(csv_file, max_links=None, ignore_overrides=False):
             print(f"Skipping {row['Display Name']} - fields locked by override")
             continue
 
-        primary_url = row.get(PRIMARY_LINK_HEADER_NAME, "").strip()
-        # secondary_url = row.get(SECONDARY_LINK_HEADER_NAME, "").strip()  # Ignoring secondary URLs
+        pending.append((index, row, locked_fields))
+
+    fresh_rows = 0
+    if incremental:
+        candidates = len(pending)
+        pending = select_stale_rows(pending, max_age_hours)
+        fresh_rows = candidates - len(pending)
+        if max_links:
+            pending = pending[:max_links]
+        print(
+            f"Incremental mode: {len(pending)} rows stale (>{max_age_hours}h) or inactive, "
+            f"{fresh_rows} checked recently"
+        )
+
+    primary_urls = [row.get(PRIMARY_LINK_HEADER_NAME, "").strip() for _, row, _ in pending]
+
+    # Canonicalize and de-duplicate: each unique URL is validated once and fanned out to its rows
+    unique_urls, group_index, dedup_stats = group_urls(primary_urls)
+    if dedup_stats["unique_urls"] < dedup_stats["rows"]:
+        print(
+            f"De-duplicated {dedup_stats['rows']} URLs to {dedup_stats['unique_urls']} unique "
+            f"({dedup_stats['unique_repos']} GitHub repositories)"
+        )
+
+    # Outcomes journaled by an interrupted run are reused with their original check time
+    results_by_url = {}
+    checked_at_by_url = {}
+    checkpoint = CheckpointJournal(checkpoint_path, resume) if checkpoint_path else None
+    if checkpoint is not None:
+        for url in unique_urls:
+            entry = checkpoint.completed.get(validation_key(url))
+            if entry is not None:
+                results_by_url[url] = tuple(entry["result"])
+                checked_at_by_url[url] = entry["checked_at"]
+        if results_by_url:
+            print(f"Resuming: {len(results_by_url)} URLs already checked in the interrupted run")
+    urls_to_check = [url for url in unique_urls if url not in results_by_url]
+
+    def record_result(url, result):
+        checked_at = datetime.now().strftime(LAST_CHECKED_FORMAT)
+        checked_at_by_url[url] = checked_at
+        if checkpoint is not None:
+            checkpoint.record(validation_key(url), result=list(result), checked_at=checked_at)
+
+    # Bulk pre-pass: existence, license and last-modified for GitHub URLs in a few GraphQL queries
+    github_metadata = {}
+    graphql_stats = {"queries": 0, "repositories": 0, "resolved": 0}
+    if use_graphql and GITHUB_TOKEN:
+        github_metadata, graphql_stats = prefetch_github_metadata(urls_to_check, session, HEADERS)
+        print(
+            f"Prefetched GitHub metadata for {graphql_stats['resolved']} URLs "
+            f"in {graphql_stats['queries']} GraphQL queries"
+        )
+
+    # Second pass: validate all pending URLs concurrently
+    budget = None
+    if time_budget or request_budget:
+        budget = ValidationBudget(time_budget, request_budget, session)
+    repo_facts = RepoFacts(session)
+    checked = validate_urls_concurrently(
+        urls_to_check, concurrency, session, github_metadata, budget, repo_facts, on_result=record_result
+    )
+    results_by_url.update(zip(urls_to_check, checked, strict=True))
+    dedup_stats["requests_saved"] += repo_facts.hits
+
+    # Third pass: apply results in CSV order
+    deferred = 0
+    broken_entries = []  # broken links with their CSV index, for shard files
+    outcomes = sorted(
+        (
+            (entry, primary_url, unique_urls[position])
+            for entry, primary_url, position in zip(pending, primary_urls, group_index, strict=True)
+        ),
+        key=lambda item: item[0][0],
+    )
+    for (index, row, locked_fields), primary_url, unique_url in outcomes:
+        result = results_by_url[unique_url]
+        if result is None:
+            # Not reached before the budget ran out; checked on a later run
+            deferred += 1
+            continue
 
         # Track GitHub links
         if "github.com" in primary_url:
             github_links += 1
 
-        # Validate primary URL
-        primary_valid, primary_status, license_info, last_modified = validate_url(primary_url)
+        primary_valid, primary_status, license_info, last_modified = result
 
         # Update license if found and not locked
         if license_info and "license" not in locked_fields:
@@ -332,7 +703,7 @@ def validate_links(csv_file, max_links=None, ignore_overrides=False):
 
         # Update timestamp if not locked
         if "last_checked" not in locked_fields:
-            row[LAST_CHECKED_HEADER_NAME] = datetime.now().strftime("%Y-%m-%d:%H-%M-%S")
+            row[LAST_CHECKED_HEADER_NAME] = checked_at_by_url[unique_url]
 
         # Track broken links
         if not is_active and "active" not in locked_fields:
@@ -343,6 +714,7 @@ def validate_links(csv_file, max_links=None, ignore_overrides=False):
                 # "secondary_url": secondary_url if not secondary_valid else None,  # No longer tracking secondary URLs
             }
             broken_links.append(link_info)
+            broken_entries.append({"index": index, "link": link_info, "newly": was_active})
 
             # Check if this is a newly discovered broken link
             if was_active:
@@ -357,19 +729,69 @@ def validate_links(csv_file, max_links=None, ignore_overrides=False):
 
         processed += 1
 
-    # Write updated CSV
-    with open(OUTPUT_FILE, "w", encoding="utf-8", newline="") as f:
-        assert fieldnames is not None
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows)
+    if getattr(session, "cache", None) is not None:
+        session.cache.prune()
+    cache_stats = session.cache_stats() if hasattr(session, "cache_stats") else {}
+    counts = {
+        "processed": processed,
+        "fresh_skipped": fresh_rows,
+        "deferred": deferred,
+        "github_links": github_links,
+        "github_api_calls": github_api_calls,
+        "override_count": override_count,
+        "locked_fields": locked_field_count,
+    }
+
+    if shard:
+        # Shard runs leave the CSV alone; merge_shards() applies every shard's rows at once
+        shard_results = {
+            "version": SHARD_FILE_VERSION,
+            "shard": shard[0],
+            "shards": shard[1],
+            "input_sha256": input_sha256,
+            "rows": [
+                {"index": index, "id": rows[index].get(ID_HEADER_NAME, ""), "row": rows[index]}
+                for index in owned_indices
+                if rows[index] != original_rows[index]
+            ],
+            "broken_links": broken_entries,
+            "counts": counts,
+            "dedup": dedup_stats,
+            "graphql": graphql_stats,
+            "connections": session.stats.as_dict(),
+            "cache": cache_stats,
+        }
+        with atomic_write(shard_file_path(shard_dir, shard)) as f:
+            json.dump(shard_results, f)
+        print(f"Shard results written to {shard_file_path(shard_dir, shard)}")
+    else:
+        write_validated_rows(table, rows)
+    if checkpoint is not None:
+        checkpoint.discard()
 
     # Summary
     print("\nValidation complete!")
     print(f"Total resources: {total_resources}")
     print(f"Processed: {processed}")
+    if incremental:
+        print(f"Skipped (checked within {max_age_hours}h): {fresh_rows}")
+    if deferred:
+        print(f"Deferred (budget exhausted): {deferred}")
     print(f"GitHub links: {github_links}")
     print(f"GitHub API calls: {github_api_calls}")
+    if dedup_stats["rows"]:
+        print(
+            f"URL de-duplication: {dedup_stats['rows']} rows -> {dedup_stats['unique_urls']} unique URLs "
+            f"(ratio {dedup_stats['ratio']}, ~{dedup_stats['requests_saved']} requests saved)"
+        )
+    if graphql_stats["queries"]:
+        print(f"GraphQL metadata queries: {graphql_stats['queries']} ({graphql_stats['resolved']} URLs resolved)")
+    print(f"HTTP connections: {format_connection_stats(session.stats)}")
+    if cache_stats:
+        print(f"GitHub API cache: {format_cache_stats(cache_stats)}")
+    rate_limiter = getattr(session, "rate_limiter", None)
+    if rate_limiter is not None:
+        print(f"GitHub rate limit pacing: {format_rate_limiter_stats(rate_limiter.stats)}")
     if last_modified_updates:
         print(f"Last modified dates fetched: {last_modified_updates}")
     if override_count:
@@ -391,26 +813,190 @@ def validate_links(csv_file, max_links=None, ignore_overrides=False):
             # if link.get("secondary_url"):  # No longer reporting secondary URLs
             #     print(f"    Secondary: {link['secondary_url']}")
 
+    return build_results(
+        total_resources,
+        counts,
+        broken_links,
+        newly_broken_links,
+        dedup_stats,
+        graphql_stats,
+        session.stats.as_dict(),
+        cache_stats,
+    )
+
+
+def build_results(total, counts, broken_links, newly_broken_links, dedup, graphql, connections, cache):
+    """Results dict returned by validate_links() and merge_shards() (validation_results.json)."""
     return {
-        "total": total_resources,
-        "processed": processed,
+        "total": total,
+        "processed": counts["processed"],
+        "fresh_skipped": counts["fresh_skipped"],
+        "deferred": counts["deferred"],
         "broken": len(broken_links),
         "newly_broken": len(newly_broken_links),
-        "github_links": github_links,
-        "github_api_calls": github_api_calls,
-        "override_count": override_count,
-        "locked_fields": locked_field_count,
+        "github_links": counts["github_links"],
+        "github_api_calls": counts["github_api_calls"],
+        "override_count": counts["override_count"],
+        "locked_fields": counts["locked_fields"],
+        "dedup": dedup,
+        "graphql": graphql,
+        "connections": connections,
+        "cache": cache,
         "broken_links": broken_links,
         "newly_broken_links": newly_broken_links,
         "timestamp": datetime.now().strftime("%Y-%m-%d:%H-%M-%S"),
     }
 
 
+def _sum_stats(stats_dicts):
+    """Add up per-shard counters; the de-duplication ratio is recomputed from the totals."""
+    totals = {}
+    for stats in stats_dicts:
+        for name, value in stats.items():
+            if isinstance(value, int | float) and name != "ratio":
+                totals[name] = totals.get(name, 0) + value
+    if "rows" in totals:
+        totals["ratio"] = round(totals["rows"] / totals["unique_urls"], 2) if totals.get("unique_urls") else 1.0
+    return totals
+
+
+def merge_shards(csv_file, shard_dir=DEFAULT_SHARD_DIR):
+    """
+    Fold the shard files written by `validate_links(..., shard=(i, N))` back into the CSV.
+
+    Every shard must have run against the same CSV; the changed rows are applied by
+    CSV index and broken links are reported in CSV order, so the table and results
+    match a single-job run. Network statistics (connections, cache, de-duplication)
+    are summed across shards. Returns the same results dict as validate_links().
+    """
+    paths = sorted(glob.glob(os.path.join(shard_dir, "validation-shard-*-of-*.json")))
+    if not paths:
+        raise ValueError(f"No shard results found in {shard_dir}")
+
+    shards = []
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            shards.append(json.load(f))
+
+    shard_count = shards[0]["shards"]
+    input_sha256 = file_sha256(csv_file)
+    found = sorted(shard["shard"] for shard in shards if shard["shards"] == shard_count)
+    if len(found) != len(shards) or found != list(range(1, shard_count + 1)):
+        raise ValueError(f"Expected shards 1..{shard_count} of one run in {shard_dir}, found {paths}")
+    for shard in shards:
+        if shard.get("version") != SHARD_FILE_VERSION:
+            raise ValueError(f"Shard {shard['shard']} was written by an incompatible version")
+        if shard["input_sha256"] != input_sha256:
+            raise ValueError(f"Shard {shard['shard']} was validated against a different {csv_file}")
+
+    table = ResourceTable.from_csv(csv_file)
+    rows = table.rows()
+
+    broken_entries = []
+    for shard in shards:
+        for update in shard["rows"]:
+            index = update["index"]
+            if rows[index].get(ID_HEADER_NAME, "") != update["id"]:
+                raise ValueError(f"Shard {shard['shard']} row {index} does not match {csv_file}")
+            rows[index] = update["row"]
+        broken_entries.extend(shard["broken_links"])
+
+    write_validated_rows(table, rows)
+
+    broken_entries.sort(key=lambda entry: entry["index"])
+    broken_links = [entry["link"] for entry in broken_entries]
+    newly_broken_links = [entry["link"] for entry in broken_entries if entry["newly"]]
+    counts = _sum_stats(shard["counts"] for shard in shards)
+
+    print(f"Merged {shard_count} shards into {OUTPUT_FILE}")
+    print(f"Total resources: {len(rows)}")
+    print(f"Processed: {counts['processed']}")
+    print(f"Total broken links: {len(broken_links)}")
+    print(f"Newly broken links: {len(newly_broken_links)}")
+
+    return build_results(
+        len(rows),
+        counts,
+        broken_links,
+        newly_broken_links,
+        _sum_stats(shard["dedup"] for shard in shards),
+        _sum_stats(shard["graphql"] for shard in shards),
+        _sum_stats(shard["connections"] for shard in shards),
+        _sum_stats(shard["cache"] for shard in shards),
+    )
+
+
 def main():
     parser = argparse.ArgumentParser(description="Validate links in THE_RESOURCES_TABLE.csv")
     parser.add_argument("--max-links", type=int, help="Maximum number of links to validate")
     parser.add_argument("--github-action", action="store_true", help="Run in GitHub Action mode")
     parser.add_argument("--ignore-overrides", action="store_true", help="Ignore override configuration")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Maximum number of URLs validated in parallel (default: {DEFAULT_CONCURRENCY})",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only re-check rows whose Last Checked is older than --max-age-hours, plus inactive rows",
+    )
+    parser.add_argument(
+        "--max-age-hours",
+        type=float,
+        default=DEFAULT_MAX_AGE_HOURS,
+        help=f"Freshness window for --incremental (default: {DEFAULT_MAX_AGE_HOURS})",
+    )
+    parser.add_argument("--time-budget", type=float, help="Stop starting new validations after this many seconds")
+    parser.add_argument("--request-budget", type=int, help="Stop starting new validations after this many requests")
+    parser.add_argument(
+        "--no-graphql", action="store_true", help="Skip the batched GraphQL metadata pre-pass (REST calls only)"
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Disable the persistent GitHub API response cache")
+    parser.add_argument(
+        "--cache-ttl",
+        type=int,
+        default=DEFAULT_FRESH_SECONDS,
+        help=f"Seconds a cached response is served without revalidation (default: {DEFAULT_FRESH_SECONDS})",
+    )
+    parser.add_argument(
+        "--pool-size",
+        type=int,
+        default=DEFAULT_POOL_CONNECTIONS,
+        help=f"Number of per-host connection pools to keep alive (default: {DEFAULT_POOL_CONNECTIONS})",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        default=DEFAULT_CHECKPOINT_FILE,
+        help=f"Journal of per-URL outcomes written as they complete (default: {DEFAULT_CHECKPOINT_FILE})",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Reuse the outcomes journaled by an interrupted run instead of re-checking them",
+    )
+    parser.add_argument(
+        "--shard",
+        type=parse_shard,
+        help="Validate only shard i of N (rows assigned by a hash of the resource ID) and write shard results",
+    )
+    parser.add_argument(
+        "--shard-dir",
+        default=DEFAULT_SHARD_DIR,
+        help=f"Directory for shard result files (default: {DEFAULT_SHARD_DIR})",
+    )
+    parser.add_argument(
+        "--merge",
+        action="store_true",
+        help="Merge the shard results in --shard-dir into the CSV instead of validating",
+    )
+    parser.add_argument(
+        "--max-connections-per-host",
+        type=int,
+        default=DEFAULT_POOL_MAXSIZE,
+        help=f"Maximum open connections per host (default: {DEFAULT_POOL_MAXSIZE})",
+    )
     args = parser.parse_args()
 
     csv_file = INPUT_FILE
@@ -418,31 +1004,70 @@ def main():
         print(f"Error: CSV file not found at {csv_file}")
         sys.exit(1)
 
+    checkpoint_path = args.checkpoint
+    if args.shard and checkpoint_path == DEFAULT_CHECKPOINT_FILE:
+        # Shards may run side by side in one workspace
+        checkpoint_path = checkpoint_path.replace(".jsonl", f"-{args.shard[0]}-of-{args.shard[1]}.jsonl")
+
     try:
-        results = validate_links(csv_file, args.max_links, args.ignore_overrides)
+        if args.merge:
+            results = merge_shards(csv_file, args.shard_dir)
+            write_results_and_exit(results, args.github_action)
+
+        session = configure_shared_session(
+            args.pool_size,
+            args.max_connections_per_host,
+            use_cache=not args.no_cache,
+            cache_fresh_seconds=args.cache_ttl,
+        )
+        results = validate_links(
+            csv_file,
+            args.max_links,
+            args.ignore_overrides,
+            args.concurrency,
+            session,
+            use_graphql=not args.no_graphql,
+            incremental=args.incremental,
+            max_age_hours=args.max_age_hours,
+            time_budget=args.time_budget,
+            request_budget=args.request_budget,
+            checkpoint_path=checkpoint_path,
+            resume=args.resume,
+            shard=args.shard,
+            shard_dir=args.shard_dir,
+        )
+        session.close()
+
+        if args.shard:
+            # Broken links are reported once, by the --merge step
+            sys.exit(0)
+        write_results_and_exit(results, args.github_action)
 
-        if args.github_action:
-            # Output JSON for GitHub Action
-            # Always print the JSON results for capture by the workflow
-            print(json.dumps(results))
+    except Exception as e:
+        print(f"Error during validation: {e}")
+        sys.exit(1)
 
-            # Also write to GITHUB_OUTPUT if available
-            # github_output = os.getenv("GITHUB_OUTPUT")
-            # if github_output:
-            with open("validation_results.json", "w") as f:
-                json.dump(results, f)
 
-            # Set action failure if broken links found
-            if results["newly_broken"] > 0:
-                print(f"\n::error::Found {results['newly_broken']} newly broken links")
-                sys.exit(1)
+def write_results_and_exit(results, github_action):
+    """Report results (JSON in GitHub Action mode) and exit non-zero if links newly broke."""
+    if github_action:
+        # Output JSON for GitHub Action
+        # Always print the JSON results for capture by the workflow
+        print(json.dumps(results))
 
-        # Exit with error code if broken links found
-        sys.exit(1 if results["newly_broken"] > 0 else 0)
+        # Also write to GITHUB_OUTPUT if available
+        # github_output = os.getenv("GITHUB_OUTPUT")
+        # if github_output:
+        with atomic_write("validation_results.json") as f:
+            json.dump(results, f)
 
-    except Exception as e:
-        print(f"Error during validation: {e}")
-        sys.exit(1)
+        # Set action failure if broken links found
+        if results["newly_broken"] > 0:
+            print(f"\n::error::Found {results['newly_broken']} newly broken links")
+            sys.exit(1)
+
+    # Exit with error code if broken links found
+    sys.exit(1 if results["newly_broken"] > 0 else 0)
 
 
 if __name__ == "__main__":
@@ -18,6 +18,8 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 # Import validation functions from validate_links
 try:
+    from csv_row_index import update_row  # type: ignore[import-not-found]
+    from resource_store import open_resource_store  # type: ignore[import-not-found]
     from validate_links import (  # type: ignore[import-not-found]
         ACTIVE_HEADER_NAME,
         ID_HEADER_NAME,
@@ -178,37 +180,23 @@ def validate_and_update_resource(resource: dict[str, str]) -> bool:
 def update_csv_file(updated_resource: dict[str, str]) -> bool:
     """Update the CSV file with the validated resource data."""
     try:
-        # Read all rows
-        with open(CSV_FILE, encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            rows = list(reader)
-            fieldnames = reader.fieldnames
-
-        if not fieldnames:
-            print("Error: Could not read CSV fieldnames")
-            return False
-
-        # Find and update the matching row
         resource_id = updated_resource.get(ID_HEADER_NAME)
-        updated = False
 
-        for i, row in enumerate(rows):
-            if row.get(ID_HEADER_NAME) == resource_id:
-                # Update the row with validated data
-                rows[i].update(updated_resource)
-                updated = True
-                break
-
-        if not updated:
+        # With a resource store (AWESOME_CC_RESOURCE_DB) only this row is written
+        store = open_resource_store(CSV_FILE)
+        if store is not None:
+            with store:
+                if not store.update(resource_id, updated_resource, export_path=CSV_FILE):
+                    print(f"Warning: Could not find resource with ID {resource_id} in CSV")
+                    return False
+            print(f"\n✓ Updated {CSV_FILE} successfully")
+            return True
+
+        # Otherwise splice the new row in at its cached byte offset, leaving the rest of the file untouched
+        if not update_row(CSV_FILE, resource_id, updated_resource):
             print(f"Warning: Could not find resource with ID {resource_id} in CSV")
             return False
 
-        # Write back to CSV
-        with open(CSV_FILE, "w", encoding="utf-8", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(rows)
-
         print(f"\n✓ Updated {CSV_FILE} successfully")
         return True
 
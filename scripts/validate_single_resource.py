@@ -12,6 +12,8 @@ import sys
 from datetime import datetime
 from typing import Any
 
+import requests
+
 # Import validation functions from validate_links
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
@@ -29,6 +31,7 @@ def validate_single_resource(
     display_name: str = "",
     category: str = "",
     license: str = "NOT_FOUND",
+    session: requests.Session | None = None,
     **kwargs: Any,
 ) -> tuple[bool, dict[str, Any], list[str]]:
     """
@@ -40,6 +43,7 @@ def validate_single_resource(
         display_name: Name of the resource
         category: Resource category
         license: License information (defaults to "NOT_FOUND")
+        session: Optional HTTP session to reuse (defaults to the shared pooled session)
         **kwargs: Additional fields that may be present in the resource
 
     Returns:
@@ -65,7 +69,7 @@ def validate_single_resource(
         return False, enriched_data, errors
 
     print(f"Validating primary URL: {primary_url}")
-    primary_valid, primary_status, license_info, last_modified = validate_url(primary_url)
+    primary_valid, primary_status, license_info, last_modified = validate_url(primary_url, session=session)
 
     if not primary_valid:
         errors.append(f"Primary URL validation failed: {primary_status}")
@@ -85,7 +89,7 @@ def validate_single_resource(
     secondary_url = secondary_link.strip()
     if secondary_url:
         print(f"Validating secondary URL: {secondary_url}")
-        secondary_valid, secondary_status, _, _ = validate_url(secondary_url)
+        secondary_valid, secondary_status, _, _ = validate_url(secondary_url, session=session)
 
         if not secondary_valid:
             errors.append(f"Secondary URL validation failed: {secondary_status}")
@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+"""Tests for crash-safe writes in atomic_io.py."""
+
+import pytest
+
+from scripts.atomic_io import atomic_write
+
+
+def test_atomic_write_replaces_file(tmp_path):
+    target = tmp_path / "table.csv"
+    target.write_text("old\n", encoding="utf-8")
+    with atomic_write(target) as f:
+        f.write("new\n")
+    assert target.read_text(encoding="utf-8") == "new\n"
+    assert [p.name for p in tmp_path.iterdir()] == ["table.csv"]
+
+
+def test_failed_write_keeps_previous_file(tmp_path):
+    target = tmp_path / "table.csv"
+    target.write_text("old\n", encoding="utf-8")
+    with pytest.raises(RuntimeError), atomic_write(target) as f:
+        f.write("partial")
+        raise RuntimeError("killed mid-write")
+    assert target.read_text(encoding="utf-8") == "old\n"
+    assert [p.name for p in tmp_path.iterdir()] == ["table.csv"]
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""Tests for the content-addressed blob store."""
+
+import errno
+import io
+import os
+
+from scripts.blob_store import BlobStore, git_blob_sha
+
+
+def test_blob_sha_matches_git():
+    """Blob ids match `git hash-object`."""
+    assert git_blob_sha(b"") == "e69de29bb2d1d6434b8b29ae775ad8c2e48c5391"
+    assert git_blob_sha(b"hello\n") == "ce013625030ba8dba906f756967f9e9ca394464a"
+
+
+def test_identical_files_share_one_blob(tmp_path):
+    """Archive and hosted copies of identical content are hardlinks to a single stored blob."""
+    store = BlobStore(str(tmp_path / "blobs"))
+    archive = tmp_path / "archive"
+    sha = store.write(str(archive / "a" / "CLAUDE.md"), b"# Guide\n")
+    store.write_stream(str(archive / "b" / "CLAUDE.md"), io.BytesIO(b"# Guide\n"), 8)
+    store.mirror(str(archive), str(tmp_path / "hosted"))
+
+    blob = os.stat(store.path_for(sha))
+    assert blob.st_nlink == 5
+    assert os.stat(tmp_path / "hosted" / "b" / "CLAUDE.md").st_ino == blob.st_ino
+    assert store.stats["stored"] == 1 and store.stats["reused"] == 1 and store.stats["copied"] == 0
+
+    # Rewriting a file with new content replaces the link instead of editing the shared blob
+    new_sha = store.write(str(archive / "a" / "CLAUDE.md"), b"# Guide v2\n")
+    assert (tmp_path / "hosted" / "a" / "CLAUDE.md").read_bytes() == b"# Guide\n"
+    os.remove(tmp_path / "hosted" / "a" / "CLAUDE.md")
+    os.remove(tmp_path / "hosted" / "b" / "CLAUDE.md")
+    os.remove(archive / "b" / "CLAUDE.md")
+    assert store.prune({new_sha}) == 1
+    assert not os.path.exists(store.path_for(sha)) and os.path.exists(store.path_for(new_sha))
+
+
+def test_falls_back_to_copies_across_devices(tmp_path, monkeypatch):
+    """When hardlinks fail (EXDEV), targets become complete copies of the blob."""
+
+    def cross_device(source, target):
+        raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+    monkeypatch.setattr(os, "link", cross_device)
+    store = BlobStore(str(tmp_path / "blobs"))
+    store.write(str(tmp_path / "out" / "file.md"), b"data")
+    store.mirror(str(tmp_path / "out"), str(tmp_path / "hosted"))
+
+    assert (tmp_path / "hosted" / "file.md").read_bytes() == b"data"
+    assert store.stats["copied"] == 2 and store.stats["linked"] == 0
+    assert os.listdir(tmp_path / "out") == ["file.md"]
+
+    # Copies hold no link to their blob; a referenced blob survives pruning all the same
+    sha = store.write(str(tmp_path / "out" / "file.md"), b"data")
+    stale = store.put(b"stale")
+    assert store.prune({sha}) == 1
+    assert os.path.exists(store.path_for(sha)) and not os.path.exists(store.path_for(stale))
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""Tests for the byte-offset row index and in-place row updates in csv_row_index.py."""
+
+import csv
+import json
+import os
+
+from scripts import csv_row_index
+from scripts.csv_row_index import load_row_offsets, read_row, update_row
+from scripts.resource_table import ResourceTable
+
+FIELDNAMES = ["ID", "Display Name", "Description", "Last Checked"]
+ROWS = [
+    ["a1", "Alpha", "plain", ""],
+    ["b2", "Beta", 'multi\nline "quoted", with comma', "2025-01-01"],
+    ["c3", "Gamma", "last", ""],
+]
+
+
+def write_dictwriter(path):
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDNAMES)
+        writer.writeheader()
+        writer.writerows(dict(zip(FIELDNAMES, row, strict=True)) for row in ROWS)
+
+
+def test_update_row_matches_full_rewrite(tmp_path):
+    """Splicing one row gives the same bytes as loading and rewriting the whole table."""
+    path = tmp_path / "table.csv"
+    expected_path = tmp_path / "expected.csv"
+    cache = tmp_path / "offsets.json"
+    write_dictwriter(path)
+    write_dictwriter(expected_path)
+    expected = ResourceTable.from_csv(expected_path)
+
+    for resource_id, values in [
+        ("b2", {"Description": "now short", "Last Checked": "2025-06-01"}),
+        ("a1", {"Description": 'grown\r\nacross "lines"'}),
+        ("c3", {"Display Name": "Gamma, renamed"}),
+        ("b2", {"ID": "b9"}),
+    ]:
+        assert update_row(path, resource_id, values, cache_path=cache)
+        expected.update(expected.find_id(resource_id), values)
+        expected.write_csv(expected_path)
+        assert path.read_bytes() == expected_path.read_bytes()
+
+    assert read_row(path, "b9", cache_path=cache)["Description"] == "now short"
+    assert read_row(path, "b2", cache_path=cache) is None
+    assert not update_row(path, "zz", {"Description": "x"}, cache_path=cache)
+
+
+def test_cached_offsets_are_reused_until_the_file_changes(tmp_path, monkeypatch):
+    path = tmp_path / "table.csv"
+    cache = tmp_path / "offsets.json"
+    write_dictwriter(path)
+
+    scans = []
+    build = csv_row_index.build_row_offsets
+    monkeypatch.setattr(csv_row_index, "build_row_offsets", lambda p: scans.append(p) or build(p))
+
+    load_row_offsets(path, cache)
+    update_row(path, "c3", {"Description": "edited"}, cache_path=cache)
+    assert read_row(path, "c3", cache_path=cache)["Description"] == "edited"
+    assert len(scans) == 1
+    assert json.loads(cache.read_text())[os.path.abspath(path)]["size"] == path.stat().st_size
+
+    # Someone rewrites the file behind the index's back: the stale offsets are rebuilt
+    write_dictwriter(path)
+    os.utime(path, ns=(1, 1))
+    assert read_row(path, "c3", cache_path=cache)["Description"] == "last"
+    assert len(scans) == 2
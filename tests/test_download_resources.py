@@ -0,0 +1,478 @@
+#!/usr/bin/env python3
+"""Tests for the download worker pool in download_resources.py."""
+
+import base64
+import csv
+import io
+import json
+import os
+import tarfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from scripts import download_resources
+from scripts.blob_store import BlobStore
+from scripts.http_fixtures import FixtureSession, FixtureStore, ReplayServer, fixture_key
+from scripts.rate_limiter import RateLimiter
+
+FIELDNAMES = ["ID", "Display Name", "Category", "Primary Link", "Secondary Link", "Active", "License"]
+
+
+def write_table(path, rows):
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDNAMES)
+        writer.writeheader()
+        for row in rows:
+            writer.writerow({name: row.get(name, "") for name in FIELDNAMES})
+
+
+def snapshot(root):
+    files = {}
+    for directory, _dirs, names in os.walk(root):
+        for name in names:
+            path = os.path.join(directory, name)
+            with open(path, "rb") as f:
+                files[os.path.relpath(path, root)] = f.read()
+    return files
+
+
+def test_worker_pool_output_matches_sequential_run(tmp_path, monkeypatch, capsys):
+    """Concurrent downloads leave the same files as one worker, including the last-row-wins name clash."""
+    rows = [
+        {
+            "ID": f"res-{i}",
+            "Display Name": f"Resource {i}",
+            "Category": "Tooling",
+            "Primary Link": f"https://github.com/owner/repo-{i}/blob/main/docs/guide.md",
+            "Active": "TRUE",
+            "License": "MIT" if i % 2 else "NOT_FOUND",
+        }
+        for i in range(12)
+    ]
+    # Same display name as row 3, so both write to tooling/Resource-3/guide.md
+    rows.append({**rows[3], "ID": "res-dup", "Primary Link": "https://github.com/other/repo/blob/main/guide.md"})
+    rows.append(
+        {
+            "ID": "res-web",
+            "Display Name": "Web",
+            "Category": "Tooling",
+            "Primary Link": "https://example.com",
+            "Active": "TRUE",
+        }
+    )
+    table = tmp_path / "table.csv"
+    write_table(table, rows)
+    monkeypatch.setattr(download_resources, "CSV_FILE", str(table))
+    monkeypatch.setattr(download_resources, "load_overrides", lambda: {})
+
+    trees = {}
+    with ReplayServer(synthesize=True, latency=0.01) as server:
+        for workers in (1, 6):
+            session = FixtureSession(replay_url=server.url, rate_limiter=RateLimiter())
+            out = tmp_path / f"w{workers}"
+            download_resources.process_resources(
+                output_dir=str(out / "archive"),
+                hosted_dir=str(out / "hosted"),
+                session=session,
+                workers=workers,
+                store=BlobStore(str(tmp_path / "blobs")),
+                manifest_path=str(tmp_path / f"manifest-{workers}.json"),
+            )
+            session.close()
+            trees[workers] = snapshot(out)
+
+    assert trees[1] == trees[6]
+    assert trees[6][os.path.join("archive", "tooling", "Resource-3", "guide.md")] == (
+        b"# Synthetic content of /repos/other/repo/contents/guide.md\n"
+    )
+    assert len([path for path in trees[6] if path.startswith("hosted")]) == 6
+
+    output = capsys.readouterr().out
+    assert "Downloaded: 13" in output and "Skipped: 1" in output
+    assert "resources/s" in output and "Worker utilization:" in output
+    numbers = [line.split("]")[0] for line in output.splitlines() if line.startswith("[") and "Processing" not in line]
+    assert numbers[:13] == [f"[{n}" for n in range(1, 14)]
+
+
+def store_for(tmp_path):
+    return BlobStore(str(tmp_path / "blobs"))
+
+
+def tree_entry(path, kind="blob", mode="100644"):
+    return {"path": path, "mode": mode, "type": kind, "sha": "0" * 40}
+
+
+def json_exchange(method, url, payload):
+    return {"key": fixture_key(method, url), "status": 200, "headers": {}, "body": json.dumps(payload)}
+
+
+DIR_URL_INFO = {"type": "dir", "owner": "o", "repo": "r", "branch": "main", "path": ".claude"}
+TREE_URL = "https://api.github.com/repos/o/r/git/trees/main?recursive=1"
+
+
+def test_directory_download_mirrors_nested_tree(tmp_path):
+    """One recursive tree call resolves the subtree; nested files are fetched, symlinks and siblings are not."""
+    tree = [
+        tree_entry("README.md"),
+        tree_entry(".claude", "tree", "040000"),
+        tree_entry(".claude/settings.json"),
+        tree_entry(".claude/commands/review.md"),
+        tree_entry(".claude/commands/deep/nested.md"),
+        tree_entry(".claude/link", mode="120000"),
+        tree_entry(".claude-other/file.md"),
+    ]
+    store = FixtureStore({fixture_key("GET", TREE_URL): json_exchange("GET", TREE_URL, {"tree": tree})})
+    with ReplayServer(store, synthesize=True) as server:
+        session = FixtureSession(replay_url=server.url)
+        assert download_resources.download_github_file(
+            DIR_URL_INFO, str(tmp_path / "out"), session=session, store=store_for(tmp_path)
+        )
+        session.close()
+
+    files = snapshot(tmp_path / "out")
+    assert sorted(files) == [
+        os.path.join("commands", "deep", "nested.md"),
+        os.path.join("commands", "review.md"),
+        "settings.json",
+    ]
+    assert (
+        files["settings.json"]
+        == b"Synthetic content of https://raw.githubusercontent.com/o/r/main/.claude/settings.json\n"
+    )
+    assert server.stats["requests"] == 4
+
+
+def tarball(names):
+    """Gzipped tarball in GitHub's layout whose files contain their own names."""
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as archive:
+        for name in names:
+            data = f"content of {name}".encode()
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            archive.addfile(info, io.BytesIO(data))
+    return buffer.getvalue()
+
+
+def test_truncated_tree_falls_back_to_archive(tmp_path):
+    """A listing GitHub truncated is replaced by one streamed tarball, filtered to the directory."""
+    archive = tarball(["o-r-abc123/.claude/commands/a.md", "o-r-abc123/.claude/x/y/b.md", "o-r-abc123/src/main.py"])
+    tarball_url = "https://api.github.com/repos/o/r/tarball/main"
+    store = FixtureStore(
+        {
+            fixture_key("GET", TREE_URL): json_exchange("GET", TREE_URL, {"tree": [], "truncated": True}),
+            fixture_key("GET", tarball_url): {
+                "key": fixture_key("GET", tarball_url),
+                "status": 200,
+                "headers": {"Content-Type": "application/x-gzip"},
+                "body_base64": base64.b64encode(archive).decode("ascii"),
+            },
+        }
+    )
+    with ReplayServer(store) as server:
+        session = FixtureSession(replay_url=server.url)
+        assert download_resources.download_github_file(
+            DIR_URL_INFO, str(tmp_path / "out"), session=session, store=store_for(tmp_path)
+        )
+        session.close()
+
+    assert snapshot(tmp_path / "out") == {
+        os.path.join("commands", "a.md"): b"content of o-r-abc123/.claude/commands/a.md",
+        os.path.join("x", "y", "b.md"): b"content of o-r-abc123/.claude/x/y/b.md",
+    }
+    assert server.stats["requests"] == 2
+
+
+def test_repository_download_extracts_globs_from_pinned_commit(tmp_path):
+    """Repository links stream the tarball of the resolved commit and keep only the configured globs."""
+    sha = "c0ffee" + "0" * 34
+    head_url = "https://api.github.com/repos/o/r/commits/HEAD"
+    tarball_url = f"https://api.github.com/repos/o/r/tarball/{sha}"
+    names = ["CLAUDE.md", ".claude/settings.json", "hooks/pre/check.sh", "docs/CLAUDE.md", "src/big.bin"]
+    store = FixtureStore(
+        {
+            fixture_key("GET", head_url): {
+                "key": fixture_key("GET", head_url),
+                "status": 200,
+                "headers": {},
+                "body": sha,
+            },
+            fixture_key("GET", tarball_url): {
+                "key": fixture_key("GET", tarball_url),
+                "status": 200,
+                "headers": {},
+                "body_base64": base64.b64encode(tarball([f"o-r-c0ffee/{name}" for name in names])).decode("ascii"),
+            },
+        }
+    )
+    url_info = download_resources.parse_github_url("https://github.com/o/r")
+    with ReplayServer(store) as server:
+        session = FixtureSession(replay_url=server.url)
+        assert download_resources.download_github_file(
+            url_info, str(tmp_path / "repo"), session=session, store=store_for(tmp_path)
+        )
+        # Nothing matching the globs is an empty result, not a failure
+        assert download_resources.download_github_file(
+            url_info, str(tmp_path / "none"), session=session, repo_globs=("*.py",), store=store_for(tmp_path)
+        )
+        session.close()
+
+    assert sorted(snapshot(tmp_path / "repo")) == [
+        os.path.join(".claude", "settings.json"),
+        "CLAUDE.md",
+        os.path.join("hooks", "pre", "check.sh"),
+    ]
+    assert not os.path.exists(tmp_path / "none")
+
+
+class ChangingRepoHandler(BaseHTTPRequestHandler):
+    """GitHub stand-in behind a FixtureSession: serves `server.files` and honours If-None-Match."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):  # noqa: N802
+        files = self.server.files
+        if self.path.endswith("/rate_limit"):
+            body = b"{}"
+        elif "/git/trees/" in self.path:
+            self.server.requests.append("tree")
+            tree = [
+                {"path": f".claude/{name}", "mode": "100644", "type": "blob", "sha": sha}
+                for name, (sha, _) in files.items()
+            ]
+            body = json.dumps({"sha": "t" + "".join(sha for sha, _ in files.values()), "tree": tree}).encode()
+        else:
+            name = self.path.rsplit("/.claude/", 1)[1]
+            self.server.requests.append(name)
+            body = files[name][1]
+        etag = '"' + str(hash(body)) + '"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def test_incremental_sync_fetches_only_changes_and_prunes(tmp_path, monkeypatch):
+    """An unchanged directory costs one 304; a change fetches only new blobs and prunes deleted files."""
+    from scripts.blob_store import git_blob_sha
+
+    def blob(data):
+        return git_blob_sha(data), data
+
+    table = tmp_path / "table.csv"
+    write_table(
+        table,
+        [
+            {
+                "ID": "res-dir",
+                "Display Name": "Commands",
+                "Category": "Slash-Commands",
+                "Primary Link": "https://github.com/o/r/tree/main/.claude",
+                "Active": "TRUE",
+                "License": "MIT",
+            }
+        ],
+    )
+    monkeypatch.setattr(download_resources, "CSV_FILE", str(table))
+    monkeypatch.setattr(download_resources, "load_overrides", lambda: {})
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ChangingRepoHandler)
+    server.requests = []
+    server.files = {"a.md": blob(b"a"), "sub/b.md": blob(b"b")}
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    store = BlobStore(str(tmp_path / "blobs"))
+    archive = tmp_path / "archive" / "slash-commands" / "Commands"
+    hosted = tmp_path / "hosted" / "slash-commands" / "Commands"
+
+    def sync():
+        server.requests.clear()
+        session = FixtureSession(replay_url=f"http://127.0.0.1:{server.server_address[1]}")
+        download_resources.process_resources(
+            output_dir=str(tmp_path / "archive"),
+            hosted_dir=str(tmp_path / "hosted"),
+            session=session,
+            store=store,
+            manifest_path=str(tmp_path / "manifest.json"),
+        )
+        session.close()
+        return sorted(server.requests)
+
+    try:
+        assert sync() == ["a.md", "sub/b.md", "tree"]
+        assert sync() == ["tree"]
+
+        server.files = {"a.md": blob(b"a"), "c.md": blob(b"c")}
+        assert sync() == ["c.md", "tree"]
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    for root in (archive, hosted):
+        assert snapshot(root) == {"a.md": b"a", "c.md": b"c"}
+    assert not (archive / "sub").exists() and not (hosted / "sub").exists()
+    manifest = json.loads((tmp_path / "manifest.json").read_text())["resources"]["res-dir"]
+    assert manifest["files"] == {"a.md": git_blob_sha(b"a"), "c.md": git_blob_sha(b"c")}
+    assert manifest["hosted_path"] == str(hosted)
+    blobs = {
+        prefix + name for prefix in os.listdir(tmp_path / "blobs") for name in os.listdir(tmp_path / "blobs" / prefix)
+    }
+    assert blobs == {git_blob_sha(b"a"), git_blob_sha(b"c")}
+
+
+class RepoWithoutMatchesHandler(BaseHTTPRequestHandler):
+    """Repository whose pinned commit honours If-None-Match and whose tarball has no file matching the globs."""
+
+    protocol_version = "HTTP/1.1"
+    sha = "d00d" + "0" * 36
+
+    def do_GET(self):  # noqa: N802
+        etag = None
+        if self.path.endswith("/rate_limit"):
+            body = b"{}"
+        elif self.path.endswith("/commits/HEAD"):
+            self.server.requests.append("commit")
+            etag = f'"{self.sha}"'
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            body = self.sha.encode()
+        else:
+            self.server.requests.append("tarball")
+            body = tarball(["o-r-d00d/src/main.py", "o-r-d00d/README.md"])
+        self.send_response(200)
+        if etag:
+            self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def test_repository_without_matching_files_is_synced_once(tmp_path, monkeypatch, capsys):
+    """A repository with no file matching the globs is recorded by commit, so the next run skips the tarball."""
+    table = tmp_path / "table.csv"
+    write_table(
+        table,
+        [
+            {
+                "ID": "res-repo",
+                "Display Name": "Plain Repo",
+                "Category": "Tooling",
+                "Primary Link": "https://github.com/o/r",
+                "Active": "TRUE",
+                "License": "MIT",
+            }
+        ],
+    )
+    monkeypatch.setattr(download_resources, "CSV_FILE", str(table))
+    monkeypatch.setattr(download_resources, "load_overrides", lambda: {})
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), RepoWithoutMatchesHandler)
+    server.requests = []
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    store = BlobStore(str(tmp_path / "blobs"))
+
+    def sync():
+        server.requests.clear()
+        session = FixtureSession(replay_url=f"http://127.0.0.1:{server.server_address[1]}")
+        download_resources.process_resources(
+            output_dir=str(tmp_path / "archive"),
+            hosted_dir=str(tmp_path / "hosted"),
+            session=session,
+            store=store,
+            manifest_path=str(tmp_path / "manifest.json"),
+        )
+        session.close()
+        return server.requests
+
+    try:
+        assert sync() == ["commit", "tarball"]
+        assert sync() == ["commit"]
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    out = capsys.readouterr().out
+    assert "Download failed" not in out and "Failed to link" not in out
+    manifest = json.loads((tmp_path / "manifest.json").read_text())["resources"]["res-repo"]
+    assert manifest["files"] == {} and manifest["ref"] == RepoWithoutMatchesHandler.sha
+
+
+LARGE_FILE_SIZE = 16 * 1024 * 1024
+PIECE = bytes(range(256)) * 256
+
+
+class LargeFileHandler(BaseHTTPRequestHandler):
+    """Serves a 16 MiB body in small writes, plus a gist whose only file the API truncated."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):  # noqa: N802
+        if self.path.endswith("/gists/g1"):
+            gist = {
+                "files": {
+                    "big.txt": {
+                        "content": "cut off",
+                        "truncated": True,
+                        "raw_url": "https://gist.githubusercontent.com/u/g1/raw/abc/big.txt",
+                    }
+                }
+            }
+            body = json.dumps(gist).encode()
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+        self.send_response(200)
+        self.send_header("Content-Length", str(LARGE_FILE_SIZE))
+        self.end_headers()
+        for _ in range(LARGE_FILE_SIZE // len(PIECE)):
+            self.wfile.write(PIECE)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def test_large_files_stream_with_flat_memory(tmp_path):
+    """File bodies and truncated gist files are streamed to disk without buffering them whole."""
+    import tracemalloc
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), LargeFileHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    session = FixtureSession(replay_url=f"http://127.0.0.1:{server.server_address[1]}")
+    store = store_for(tmp_path)
+    file_info = download_resources.parse_github_url("https://github.com/o/r/blob/main/big.bin")
+    gist_info = download_resources.parse_github_url("https://gist.github.com/u/g1")
+    try:
+        tracemalloc.start()
+        assert download_resources.download_github_file(
+            file_info, str(tmp_path / "big.bin"), session=session, store=store
+        )
+        assert download_resources.download_github_file(gist_info, str(tmp_path / "gist"), session=session, store=store)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        session.close()
+        server.shutdown()
+        server.server_close()
+
+    assert peak < LARGE_FILE_SIZE / 8
+    assert os.path.getsize(tmp_path / "big.bin") == LARGE_FILE_SIZE
+    assert os.path.getsize(tmp_path / "gist" / "big.txt") == LARGE_FILE_SIZE
+    assert os.path.samefile(tmp_path / "big.bin", tmp_path / "gist" / "big.txt")
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""Tests for section rendering in generate_readme.py."""
+
+from scripts.generate_readme import build_resource_index, format_resource_entry, generate_section_content
+
+
+def row(name, category, sub_category="", **fields):
+    return {
+        "Display Name": name,
+        "Primary Link": f"https://example.com/{name}",
+        "Category": category,
+        "Sub-Category": sub_category,
+        **fields,
+    }
+
+
+def test_index_groups_rows_once_in_csv_order():
+    """Entries are grouped by (category, sub-category) and keep CSV order; unknown groups are simply unused."""
+    rows = [
+        row("b", "Tooling", "IDE Integrations"),
+        row("a", "Tooling", Description="desc", License="MIT", **{"Author Name": "me"}),
+        row("c", "Tooling", " IDE Integrations "),
+        row("d", "Hooks"),
+        row("e", "Tooling", "Retired"),
+    ]
+    index = build_resource_index(rows)
+    assert index[("Tooling", "IDE Integrations")] == [format_resource_entry(rows[0]), format_resource_entry(rows[2])]
+
+    section = {
+        "title": "Tooling",
+        "icon": "🧰",
+        "category": "Tooling",
+        "subsections": [{"title": "IDE Integrations", "sub_category": "IDE Integrations"}],
+    }
+    assert generate_section_content(section, rows, index) == generate_section_content(section, rows)
+    assert generate_section_content(section, rows, index) == (
+        "## Tooling 🧰\n\n"
+        "[`a`](https://example.com/a) &nbsp; by &nbsp; me  &nbsp;&nbsp;⚖️&nbsp;&nbsp;MIT  \ndesc\n\n\n"
+        "### IDE Integrations\n\n"
+        "[`b`](https://example.com/b)  \n\n"
+        "[`c`](https://example.com/c)\n"
+    )
+
+
+def test_unchanged_inputs_skip_render_and_changes_rerender_one_section(tmp_path, monkeypatch, capsys):
+    """A second run with the same inputs does nothing; editing one row re-renders only its section."""
+    import csv
+    import shutil
+
+    from scripts import generate_readme
+
+    backups = []
+    monkeypatch.setattr(generate_readme, "create_backup", lambda path: backups.append(path) or None)
+    templates = tmp_path / "templates"
+    shutil.copytree("templates", templates)
+    rows = [
+        {
+            "ID": "t1",
+            "Display Name": "Tool",
+            "Category": "Tooling",
+            "Primary Link": "https://a.example",
+            "Active": "TRUE",
+        },
+        {
+            "ID": "h1",
+            "Display Name": "Hook",
+            "Category": "Hooks",
+            "Primary Link": "https://b.example",
+            "Active": "TRUE",
+        },
+    ]
+
+    def write_csv():
+        with open(tmp_path / "table.csv", "w", encoding="utf-8", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=["ID", "Display Name", "Category", "Primary Link", "Active"])
+            writer.writeheader()
+            writer.writerows(rows)
+
+    def generate(output="README.md", cache="cache.json"):
+        return generate_readme.generate_readme_from_templates(
+            str(tmp_path / "table.csv"),
+            str(templates),
+            str(tmp_path / output),
+            cache_path=cache and str(tmp_path / cache),
+        )
+
+    write_csv()
+    assert generate() == (2, None)
+    assert "(0 from cache)" in capsys.readouterr().out
+    mtime = (tmp_path / "README.md").stat().st_mtime_ns
+
+    assert generate() == (2, None)
+    assert "nothing to do" in capsys.readouterr().out
+    assert (tmp_path / "README.md").stat().st_mtime_ns == mtime
+    assert len(backups) == 1
+
+    rows[1]["Display Name"] = "Renamed Hook"
+    write_csv()
+    generate()
+    sections = sum(
+        1
+        for s in generate_readme.load_structure(templates / "readme-structure.yaml")["sections"]
+        if s.get("source") == "csv"
+    )
+    assert f"Rendered 1 of {sections} sections" in capsys.readouterr().out
+    generate(output="fresh.md", cache=None)
+    assert (tmp_path / "README.md").read_text(encoding="utf-8") == (tmp_path / "fresh.md").read_text(encoding="utf-8")
+    assert "Renamed Hook" in (tmp_path / "README.md").read_text(encoding="utf-8")
+
+
+def test_locales_share_one_csv_load_and_unchanged_outputs_are_not_rewritten(tmp_path, monkeypatch, capsys):
+    """Every locale renders from one CSV load; a locale whose template changed is the only one rendered again."""
+    import shutil
+
+    from scripts import generate_readme
+
+    monkeypatch.setattr(generate_readme, "create_backup", lambda path: None)
+    loads = []
+    load_resources = generate_readme.load_resources
+    monkeypatch.setattr(generate_readme, "load_resources", lambda *args: loads.append(args) or load_resources(*args))
+    templates = tmp_path / "templates"
+    shutil.copytree("templates", templates)
+    (templates / "README.zh.template.md").write_text("# 资源\n\n{{TABLE_OF_CONTENTS}}\n\n{{BODY_SECTIONS}}")
+    structure = (templates / "readme-structure.yaml").read_text(encoding="utf-8")
+    (templates / "readme-structure.zh.yaml").write_text(structure.replace('title: "Tooling"', 'title: "工具"'))
+    (templates / "readme-locales.yaml").write_text(
+        "locales:\n"
+        "  - locale: en\n"
+        "    output: README-en.md\n"
+        "  - locale: zh\n"
+        "    template: README.zh.template.md\n"
+        "    structure: readme-structure.zh.yaml\n"
+        "    output: README-zh.md\n"
+    )
+    (tmp_path / "table.csv").write_text(
+        "ID,Display Name,Category,Primary Link,Active\nt1,Tool,Tooling,https://a.example,TRUE\n", encoding="utf-8"
+    )
+
+    def generate(**kwargs):
+        results = generate_readme.generate_readmes(
+            str(tmp_path / "table.csv"), str(templates), cache_path=str(tmp_path / "cache.json"), **kwargs
+        )
+        return [result["status"] for result in results]
+
+    assert generate() == ["written", "written"]
+    assert len(loads) == 1
+    assert "## 工具" in (tmp_path / "README-zh.md").read_text(encoding="utf-8")
+    assert "## Tooling" in (tmp_path / "README-en.md").read_text(encoding="utf-8")
+    capsys.readouterr()
+
+    (templates / "README.zh.template.md").write_text("# 资源列表\n\n{{TABLE_OF_CONTENTS}}\n\n{{BODY_SECTIONS}}")
+    assert generate() == ["unchanged", "written"]
+    # A new template invalidates every fragment of its locale
+    assert "(0 from cache)" in capsys.readouterr().out
+
+    mtime = (tmp_path / "README-en.md").stat().st_mtime_ns
+    assert generate(force=True) == ["identical", "identical"]
+    assert (tmp_path / "README-en.md").stat().st_mtime_ns == mtime
+    assert len(loads) == 3
+
+
+def test_code_changes_invalidate_cached_fragments(tmp_path, monkeypatch, capsys):
+    """Editing the entry formatter re-renders every section, even though no section or row changed."""
+    import shutil
+
+    from scripts import generate_readme
+
+    monkeypatch.setattr(generate_readme, "create_backup", lambda path: None)
+    templates = tmp_path / "templates"
+    shutil.copytree("templates", templates)
+    (tmp_path / "table.csv").write_text(
+        "ID,Display Name,Category,Primary Link,Active\nt1,Tool,Tooling,https://a.example,TRUE\n", encoding="utf-8"
+    )
+    source = tmp_path / "generate_readme.py"
+    shutil.copy(generate_readme.__file__, source)
+    monkeypatch.setattr(generate_readme, "RENDER_CODE_FILES", [str(source)])
+
+    def generate():
+        generate_readme.generate_readmes(
+            str(tmp_path / "table.csv"),
+            str(templates),
+            targets=[{**generate_readme.DEFAULT_TARGET, "output": "README-out.md"}],
+            cache_path=str(tmp_path / "cache.json"),
+        )
+        return (tmp_path / "README-out.md").read_text(encoding="utf-8")
+
+    generate()
+    capsys.readouterr()
+
+    # The formatter is edited: its source changes and so does what it renders
+    format_resource_entry = generate_readme.format_resource_entry
+    monkeypatch.setattr(generate_readme, "format_resource_entry", lambda row: format_resource_entry(row) + " NEW")
+    source.write_text(source.read_text(encoding="utf-8") + "\n# edited\n", encoding="utf-8")
+
+    assert "[`Tool`](https://a.example)   NEW" in generate()
+    assert "(0 from cache)" in capsys.readouterr().out
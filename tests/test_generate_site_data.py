@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""Tests for the static site data bundle built by generate_site_data.py."""
+
+import json
+
+from scripts.generate_site_data import MANIFEST_NAME, build_bundle, search_candidates, write_bundle
+
+STRUCTURE = {
+    "sections": [
+        {"id": "tooling", "title": "Tooling", "icon": "🧰", "category": "Tooling", "source": "csv"},
+        {"id": "hooks", "title": "Hooks", "category": "Hooks", "source": "csv"},
+        {"id": "empty", "title": "Empty", "category": "Empty", "source": "csv"},
+    ]
+}
+
+
+def row(name, category, **fields):
+    return {"ID": name, "Display Name": name, "Category": category, "Primary Link": f"https://x/{name}", **fields}
+
+
+def test_bundle_shards_categories_and_indexes_trigrams(tmp_path):
+    rows = [
+        row("hook-runner", "Hooks", Description="Runs lifecycle hooks", License="MIT"),
+        row("Linter", "Tooling", **{"Author Name": "Ada", "License": "NOT_FOUND"}),
+        row("Formatter", "Tooling", Description="Formats code after every hook"),
+        row("Stray", "Misc Things"),
+    ]
+    files = build_bundle(rows, STRUCTURE)
+    manifest = json.loads(files[MANIFEST_NAME])
+    assert [(c["id"], c["offset"], c["count"]) for c in manifest["categories"]] == [
+        ("tooling", 0, 2),
+        ("hooks", 2, 1),
+        ("misc-things", 3, 1),
+    ]
+    assert manifest["total"] == 4 and manifest["licenses"] == {"": 3, "MIT": 1}
+    tooling = json.loads(files[manifest["categories"][0]["shard"]])
+    assert tooling["resources"][0] == {"id": "Linter", "name": "Linter", "url": "https://x/Linter", "author": "Ada"}
+
+    index = json.loads(files[manifest["search"]])
+    assert search_candidates(index, "HOOK") == [1, 2]
+    assert search_candidates(index, "ada") == [0]
+    assert search_candidates(index, "nothing like it") == []
+    assert search_candidates(index, "ho") is None
+
+    assert write_bundle(files, tmp_path) == (len(files), 0)
+    assert write_bundle(files, tmp_path) == (0, 0)
+    rows[0]["Description"] = "Runs hooks"
+    changed = build_bundle(rows, STRUCTURE)
+    # The hooks shard, the index and the manifest change; the old shard and index are removed
+    assert write_bundle(changed, tmp_path) == (3, 2)
+    assert sorted(str(p.relative_to(tmp_path)) for p in tmp_path.rglob("*.json")) == sorted(changed)
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""Tests for the persistent GitHub API response cache, run against a local stand-in server."""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from scripts.github_cache import ResponseCache
+from scripts.http_client import PooledSession
+
+
+class ETagHandler(BaseHTTPRequestHandler):
+    """Serves a JSON body with a fixed ETag and answers matching conditional requests with 304."""
+
+    protocol_version = "HTTP/1.1"
+    hits: list[str] = []
+
+    def do_GET(self):  # noqa: N802
+        ETagHandler.hits.append(self.path)
+        etag = f'"{self.path}-v1"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = b'{"license": {"spdx_id": "MIT"}}' + b" " * 200
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def run_with_cache(tmp_path, pool_maxsize=None, **cache_kwargs):
+    """Start the stand-in server and return (server, session, base_url)."""
+    ETagHandler.hits = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ETagHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    cache = ResponseCache(str(tmp_path / "cache.sqlite"), hosts={"127.0.0.1"}, **cache_kwargs)
+    pool_kwargs = {} if pool_maxsize is None else {"pool_maxsize": pool_maxsize}
+    session = PooledSession(cache=cache, **pool_kwargs)
+    return server, session, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def test_fresh_entries_are_served_without_a_request(tmp_path):
+    server, session, base_url = run_with_cache(tmp_path, fresh_seconds=3600)
+    try:
+        first = session.get(f"{base_url}/repos/a/b")
+        second = session.get(f"{base_url}/repos/a/b")
+
+        assert first.json() == second.json() == {"license": {"spdx_id": "MIT"}}
+        assert ETagHandler.hits == ["/repos/a/b"]
+        assert session.cache_stats()["misses"] == 1
+        assert session.cache_stats()["hits"] == 1
+    finally:
+        session.close()
+        server.shutdown()
+
+
+def test_stale_entries_are_revalidated_with_etag(tmp_path):
+    server, session, base_url = run_with_cache(tmp_path, fresh_seconds=0)
+    try:
+        session.get(f"{base_url}/repos/a/b")
+        revalidated = session.get(f"{base_url}/repos/a/b")
+
+        assert revalidated.status_code == 200
+        assert revalidated.json() == {"license": {"spdx_id": "MIT"}}
+        assert len(ETagHandler.hits) == 2
+        assert session.cache_stats()["revalidated"] == 1
+    finally:
+        session.close()
+        server.shutdown()
+
+
+def test_revalidations_release_their_pooled_connection(tmp_path):
+    """Each 304 must return its connection to the pool, or a blocking pool of one hangs on the next request."""
+    server, session, base_url = run_with_cache(tmp_path, pool_maxsize=1, fresh_seconds=0)
+    try:
+        results = []
+        worker = threading.Thread(
+            target=lambda: results.extend(session.get(f"{base_url}/repos/a/b").status_code for _ in range(5)),
+            daemon=True,
+        )
+        worker.start()
+        worker.join(timeout=10)
+
+        assert not worker.is_alive(), "request blocked waiting for a pooled connection"
+        assert results == [200] * 5
+        assert session.cache_stats()["revalidated"] == 4
+        assert session.stats.connections_opened == 1
+    finally:
+        session.close()
+        server.shutdown()
+
+
+def test_cache_persists_across_sessions(tmp_path):
+    server, session, base_url = run_with_cache(tmp_path, fresh_seconds=3600)
+    try:
+        session.get(f"{base_url}/repos/a/b")
+        session.close()
+
+        cache = ResponseCache(str(tmp_path / "cache.sqlite"), hosts={"127.0.0.1"})
+        session = PooledSession(cache=cache)
+        session.get(f"{base_url}/repos/a/b")
+
+        assert len(ETagHandler.hits) == 1
+        assert session.cache_stats()["hits"] == 1
+    finally:
+        session.close()
+        server.shutdown()
+
+
+def test_cache_keys_include_auth_scope(tmp_path):
+    server, session, base_url = run_with_cache(tmp_path, fresh_seconds=3600)
+    try:
+        session.get(f"{base_url}/repos/a/b", headers={"Authorization": "Bearer one"})
+        session.get(f"{base_url}/repos/a/b", headers={"Authorization": "Bearer two"})
+
+        assert len(ETagHandler.hits) == 2
+    finally:
+        session.close()
+        server.shutdown()
+
+
+def test_prune_evicts_least_recently_used_over_size_limit(tmp_path):
+    server, session, base_url = run_with_cache(tmp_path, fresh_seconds=3600, max_bytes=500)
+    try:
+        for name in ("a", "b", "c"):
+            session.get(f"{base_url}/repos/{name}/x")
+
+        assert session.cache.prune() == 1
+        session.get(f"{base_url}/repos/c/x")
+        session.get(f"{base_url}/repos/a/x")
+
+        assert ETagHandler.hits[-1] == "/repos/a/x"
+        assert ETagHandler.hits.count("/repos/c/x") == 1
+    finally:
+        session.close()
+        server.shutdown()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Tests for the batched GraphQL metadata fetcher, run against a local stand-in server."""
+
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from scripts.github_graphql import build_query, parse_github_ref, prefetch_github_metadata
+
+REPOSITORY_SELECTION = re.compile(r'(r\d+): repository\(owner: "([^"]+)", name: "([^"]+)"\)')
+
+
+class FakeGraphQLHandler(BaseHTTPRequestHandler):
+    """Answers repository() selections; repositories named 'missing' do not exist."""
+
+    queries: list[str] = []
+
+    def do_POST(self):  # noqa: N802
+        length = int(self.headers["Content-Length"])
+        query = json.loads(self.rfile.read(length))["query"]
+        FakeGraphQLHandler.queries.append(query)
+
+        data = {}
+        errors = []
+        for alias, _owner, name in REPOSITORY_SELECTION.findall(query):
+            if name == "missing":
+                data[alias] = None
+                errors.append({"type": "NOT_FOUND", "path": [alias]})
+                continue
+            history = {"history": {"nodes": [{"committedDate": "2025-07-01T12:30:00Z"}]}}
+            data[alias] = {
+                "licenseInfo": {"spdxId": "MIT"},
+                "defaultBranchRef": {"target": history},
+                "commit": history,
+                "file": {"__typename": "Blob"},
+            }
+
+        body = json.dumps({"data": data, "errors": errors}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def test_parse_github_ref():
+    """File and repository URLs map to (owner, repo, ref, path) keys."""
+    assert parse_github_ref("https://github.com/a/b") == ("a", "b", None, None)
+    assert parse_github_ref("https://github.com/a/b/blob/main/docs/x.md") == ("a", "b", "main", "docs/x.md")
+    assert parse_github_ref("https://example.com/a/b") is None
+
+
+def test_build_query_escapes_values():
+    """Owner, repo, ref and path values are emitted as quoted GraphQL strings."""
+    query = build_query([("a", "b", "main", 'dir/"quoted".md')])
+    assert 'repository(owner: "a", name: "b")' in query
+    assert 'path: "dir/\\"quoted\\".md"' in query
+
+
+def test_prefetch_resolves_many_repositories_in_one_query():
+    """Dozens of URLs are resolved by a single request, duplicates included once."""
+    FakeGraphQLHandler.queries = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeGraphQLHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        urls = [f"https://github.com/owner/repo-{i}" for i in range(30)]
+        urls += [
+            "https://github.com/owner/repo-0/",
+            "https://github.com/owner/repo-1/blob/main/CLAUDE.md",
+            "https://github.com/owner/missing",
+            "https://example.com/not-github",
+        ]
+        endpoint = f"http://127.0.0.1:{server.server_address[1]}/graphql"
+
+        metadata, stats = prefetch_github_metadata(urls, requests.Session(), {}, endpoint=endpoint)
+
+        assert len(FakeGraphQLHandler.queries) == 1
+        assert stats == {"queries": 1, "repositories": 32, "resolved": 33}
+        assert metadata["https://github.com/owner/repo-0"] == {
+            "exists": True,
+            "license": "MIT",
+            "last_modified": "2025-07-01:12-30-00",
+        }
+        assert metadata["https://github.com/owner/repo-1/blob/main/CLAUDE.md"]["exists"] is True
+        assert metadata["https://github.com/owner/missing"]["exists"] is False
+        assert "https://example.com/not-github" not in metadata
+    finally:
+        server.shutdown()
+
+
+def test_prefetch_splits_batches():
+    """More keys than batch_size are spread over several queries."""
+    FakeGraphQLHandler.queries = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeGraphQLHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        urls = [f"https://github.com/owner/repo-{i}" for i in range(25)]
+        endpoint = f"http://127.0.0.1:{server.server_address[1]}/graphql"
+
+        metadata, stats = prefetch_github_metadata(urls, requests.Session(), {}, batch_size=10, endpoint=endpoint)
+
+        assert stats["queries"] == 3
+        assert len(metadata) == 25
+    finally:
+        server.shutdown()
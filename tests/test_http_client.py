@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""Tests for the pooled HTTP session in http_client.py."""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from scripts.http_client import PooledSession
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    """Answers every GET with a small body over a persistent HTTP/1.1 connection."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):  # noqa: N802
+        body = b"ok"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def test_pooled_session_reuses_connections():
+    """Sequential requests to one host share a single keep-alive connection."""
+    server = start_server()
+    try:
+        session = PooledSession()
+        base_url = f"http://127.0.0.1:{server.server_address[1]}"
+        for i in range(5):
+            assert session.get(f"{base_url}/item/{i}", timeout=5).text == "ok"
+
+        stats = session.stats.as_dict()
+        assert stats == {"requests": 5, "connections_opened": 1, "connections_reused": 4}
+    finally:
+        server.shutdown()
+
+
+def test_pooled_session_caps_connections_per_host():
+    """Concurrent requests never open more than pool_maxsize connections to one host."""
+    server = start_server()
+    try:
+        session = PooledSession(pool_maxsize=2)
+        base_url = f"http://127.0.0.1:{server.server_address[1]}"
+        threads = [threading.Thread(target=session.get, args=(f"{base_url}/{i}",)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert session.stats.requests == 8
+        assert session.stats.connections_opened <= 2
+    finally:
+        server.shutdown()
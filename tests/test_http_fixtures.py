@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""Tests for the record/replay layer in http_fixtures.py."""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from scripts.http_fixtures import FixtureSession, FixtureStore, ReplayServer
+
+
+class OriginHandler(BaseHTTPRequestHandler):
+    """Stands in for a real origin server being recorded."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):  # noqa: N802
+        body = f"origin says {self.path}".encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain")
+        self.send_header("ETag", '"v1"')
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def test_recorded_exchanges_replay_under_original_urls(tmp_path):
+    """A recording replays through the stand-in server while callers keep using the real URLs."""
+    origin = ThreadingHTTPServer(("127.0.0.1", 0), OriginHandler)
+    threading.Thread(target=origin.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{origin.server_address[1]}/docs/readme?ref=main"
+    fixture_path = tmp_path / "fixtures.json"
+    try:
+        recorder = FixtureSession(record_path=str(fixture_path))
+        assert recorder.get(url, timeout=5).text == "origin says /docs/readme?ref=main"
+        recorder.close()
+    finally:
+        origin.shutdown()
+        origin.server_close()
+
+    with ReplayServer(FixtureStore.load(fixture_path)) as server:
+        session = FixtureSession(replay_url=server.url)
+        response = session.get(url, timeout=5)
+        missing = session.get(url.replace("readme", "other"), timeout=5)
+        session.close()
+
+    assert response.status_code == 200
+    assert response.text == "origin says /docs/readme?ref=main"
+    assert response.headers["ETag"] == '"v1"'
+    assert response.url == url
+    assert missing.status_code == 404
+    assert server.stats["replayed"] == 1 and server.stats["misses"] == 1
+
+
+def test_replay_server_injects_faults_and_synthesizes_github():
+    """Fault injection is seeded; synthetic GitHub answers carry rate limit headers."""
+    with ReplayServer(synthesize=True, error_rate=0.5, rate_limit_rate=0.5, retry_after=0, seed=1) as server:
+        session = FixtureSession(replay_url=server.url)
+        statuses = [session.get("https://api.github.com/repos/o/r", timeout=5).status_code for _ in range(20)]
+        session.close()
+    assert set(statuses) == {503, 429}
+    assert server.stats["errors"] + server.stats["rate_limited"] == 20
+
+    with ReplayServer(synthesize=True) as server:
+        session = FixtureSession(replay_url=server.url)
+        response = session.get("https://api.github.com/repos/o/r", timeout=5)
+        session.close()
+    assert response.json()["license"]["spdx_id"] == "MIT"
+    assert response.headers["X-RateLimit-Remaining"] == "4999"
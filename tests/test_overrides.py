@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""Tests for the compiled resource overrides in overrides.py."""
+
+from scripts import overrides as overrides_module
+from scripts.generate_readme import apply_overrides as readme_apply_overrides
+from scripts.overrides import ResourceOverrides, apply_overrides, load_overrides
+
+OVERRIDES_YAML = """\
+overrides:
+  wf-1:
+    license: "LicenseRef-MIT-Commons-Clause"
+    license_locked: true
+    active_locked: false
+    notes: "Has Commons Clause restriction"
+  tool-2:
+    skip_validation: true
+    last_checked: "2025-01-01:00-00-00"
+    description_locked: true
+  empty-3:
+"""
+
+
+def test_compiled_overrides_set_fields_locks_and_skip(tmp_path):
+    path = tmp_path / "resource-overrides.yaml"
+    path.write_text(OVERRIDES_YAML, encoding="utf-8")
+    overrides = load_overrides(path)
+
+    assert len(overrides) == 3 and "wf-1" in overrides
+    row, locked, skip = overrides.apply({"ID": "wf-1", "License": "MIT", "Active": "TRUE"})
+    assert row == {"ID": "wf-1", "License": "LicenseRef-MIT-Commons-Clause", "Active": "TRUE"}
+    assert locked == {"license"} and skip is False
+
+    row, locked, skip = apply_overrides({"ID": "tool-2"}, overrides)
+    assert row == {"ID": "tool-2", "Last Checked": "2025-01-01:00-00-00"}
+    assert locked == {"description"} and skip is True
+
+    assert overrides.apply({"ID": "empty-3"}) == ({"ID": "empty-3"}, set(), False)
+    assert overrides.apply({"ID": "other"}) == ({"ID": "other"}, set(), False)
+    # The per-script wrappers accept compiled overrides and plain dicts alike
+    assert readme_apply_overrides({"ID": "x", "Active": "TRUE"}, {"x": {"active": "FALSE"}}) == {
+        "ID": "x",
+        "Active": "FALSE",
+    }
+    assert len(load_overrides(tmp_path / "missing.yaml")) == 0
+
+
+def test_overrides_are_parsed_once_per_file_content(tmp_path, monkeypatch):
+    path = tmp_path / "resource-overrides.yaml"
+    path.write_text(OVERRIDES_YAML, encoding="utf-8")
+    parses = []
+    parse = overrides_module.parse_overrides
+    monkeypatch.setattr(overrides_module, "parse_overrides", lambda content: parses.append(1) or parse(content))
+
+    first = load_overrides(path)
+    assert load_overrides(path) is first and len(parses) == 1
+
+    path.write_text("overrides:\n  only-1:\n    active: 'FALSE'\n", encoding="utf-8")
+    second = load_overrides(path)
+    assert isinstance(second, ResourceOverrides) and len(parses) == 2
+    assert list(second.data) == ["only-1"]
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""Tests for the batch mode of parse_issue_form.py."""
+
+import csv
+import io
+import json
+import sys
+import threading
+import time
+
+from scripts import parse_issue_form
+
+FIELDNAMES = ["ID", "Display Name", "Category", "Primary Link"]
+
+
+def issue_body(name, link):
+    return (
+        f"### Display Name\n\n{name}\n\n"
+        "### Category\n\nTooling\n\n"
+        f"### Primary Link\n\n{link}\n\n"
+        "### Author Name\n\nsubmitter\n\n"
+        "### Author Link\n\nhttps://github.com/submitter\n\n"
+        "### License\n\nMIT\n\n"
+        "### Description\n\nA tool submitted through the issue form.\n"
+    )
+
+
+def write_table(path):
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDNAMES)
+        writer.writeheader()
+        writer.writerow(
+            {
+                "ID": "tool-1",
+                "Display Name": "Existing Tool",
+                "Category": "Tooling",
+                "Primary Link": "https://github.com/owner/existing/blob/main/README.md",
+            }
+        )
+
+
+def test_batch_validates_issues_concurrently_in_input_order(tmp_path, monkeypatch, capsys):
+    table = tmp_path / "table.csv"
+    write_table(table)
+    in_flight = []
+    peak = []
+    lock = threading.Lock()
+
+    def fake_validate_single_resource(*, primary_link, session=None, **fields):
+        with lock:
+            in_flight.append(primary_link)
+            peak.append(len(in_flight))
+        print(f"Validating primary URL: {primary_link}")
+        time.sleep(0.05)
+        with lock:
+            in_flight.remove(primary_link)
+        if "broken" in primary_link:
+            return False, {}, ["Primary URL validation failed: HTTP 404"]
+        return True, {"license": "Apache-2.0"}, []
+
+    monkeypatch.setattr(parse_issue_form, "validate_single_resource", fake_validate_single_resource)
+    lines = [
+        json.dumps({"number": 7, "body": issue_body("New Tool", "https://github.com/owner/new-tool")}),
+        "",
+        json.dumps(
+            {"number": 8, "body": issue_body("existing tool", "https://github.com/Owner/existing/blob/main/README.md")}
+        ),
+        "not json",
+        json.dumps(issue_body("Broken Tool", "https://github.com/owner/broken")),
+    ]
+    monkeypatch.setattr(sys, "stdin", io.StringIO("\n".join(lines) + "\n"))
+    monkeypatch.setattr(sys, "argv", ["parse_issue_form.py", "--validate", "--batch", "--csv", str(table)])
+
+    assert parse_issue_form.main() == 0
+    out, err = capsys.readouterr()
+    results = [json.loads(line) for line in out.splitlines()]
+
+    assert [result["issue"] for result in results] == [7, 8, 4, 5]
+    assert results[0]["valid"] and results[0]["data"]["license"] == "Apache-2.0"
+    assert any("primary link already exists: Existing Tool" in warning for warning in results[1]["warnings"])
+    assert not results[2]["valid"] and results[2]["errors"][0].startswith("Invalid JSON on line 4")
+    assert not results[3]["valid"] and results[3]["errors"] == ["Primary URL validation failed: HTTP 404"]
+    assert max(peak) > 1
+    assert "Validating primary URL" in err and "Processed 4 issues (2 valid)" in err
+
+
+def test_batch_dir_parses_one_issue_per_file(tmp_path, monkeypatch, capsys):
+    issues = tmp_path / "issues"
+    issues.mkdir()
+    (issues / "12.md").write_text(issue_body("Tool Twelve", "https://example.com/twelve"), encoding="utf-8")
+    (issues / "3.md").write_text("", encoding="utf-8")
+    monkeypatch.setattr(sys, "argv", ["parse_issue_form.py", "--batch-dir", str(issues)])
+
+    assert parse_issue_form.main() == 0
+    results = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+
+    assert results[0] == {
+        "issue": "12.md",
+        "data": parse_issue_form.parse_only(issue_body("Tool Twelve", "https://example.com/twelve")),
+    }
+    assert results[1]["issue"] == "3.md" and results[1]["errors"] == ["No issue body provided"]
+
+
+def test_duplicate_links_match_regardless_of_case(tmp_path):
+    """Like the original scan, a submitted link that differs only in case is still reported as a duplicate."""
+    table = tmp_path / "table.csv"
+    write_table(table)
+    warnings = parse_issue_form.check_for_duplicates(
+        {"primary_link": "https://github.com/owner/existing/blob/main/readme.md", "display_name": "Another Name"},
+        str(table),
+    )
+    assert warnings == ["A resource with this primary link already exists: Existing Tool"]
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""Tests for the GitHub-aware rate limiter in rate_limiter.py and its use by the badge notifier."""
+
+from types import SimpleNamespace
+
+from github import GithubException
+
+from scripts import badge_issue_notification
+from scripts.rate_limiter import SECONDARY_LIMIT_PAUSE, RateLimiter
+
+
+class FakeClock:
+    """Monotonic and wall clock that only advance when the limiter sleeps."""
+
+    def __init__(self, start=1_000_000.0):
+        self.now = start
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def make_limiter(clock):
+    return RateLimiter(clock=clock, wall_clock=clock, sleep=clock.sleep)
+
+
+def test_unknown_budget_does_not_wait():
+    """Before GitHub reports a budget, requests are not held back."""
+    clock = FakeClock()
+    limiter = make_limiter(clock)
+    for _ in range(100):
+        limiter.acquire()
+    assert clock.now == 1_000_000.0
+    assert limiter.stats["waits"] == 0
+
+
+def test_budget_above_reserve_runs_at_full_speed():
+    """With plenty of budget left, requests go out back to back."""
+    clock = FakeClock()
+    limiter = make_limiter(clock)
+    limiter.update(
+        {"X-RateLimit-Remaining": "4000", "X-RateLimit-Limit": "5000", "X-RateLimit-Reset": str(int(clock.now) + 3600)}
+    )
+    for _ in range(500):
+        limiter.acquire()
+    assert limiter.stats["waits"] == 0
+
+
+def test_low_budget_is_spread_over_reset_window():
+    """Below the reserve, the remaining requests are spaced until the reset."""
+    clock = FakeClock()
+    limiter = make_limiter(clock)
+    reset = int(clock.now) + 1000
+    # 100 left of 5000 with 1000s to go: one request every 10s
+    limiter.update({"x-ratelimit-remaining": "100", "x-ratelimit-limit": "5000", "x-ratelimit-reset": str(reset)})
+    start = clock.now
+    for _ in range(11):
+        limiter.acquire()
+    assert 90 <= clock.now - start <= 110
+    assert clock.now < reset
+
+
+def test_retry_after_pauses_then_resumes():
+    """A Retry-After on a 429/403 holds every caller back for that long."""
+    clock = FakeClock()
+    limiter = make_limiter(clock)
+    limiter.update({"Retry-After": "30"}, status_code=429)
+    start = clock.now
+    limiter.acquire()
+    assert clock.now - start >= 30
+    assert limiter.stats["pauses"] == 1
+
+
+def test_exhausted_budget_waits_for_reset_without_deadlock():
+    """At zero remaining the limiter waits for the reset and then lets requests through."""
+    clock = FakeClock()
+    limiter = make_limiter(clock)
+    reset = int(clock.now) + 20
+    limiter.update({"X-RateLimit-Remaining": "0", "X-RateLimit-Limit": "60", "X-RateLimit-Reset": str(reset)}, 403)
+    limiter.acquire()
+    limiter.acquire()
+    assert reset <= clock.now <= reset + 10
+
+
+def test_callers_waiting_for_a_reset_are_paced_after_it():
+    """Callers held back by an exhausted budget resume one by one, then at full speed once a new budget is known."""
+    clock = FakeClock()
+    limiter = make_limiter(clock)
+    reset = int(clock.now) + 20
+    limiter.update({"X-RateLimit-Remaining": "0", "X-RateLimit-Limit": "60", "X-RateLimit-Reset": str(reset)}, 403)
+
+    times = []
+    for _ in range(10):
+        limiter.acquire()
+        times.append(clock.now)
+    # 60 requests per 20s window: after the first, one every third of a second
+    assert times[0] >= reset
+    assert all(later - earlier >= 0.3 for earlier, later in zip(times, times[1:], strict=False))
+
+    limiter.update(
+        {"X-RateLimit-Remaining": "59", "X-RateLimit-Limit": "60", "X-RateLimit-Reset": str(int(clock.now) + 3600)}
+    )
+    start = clock.now
+    for _ in range(20):
+        limiter.acquire()
+    assert clock.now == start
+
+
+class FakeIssues:
+    """Paginated issue listing that counts the pages fetched."""
+
+    def __init__(self, pages, fetched):
+        self.pages = pages
+        self.fetched = fetched
+
+    def get_page(self, page):
+        self.fetched.append(page)
+        return self.pages[page] if page < len(self.pages) else []
+
+
+class FakeRepo:
+    full_name = "o/r"
+
+    def __init__(self, pages, fetched, error):
+        self.issues = FakeIssues(pages, fetched)
+        self.error = error
+
+    def get_issues(self, **kwargs):
+        return self.issues
+
+    def create_label(self, *args):
+        raise self.error
+
+    def create_issue(self, **kwargs):
+        raise self.error
+
+
+class FakeGithub:
+    def __init__(self, repo, recorded):
+        self.repo = repo
+        self.recorded = recorded
+
+    @property
+    def rate_limiting(self):
+        self.recorded.append(1)
+        return 4000, 5000
+
+    rate_limiting_resettime = 1_003_600
+
+    def get_repo(self, name):
+        return self.repo
+
+    def get_user(self):
+        return SimpleNamespace(login="bot")
+
+
+def test_badge_notifier_paces_every_page_and_backs_off_secondary_limits(tmp_path, monkeypatch):
+    """Each issue page and API call goes through the limiter; a secondary limit without Retry-After pauses a minute."""
+    monkeypatch.chdir(tmp_path)
+    clock = FakeClock()
+    limiter = make_limiter(clock)
+    notifier = badge_issue_notification.BadgeNotification("token")
+    notifier.rate_limiter = limiter
+
+    fetched = []
+    recorded = []
+    issue = SimpleNamespace(title="Unrelated")
+    pages = [[issue] * badge_issue_notification.ISSUES_PER_PAGE] * 2 + [[issue]]
+    error = GithubException(403, {"message": "You have exceeded a secondary rate limit."}, {})
+    notifier.github = FakeGithub(FakeRepo(pages, fetched, error), recorded)
+
+    result = notifier.notify_repository("https://github.com/o/r", "Tool", "A tool", "o/r")
+
+    assert fetched == [0, 1, 2]
+    # get_repo, get_user, three issue pages, create_label, create_issue
+    assert limiter.stats["acquired"] == 7 and len(recorded) == 7
+    assert not result["success"]
+    start = clock.now
+    limiter.acquire()
+    assert clock.now - start >= SECONDARY_LIMIT_PAUSE
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""Tests for the SQLite resource store in resource_store.py."""
+
+import shutil
+import threading
+
+from scripts import validate_links
+from scripts.resource_store import ResourceStore
+from scripts.resource_table import ResourceTable
+
+
+def test_round_trip_is_byte_identical_and_hand_edits_are_reimported(tmp_path):
+    csv_path = tmp_path / "table.csv"
+    shutil.copy("THE_RESOURCES_TABLE.csv", csv_path)
+    original = csv_path.read_bytes()
+
+    with ResourceStore(str(tmp_path / "resources.sqlite")) as store:
+        assert store.sync(str(csv_path)) is True
+        assert store.sync(str(csv_path)) is False
+        assert len(store) == len(ResourceTable.from_csv(csv_path))
+        store.export_csv(str(tmp_path / "export.csv"))
+        assert (tmp_path / "export.csv").read_bytes() == original
+
+        table = ResourceTable.from_csv(csv_path)
+        table.set(0, "Description", "Edited by hand, with a comma")
+        table.write_csv(csv_path)
+        assert store.sync(str(csv_path)) is True
+        assert store.get(table.get(0, "ID"))["Description"] == "Edited by hand, with a comma"
+
+
+def test_concurrent_writers_keep_each_others_rows(tmp_path):
+    """Writers in parallel threads each update their own rows and export; no update is lost."""
+    csv_path = tmp_path / "table.csv"
+    shutil.copy("THE_RESOURCES_TABLE.csv", csv_path)
+    db_path = str(tmp_path / "resources.sqlite")
+    with ResourceStore(db_path) as store:
+        store.import_csv(str(csv_path))
+    ids = ResourceTable.from_csv(csv_path).column("ID")[:40]
+
+    def writer(mine):
+        with ResourceStore(db_path) as store:
+            for resource_id in mine:
+                assert store.update(resource_id, {"Last Checked": f"checked {resource_id}"}, export_path=str(csv_path))
+
+    threads = [threading.Thread(target=writer, args=(ids[i::4],)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    table = ResourceTable.from_csv(csv_path)
+    assert all(table.get(table.find_id(resource_id), "Last Checked") == f"checked {resource_id}" for resource_id in ids)
+
+
+def test_validation_writes_only_changed_cells(tmp_path, monkeypatch):
+    """A validation run from a stale load does not undo another job's committed edit."""
+    csv_path = tmp_path / "table.csv"
+    shutil.copy("THE_RESOURCES_TABLE.csv", csv_path)
+    monkeypatch.setenv("AWESOME_CC_RESOURCE_DB", str(tmp_path / "resources.sqlite"))
+    monkeypatch.setattr(validate_links, "OUTPUT_FILE", str(csv_path))
+
+    stale = ResourceTable.from_csv(csv_path)
+    first, second = stale.column("ID")[:2]
+    with ResourceStore(str(tmp_path / "resources.sqlite")) as store:
+        store.sync(str(csv_path))
+        store.update(first, {"License": "Other job"}, export_path=str(csv_path))
+
+    rows = stale.rows()
+    rows[1]["Active"] = "FALSE"
+    validate_links.write_validated_rows(stale, rows)
+
+    table = ResourceTable.from_csv(csv_path)
+    assert table.get(table.find_id(first), "License") == "Other job"
+    assert table.get(table.find_id(second), "Active") == "FALSE"
+    assert len(table) == len(stale)
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Tests for the column-oriented ResourceTable in resource_table.py."""
+
+import csv
+import io
+
+from scripts.resource_table import ResourceTable, load_resource_table
+
+FIELDNAMES = ["ID", "Display Name", "Category", "Sub-Category", "Primary Link", "Date Added"]
+ROWS = [
+    ["a1", "Alpha", "Tooling", "", "https://github.com/Owner/Repo", ""],
+    ["b2", "Beta, with comma", "Hooks", "", "https://github.com/owner/repo/blob/main/hook.py", "2025-01-01"],
+    ["c3", "alpha", "Tooling", "IDE Integrations ", "https://example.com/page/", 'quoted "date"'],
+]
+
+
+def write_dictwriter(path):
+    """The table as the scripts used to write it, through csv.DictWriter."""
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDNAMES)
+        writer.writeheader()
+        writer.writerows(dict(zip(FIELDNAMES, row, strict=True)) for row in ROWS)
+
+
+def test_indexes_and_lookups(tmp_path):
+    path = tmp_path / "table.csv"
+    write_dictwriter(path)
+    table = ResourceTable.from_csv(path)
+
+    assert len(table) == 3
+    assert table.row(1) == dict(zip(FIELDNAMES, ROWS[1], strict=True))
+    assert table.find_id("c3") == 2 and table.find_id("zz") is None
+    assert table.find_url("https://github.com/owner/repo/") == [0]
+    assert table.find_url("https://example.com/PAGE") == []
+    assert table.find_url("https://example.com/PAGE", ignore_case=True) == [2]
+    assert table.find_repo("OWNER", "repo") == [0, 1]
+    assert table.find_category("Tooling") == [0]
+    assert table.find_category("Tooling", "IDE Integrations") == [2]
+    assert table.find_name("ALPHA") == [0, 2]
+
+    table.set(0, "ID", "a9")
+    table.set(2, "Display Name", "Gamma")
+    assert table.find_id("a1") is None and table.find_id("a9") == 0
+    assert table.find_name("alpha") == [0]
+    assert table.find_repo("owner", "repo") == [0, 1]
+
+
+def test_build_indexes_up_front(tmp_path):
+    path = tmp_path / "table.csv"
+    write_dictwriter(path)
+    table = ResourceTable.from_csv(path)
+
+    table.build_indexes(("url_nocase", "name"))
+    assert sorted(table._indexes) == ["name", "url_nocase"]
+    table.build_indexes()
+    assert sorted(table._indexes) == ["category", "id", "name", "repo", "url", "url_nocase"]
+    assert table.find_url("https://EXAMPLE.com/page", ignore_case=True) == [2]
+
+
+def test_write_csv_matches_dictwriter_bytes(tmp_path):
+    """Loading and writing back reproduces the DictWriter file byte for byte, also after sorting and appending."""
+    path = tmp_path / "table.csv"
+    write_dictwriter(path)
+    original = path.read_bytes()
+
+    table = ResourceTable.from_csv(path)
+    table.write_csv(path)
+    assert path.read_bytes() == original
+
+    table.sort(key=lambda row: row["Display Name"].lower())
+    assert table.column("ID") == ["a1", "c3", "b2"]
+    table.append({"ID": "d4", "Display Name": "Delta"})
+    assert table.find_id("d4") == 3 and table.get(3, "Category") == ""
+
+    expected = io.StringIO(newline="")
+    writer = csv.DictWriter(expected, fieldnames=FIELDNAMES)
+    writer.writeheader()
+    writer.writerows(table.rows())
+    table.write_csv(path)
+    assert path.read_bytes() == expected.getvalue().encode("utf-8")
+    assert ResourceTable.from_text(expected.getvalue()).rows() == table.rows()
+
+
+def test_shared_table_reloads_when_the_file_changes(tmp_path):
+    path = tmp_path / "table.csv"
+    write_dictwriter(path)
+    first = load_resource_table(path)
+    assert load_resource_table(path) is first
+
+    table = ResourceTable.from_csv(path)
+    table.append({"ID": "d4", "Display Name": "Delta"})
+    table.write_csv(path)
+    assert len(load_resource_table(path)) == 4
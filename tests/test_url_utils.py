@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""Tests for URL canonicalization in url_utils.py."""
+
+from scripts.url_utils import canonicalize_url, github_repo_key
+
+
+def test_canonicalize_github_variants():
+    """Trailing slashes, .git suffixes and case differences collapse to one form; tree and blob stay apart."""
+    variants = [
+        "https://github.com/Owner/Repo",
+        "https://github.com/owner/repo/",
+        "https://GitHub.com/owner/repo.git",
+        " https://www.github.com/owner/repo#readme ",
+    ]
+    assert {canonicalize_url(url) for url in variants} == {"https://github.com/owner/repo"}
+
+    assert canonicalize_url("https://github.com/o/r/tree/main/.claude/commands/") == (
+        "https://github.com/o/r/tree/main/.claude/commands"
+    )
+    assert canonicalize_url("https://github.com/o/r/tree/main/docs") != canonicalize_url(
+        "https://github.com/o/r/blob/main/docs"
+    )
+
+
+def test_canonicalize_keeps_path_case_and_query():
+    """Only the parts GitHub treats case-insensitively are lowercased."""
+    assert canonicalize_url("https://github.com/O/R/blob/Main/Docs/README.md") == (
+        "https://github.com/o/r/blob/Main/Docs/README.md"
+    )
+    assert canonicalize_url("https://Example.com/Path/?q=1") == "https://example.com/Path?q=1"
+
+
+def test_github_repo_key():
+    assert github_repo_key("https://github.com/Owner/Repo.git/") == ("owner", "repo")
+    assert github_repo_key("https://github.com/o/r/blob/main/CLAUDE.md") == ("o", "r")
+    assert github_repo_key("https://github.com/o") is None
+    assert github_repo_key("https://gist.github.com/o/123") is None
@@ -0,0 +1,383 @@
+#!/usr/bin/env python3
+"""Tests for the concurrent link validation engine in validate_links.py."""
+
+import csv
+import threading
+import time
+from datetime import datetime
+
+from scripts import validate_links
+from scripts.checkpoint import CheckpointJournal
+from scripts.http_client import PooledSession
+
+FIELDNAMES = [
+    "ID",
+    "Display Name",
+    "Category",
+    "Sub-Category",
+    "Primary Link",
+    "Secondary Link",
+    "Author Name",
+    "Author Link",
+    "Active",
+    "Date Added",
+    "Last Modified",
+    "Last Checked",
+    "License",
+    "Description",
+]
+
+
+def write_table(path, rows):
+    """Write a minimal resource table with the canonical header."""
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDNAMES)
+        writer.writeheader()
+        for row in rows:
+            writer.writerow({name: row.get(name, "") for name in FIELDNAMES})
+
+
+def make_rows(count):
+    """Build `count` synthetic resource rows."""
+    return [
+        {
+            "ID": f"tool-{i:08x}",
+            "Display Name": f"Resource {i}",
+            "Category": "Tooling",
+            "Primary Link": f"https://example.com/resource-{i}",
+            "Active": "TRUE",
+            "License": "NOT_FOUND",
+        }
+        for i in range(count)
+    ]
+
+
+def test_validate_urls_concurrently_preserves_order(monkeypatch):
+    """Results come back in input order even when later URLs finish first."""
+
+    def fake_validate_url(url, **kwargs):
+        index = int(url.rsplit("-", 1)[1])
+        time.sleep(0.01 * (10 - index))
+        return True, 200, None, str(index)
+
+    monkeypatch.setattr(validate_links, "validate_url", fake_validate_url)
+    urls = [f"https://example.com/resource-{i}" for i in range(10)]
+
+    results = validate_links.validate_urls_concurrently(urls, concurrency=10)
+
+    assert [result[3] for result in results] == [str(i) for i in range(10)]
+
+
+def test_validate_links_respects_concurrency_limit(monkeypatch, tmp_path):
+    """No more than `concurrency` validations are in flight at once."""
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+
+    def fake_validate_url(url, **kwargs):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.05)
+        with lock:
+            in_flight -= 1
+        return not url.endswith("-3"), 200, None, None
+
+    monkeypatch.setattr(validate_links, "validate_url", fake_validate_url)
+    monkeypatch.chdir(tmp_path)
+    write_table(tmp_path / validate_links.INPUT_FILE, make_rows(12))
+
+    start = time.monotonic()
+    results = validate_links.validate_links(validate_links.INPUT_FILE, concurrency=4)
+    elapsed = time.monotonic() - start
+
+    assert peak == 4
+    assert elapsed < 12 * 0.05
+    assert results["processed"] == 12
+    assert results["broken"] == 1
+    assert results["broken_links"][0]["name"] == "Resource 3"
+
+    with open(tmp_path / validate_links.OUTPUT_FILE, encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert [row["Display Name"] for row in rows] == [f"Resource {i}" for i in range(12)]
+    assert [row["Active"] for row in rows].count("FALSE") == 1
+
+
+def test_validate_links_max_links(monkeypatch, tmp_path):
+    """max_links limits the number of validated rows but keeps every row in the CSV."""
+    monkeypatch.setattr(validate_links, "validate_url", lambda url, **kwargs: (True, 200, None, None))
+    monkeypatch.chdir(tmp_path)
+    write_table(tmp_path / validate_links.INPUT_FILE, make_rows(5))
+
+    results = validate_links.validate_links(validate_links.INPUT_FILE, max_links=2)
+
+    assert results["processed"] == 2
+    with open(tmp_path / validate_links.OUTPUT_FILE, encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == 5
+    assert sum(1 for row in rows if row["Last Checked"]) == 2
+
+
+def test_validate_url_uses_prefetched_metadata():
+    """A GitHub URL found by the GraphQL pre-pass is validated without any request."""
+
+    class NoNetworkSession:
+        def get(self, *args, **kwargs):
+            raise AssertionError("unexpected request")
+
+        head = get
+
+    metadata = {"exists": True, "license": "MIT", "last_modified": "2025-07-01:12-30-00"}
+    result = validate_links.validate_url("https://github.com/a/b", session=NoNetworkSession(), metadata=metadata)
+
+    assert result == (True, 200, "MIT", "2025-07-01:12-30-00")
+
+
+def test_repo_facts_share_one_license_fetch_between_concurrent_callers(monkeypatch):
+    """Callers asking for the same repository while its license is being fetched wait for that fetch."""
+    fetches = []
+
+    def fake_get_github_license(owner, repo, session=None):
+        fetches.append((owner, repo))
+        time.sleep(0.05)
+        return "MIT"
+
+    monkeypatch.setattr(validate_links, "get_github_license", fake_get_github_license)
+    facts = validate_links.RepoFacts()
+    threads = [threading.Thread(target=facts.license, args=("Owner" if i % 2 else "owner", "repo")) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(fetches) == 1 and facts.hits == 7
+    assert facts.license("OWNER", "Repo") == "MIT" and len(fetches) == 1
+
+
+def test_select_stale_rows_orders_oldest_first():
+    """Stale, never-checked and inactive rows are selected, oldest first; fresh active rows are not."""
+    now = datetime(2025, 8, 1, 12, 0, 0)
+    rows = [
+        {"Last Checked": "2025-08-01:11-00-00", "Active": "TRUE"},  # fresh
+        {"Last Checked": "2025-07-20:00-00-00", "Active": "TRUE"},  # stale
+        {"Last Checked": "", "Active": "TRUE"},  # never checked
+        {"Last Checked": "2025-08-01:10-00-00", "Active": "FALSE"},  # fresh but inactive
+        {"Last Checked": "2025-07-01:00-00-00", "Active": "TRUE"},  # oldest
+    ]
+    pending = [(i, row, set()) for i, row in enumerate(rows)]
+
+    selected = validate_links.select_stale_rows(pending, max_age_hours=24, now=now)
+
+    assert [index for index, _, _ in selected] == [2, 4, 1, 3]
+
+
+def test_incremental_run_respects_request_budget(monkeypatch, tmp_path):
+    """Once the request budget is spent, remaining rows are deferred and left untouched."""
+    session = PooledSession()
+
+    def fake_validate_url(url, session=None, **kwargs):
+        session.stats.record_request()
+        return True, 200, None, None
+
+    monkeypatch.setattr(validate_links, "validate_url", fake_validate_url)
+    monkeypatch.chdir(tmp_path)
+    rows = make_rows(6)
+    for i, row in enumerate(rows):
+        row["Last Checked"] = f"2025-01-0{i + 1}:00-00-00"
+    rows[0]["Last Checked"] = datetime.now().strftime(validate_links.LAST_CHECKED_FORMAT)
+    write_table(tmp_path / validate_links.INPUT_FILE, rows)
+
+    results = validate_links.validate_links(
+        validate_links.INPUT_FILE,
+        concurrency=1,
+        session=session,
+        use_graphql=False,
+        incremental=True,
+        request_budget=3,
+    )
+
+    assert results["fresh_skipped"] == 1
+    assert results["processed"] == 3
+    assert results["deferred"] == 2
+    with open(tmp_path / validate_links.OUTPUT_FILE, encoding="utf-8") as f:
+        written = list(csv.DictReader(f))
+    # Oldest rows (2, 3, 4) were checked; the two most recent stale rows were deferred
+    assert [row["Last Checked"] for row in written[4:]] == ["2025-01-05:00-00-00", "2025-01-06:00-00-00"]
+
+
+def test_duplicate_urls_are_validated_once(monkeypatch, tmp_path):
+    """Rows whose URLs canonicalize to the same form share one validation."""
+    calls = []
+
+    def fake_validate_url(url, **kwargs):
+        calls.append(url)
+        return True, 200, "MIT", None
+
+    monkeypatch.setattr(validate_links, "validate_url", fake_validate_url)
+    monkeypatch.chdir(tmp_path)
+    rows = make_rows(4)
+    rows[0]["Primary Link"] = "https://github.com/owner/repo"
+    rows[1]["Primary Link"] = "https://github.com/Owner/repo/"
+    rows[2]["Primary Link"] = "https://github.com/OWNER/Repo"
+    write_table(tmp_path / validate_links.INPUT_FILE, rows)
+
+    results = validate_links.validate_links(validate_links.INPUT_FILE, use_graphql=False)
+
+    assert calls == ["https://github.com/owner/repo", "https://example.com/resource-3"]
+    assert results["dedup"]["unique_urls"] == 2
+    assert results["dedup"]["requests_saved"] == 6
+    with open(tmp_path / validate_links.OUTPUT_FILE, encoding="utf-8") as f:
+        assert [row["License"] for row in csv.DictReader(f)] == ["MIT"] * 4
+
+
+def test_tree_and_blob_rows_of_one_repo_are_validated_separately(monkeypatch, tmp_path):
+    """A tree URL (plain HTTP check) must not hand its result to a blob URL (GitHub API check) of the same repo."""
+    calls = []
+
+    def fake_validate_url(url, **kwargs):
+        calls.append(url)
+        if validate_links.parse_github_url(url)[1]:
+            return True, 200, "MIT", "2025-01-02:03-04-05"
+        return True, 200, None, None
+
+    monkeypatch.setattr(validate_links, "validate_url", fake_validate_url)
+    monkeypatch.chdir(tmp_path)
+    rows = make_rows(3)
+    rows[0]["Primary Link"] = "https://github.com/owner/repo/tree/main/docs"
+    rows[1]["Primary Link"] = "https://github.com/owner/repo/blob/main/docs"
+    rows[2]["Primary Link"] = "https://www.github.com/owner/repo/blob/main/docs"
+    write_table(tmp_path / validate_links.INPUT_FILE, rows)
+
+    results = validate_links.validate_links(validate_links.INPUT_FILE, use_graphql=False)
+
+    assert calls == [rows[0]["Primary Link"], rows[1]["Primary Link"], rows[2]["Primary Link"]]
+    assert results["dedup"]["unique_urls"] == 3
+    with open(tmp_path / validate_links.OUTPUT_FILE, encoding="utf-8") as f:
+        written = list(csv.DictReader(f))
+    assert [row["License"] for row in written] == ["NOT_FOUND", "MIT", "NOT_FOUND"]
+    assert written[1]["Last Modified"] == "2025-01-02:03-04-05"
+
+
+def test_git_suffixed_urls_are_validated_separately(monkeypatch, tmp_path):
+    """ "repo.git/tree/..." is requested as written, so its outcome is not shared with the URL without ".git"."""
+    calls = []
+
+    def fake_validate_url(url, **kwargs):
+        calls.append(url)
+        return (".git" not in url), (404 if ".git" in url else 200), None, None
+
+    monkeypatch.setattr(validate_links, "validate_url", fake_validate_url)
+    monkeypatch.chdir(tmp_path)
+    rows = make_rows(4)
+    rows[0]["Primary Link"] = "https://github.com/owner/repo/tree/main/docs"
+    rows[1]["Primary Link"] = "https://github.com/owner/repo.git/tree/main/docs"
+    rows[2]["Primary Link"] = "https://github.com/Owner/Repo/tree/main/docs/"
+    rows[3]["Primary Link"] = "https://github.com/owner/repo.git"
+    write_table(tmp_path / validate_links.INPUT_FILE, rows)
+
+    results = validate_links.validate_links(validate_links.INPUT_FILE, use_graphql=False)
+
+    assert calls == [rows[0]["Primary Link"], rows[1]["Primary Link"], rows[3]["Primary Link"]]
+    assert results["dedup"]["unique_urls"] == 3
+    with open(tmp_path / validate_links.OUTPUT_FILE, encoding="utf-8") as f:
+        written = list(csv.DictReader(f))
+    assert [row["Active"] for row in written] == ["TRUE", "FALSE", "TRUE", "FALSE"]
+
+
+def test_resume_reuses_journaled_outcomes(monkeypatch, tmp_path):
+    """An interrupted run's journal is picked up by --resume and removed once the run completes."""
+    calls = []
+
+    def fake_validate_url(url, **kwargs):
+        calls.append(url)
+        return True, 200, None, None
+
+    monkeypatch.setattr(validate_links, "validate_url", fake_validate_url)
+    monkeypatch.chdir(tmp_path)
+    write_table(tmp_path / validate_links.INPUT_FILE, make_rows(3))
+    journal = tmp_path / "checkpoint.jsonl"
+    journal.write_text(
+        '{"key": "https://example.com/resource-1", "result": [false, 404, null, null], '
+        '"checked_at": "2025-01-02:03-04-05"}\n{"key": "https://example.com/resou',
+        encoding="utf-8",
+    )
+
+    results = validate_links.validate_links(
+        validate_links.INPUT_FILE, use_graphql=False, checkpoint_path=str(journal), resume=True
+    )
+
+    assert calls == ["https://example.com/resource-0", "https://example.com/resource-2"]
+    assert results["broken"] == 1
+    assert not journal.exists()
+    with open(tmp_path / validate_links.OUTPUT_FILE, encoding="utf-8") as f:
+        row = list(csv.DictReader(f))[1]
+    assert row["Active"] == "FALSE"
+    assert row["Last Checked"] == "2025-01-02:03-04-05"
+
+
+def test_resumed_journal_drops_a_truncated_last_line(tmp_path):
+    """Entries appended after a crash mid-line start on their own line and survive a second resume."""
+    path = tmp_path / "checkpoint.jsonl"
+    path.write_text('{"key": "a", "n": 1}\n{"key": "b", "n', encoding="utf-8")
+
+    journal = CheckpointJournal(str(path), resume=True)
+    journal.record("c", n=3)
+    journal.close()
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"key": "d"')
+
+    journal = CheckpointJournal(str(path), resume=True)
+    assert sorted(journal.completed) == ["a", "c"]
+    journal.record("e", n=5)
+    journal.close()
+
+    journal = CheckpointJournal(str(path), resume=True)
+    journal.close()
+    assert sorted(journal.completed) == ["a", "c", "e"]
+    assert path.read_text(encoding="utf-8").splitlines()[1:] == ['{"key": "c", "n": 3}', '{"key": "e", "n": 5}']
+
+
+class FrozenDatetime(datetime):
+    """datetime whose now() never moves, so separate runs stamp identical Last Checked values."""
+
+    @classmethod
+    def now(cls, tz=None):
+        return cls(2025, 6, 1, 12, 0, 0)
+
+
+def test_sharded_runs_merge_to_single_job_output(monkeypatch, tmp_path):
+    """Validating in shards and merging gives the same table and broken links as one job."""
+
+    def fake_validate_url(url, **kwargs):
+        number = int(url.rsplit("-", 1)[1])
+        return (False, 404, None, None) if number % 3 == 0 else (True, 200, "MIT", None)
+
+    monkeypatch.setattr(validate_links, "validate_url", fake_validate_url)
+    monkeypatch.setattr(validate_links, "datetime", FrozenDatetime)
+    monkeypatch.chdir(tmp_path)
+    table = tmp_path / validate_links.INPUT_FILE
+
+    write_table(table, make_rows(20))
+    single = validate_links.validate_links(validate_links.INPUT_FILE, use_graphql=False)
+    single_table = table.read_bytes()
+
+    write_table(table, make_rows(20))
+    for index in range(1, 4):
+        validate_links.validate_links(
+            validate_links.INPUT_FILE, use_graphql=False, shard=(index, 3), shard_dir=str(tmp_path / "shards")
+        )
+    assert table.read_bytes() != single_table
+    merged = validate_links.merge_shards(validate_links.INPUT_FILE, str(tmp_path / "shards"))
+
+    assert table.read_bytes() == single_table
+    for key in ("total", "processed", "broken", "newly_broken", "broken_links", "newly_broken_links", "timestamp"):
+        assert merged[key] == single[key]
+    assert merged["dedup"]["rows"] == 20
+
+
+def test_shard_assignment_is_stable():
+    assert validate_links.parse_shard("2/4") == (2, 4)
+    assigned = [validate_links.shard_of(f"tool-{i:08x}", 4) for i in range(200)]
+    assert set(assigned) == {1, 2, 3, 4}
+    assert assigned == [validate_links.shard_of(f"tool-{i:08x}", 4) for i in range(200)]